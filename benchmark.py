@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai de la chaîne de documentation.
+
+Génère des arborescences synthétiques (pages Markdown, export WordPress et
+fichier tri.csv) de plusieurs tailles, puis mesure chaque étape :
+
+- scan : parcours du dossier docs (update_nav.walk_directory)
+- titres : extraction des titres (update_nav.extract_titles)
+- nav : construction de la navigation (update_nav.build_nav)
+- yaml : écriture de la section 'nav' de mkdocs.yml (update_nav.write_nav)
+- copie : tri de l'export WordPress (tri_wordpress.trier_contenu_wordpress)
+- rendu : 'mkdocs build' complet avec le thème mkdocs_dsfr
+- reconstruction : nouveau 'mkdocs build' après modification d'une page
+  (génération incrémentale, mkdocs_dsfr.build_cache)
+- recherche : index de recherche fragmenté (mkdocs_dsfr.search_index)
+
+Les résultats (durée et mémoire maximale par étape) sont écrits en JSON pour
+être comparés d'un commit à l'autre (--comparer). Un profil cProfile ou
+pyinstrument peut être enregistré pour chaque étape (--profil).
+"""
+
+import argparse
+import contextlib
+import cProfile
+import csv
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+from tri_wordpress import trier_contenu_wordpress
+from update_nav import DEFAULT_WORKERS, build_nav, extract_titles, walk_directory, write_nav
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = [1000, 10000, 50000]
+STAGES = ['scan', 'titres', 'nav', 'yaml', 'copie', 'rendu', 'reconstruction', 'recherche']
+
+REPO_DIR = Path(__file__).resolve().parent
+PUBLIC_DIR = REPO_DIR / 'public'
+
+# Structure des pages générées : PAGES_PAR_CHAPITRE pages par dossier,
+# CHAPITRES_PAR_SECTION dossiers par section
+PAGES_PAR_CHAPITRE = 25
+CHAPITRES_PAR_SECTION = 20
+# Un article WordPress pour ARTICLES_PAR_PAGES pages générées
+ARTICLES_PAR_PAGES = 10
+DESTINATIONS = 20
+
+MOTS = ("cloud", "réseau", "volume", "instance", "sécurité", "déploiement", "conteneur",
+        "souscripteur", "projet", "console", "gabarit", "snapshot", "routeur", "ministère")
+
+
+def _paragraphe(aleatoire, mots=40):
+    return ' '.join(aleatoire.choice(MOTS) for _ in range(mots)).capitalize() + '.'
+
+
+def generer_docs(docs_dir, nombre_pages, aleatoire):
+    """
+    Crée nombre_pages pages Markdown réparties en sections et chapitres.
+    Deux pages sur trois ont un titre dans le front matter, les autres un titre '# '.
+    """
+    docs_dir.mkdir(parents=True)
+    (docs_dir / 'index.md').write_text("# Accueil\n\nDocumentation de test.\n", encoding='utf-8')
+    for numero in range(nombre_pages):
+        section = numero // (PAGES_PAR_CHAPITRE * CHAPITRES_PAR_SECTION)
+        chapitre = (numero // PAGES_PAR_CHAPITRE) % CHAPITRES_PAR_SECTION
+        dossier = docs_dir / f"section-{section:03d}" / f"chapitre-{chapitre:02d}"
+        dossier.mkdir(parents=True, exist_ok=True)
+
+        titre = f"Page {numero} : {aleatoire.choice(MOTS)} et {aleatoire.choice(MOTS)}"
+        if numero % 3:
+            entete = f"---\ntitle: \"{titre}\"\ntags: [{aleatoire.choice(MOTS)}]\n---\n\n"
+        else:
+            entete = f"# {titre}\n\n"
+        corps = '\n\n'.join(f"## Partie {partie}\n\n{_paragraphe(aleatoire)}" for partie in range(3))
+        if numero % 7 == 0:
+            corps += "\n\n```bash\nopenstack server list\n```\n"
+        (dossier / f"page-{numero:06d}.md").write_text(entete + corps + '\n', encoding='utf-8')
+
+
+def generer_export_wordpress(export_dir, fichier_csv, destination_dir, nombre_articles, aleatoire):
+    """Crée nombre_articles dossiers d'articles (index.md et deux images) et le tri.csv correspondant."""
+    lignes = []
+    for numero in range(nombre_articles):
+        dossier = export_dir / 'content' / f"article-{numero:06d}"
+        (dossier / 'images').mkdir(parents=True)
+        titre = f"Article {numero} : {aleatoire.choice(MOTS)} ?"
+        (dossier / 'index.md').write_text(f"---\ntitle: \"{titre}\"\n---\n\n{_paragraphe(aleatoire, 200)}\n",
+                                          encoding='utf-8')
+        for image in range(2):
+            (dossier / 'images' / f"image-{image}.png").write_bytes(aleatoire.randbytes(4096))
+        lignes.append({
+            'Titre': titre,
+            'Chemin actuel': f"https://exemple.invalid/?p={numero}",
+            "Répertoire d'export": f"content/article-{numero:06d}",
+            'Destination ': str(destination_dir / f"rubrique-{numero % DESTINATIONS:02d}"),
+        })
+
+    with open(fichier_csv, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['Titre', 'Chemin actuel', "Répertoire d'export", 'Destination '])
+        writer.writeheader()
+        writer.writerows(lignes)
+
+
+def ecrire_config_mkdocs(chemin, docs_dir, site_dir):
+    """mkdocs.yml du site public, sans sa navigation, pointant vers les pages générées."""
+    from mkdocs.utils.yaml import yaml_load
+
+    with open(PUBLIC_DIR / 'mkdocs.yml', 'r', encoding='utf-8') as f:
+        config = yaml_load(f)
+    config.pop('nav', None)
+    config['docs_dir'] = str(docs_dir)
+    config['site_dir'] = str(site_dir)
+    config['theme']['custom_dir'] = str(PUBLIC_DIR / config['theme']['custom_dir'])
+    config['hooks'] = [str(PUBLIC_DIR / hook) for hook in config.get('hooks', [])]
+    with open(chemin, 'w', encoding='utf-8') as f:
+        yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+
+class Mesures:
+    """Chronométrage, mémoire maximale et profil optionnel de chaque étape."""
+
+    def __init__(self, memoire='rss', profil=None, profil_dir=None):
+        self.memoire = memoire
+        self.profil = profil
+        self.profil_dir = profil_dir
+        self.resultats = {}
+
+    def _profiler(self):
+        if self.profil == 'cprofile':
+            return cProfile.Profile()
+        if self.profil == 'pyinstrument':
+            from pyinstrument import Profiler
+            return Profiler()
+        return None
+
+    def _enregistrer_profil(self, profiler, prefixe, etape):
+        self.profil_dir.mkdir(parents=True, exist_ok=True)
+        if self.profil == 'cprofile':
+            profiler.dump_stats(self.profil_dir / f"{prefixe}-{etape}.prof")
+        else:
+            (self.profil_dir / f"{prefixe}-{etape}.html").write_text(profiler.output_html(), encoding='utf-8')
+
+    def mesurer(self, prefixe, etape, fonction, *args, **kwargs):
+        """Exécute fonction(*args, **kwargs) et enregistre sa durée et sa mémoire maximale."""
+        profiler = self._profiler()
+        if self.memoire == 'tracemalloc':
+            tracemalloc.start()
+        if profiler is not None:
+            profiler.enable() if self.profil == 'cprofile' else profiler.start()
+
+        debut = time.perf_counter()
+        try:
+            resultat = fonction(*args, **kwargs)
+        finally:
+            duree = time.perf_counter() - debut
+            if profiler is not None:
+                profiler.disable() if self.profil == 'cprofile' else profiler.stop()
+
+        mesure = {'secondes': round(duree, 4)}
+        if self.memoire == 'tracemalloc':
+            # Pic des allocations Python pendant l'étape
+            mesure['memoire_max_ko'] = tracemalloc.get_traced_memory()[1] // 1024
+            tracemalloc.stop()
+        else:
+            # Pic de mémoire résidente du processus depuis son lancement (Ko sous Linux)
+            mesure['memoire_max_ko'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if profiler is not None:
+            self._enregistrer_profil(profiler, prefixe, etape)
+
+        self.resultats[etape] = mesure
+        print(f"   ⏱️  {etape:<10} {duree:9.3f} s   {mesure['memoire_max_ko'] / 1024:8.1f} Mo")
+        return resultat
+
+
+def _trier(export_dir, fichier_csv, jobs):
+    # Le rapport ligne par ligne du tri n'a pas d'intérêt ici
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        trier_contenu_wordpress(str(export_dir), str(fichier_csv), jobs=jobs)
+
+
+def _construire_site(config_file):
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+
+    config = load_config(config_file=str(config_file))
+    config.plugins.on_startup(command='build', dirty=False)
+    try:
+        build(config)
+    finally:
+        config.plugins.on_shutdown()
+    return config
+
+
+def _indexer(config):
+    sys.path.insert(0, str(PUBLIC_DIR))
+    try:
+        from mkdocs_dsfr.search_index import build_search_index
+    finally:
+        sys.path.remove(str(PUBLIC_DIR))
+    build_search_index(config)
+
+
+def executer_taille(taille, racine, etapes, mesures, workers, jobs, graine):
+    """Génère les données d'une taille puis mesure les étapes demandées."""
+    aleatoire = random.Random(graine)
+    docs_dir = racine / 'docs'
+    export_dir = racine / 'wordpress-content-to-sort'
+    fichier_csv = racine / 'tri.csv'
+    config_file = racine / 'mkdocs.yml'
+
+    print(f"\n📦 {taille} pages : génération dans {racine}")
+    debut = time.perf_counter()
+    generer_docs(docs_dir, taille, aleatoire)
+    nombre_articles = max(1, taille // ARTICLES_PAR_PAGES)
+    generer_export_wordpress(export_dir, fichier_csv, racine / 'trie', nombre_articles, aleatoire)
+    ecrire_config_mkdocs(config_file, docs_dir, racine / 'site')
+    generation = round(time.perf_counter() - debut, 4)
+
+    prefixe = str(taille)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        # Les étapes de navigation dépendent les unes des autres
+        if {'scan', 'titres', 'nav', 'yaml'} & set(etapes):
+            arbre = mesures.mesurer(prefixe, 'scan', walk_directory, docs_dir, executor)
+            fichiers = list(arbre.iter_md_files())
+            titres = mesures.mesurer(prefixe, 'titres', extract_titles, fichiers, None, executor)
+            nav = mesures.mesurer(prefixe, 'nav', build_nav, arbre, docs_dir, titres)
+            if 'yaml' in etapes:
+                mesures.mesurer(prefixe, 'yaml', write_nav, config_file, nav)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if 'copie' in etapes:
+        mesures.mesurer(prefixe, 'copie', _trier, export_dir, fichier_csv, jobs)
+
+    if {'rendu', 'reconstruction', 'recherche'} & set(etapes):
+        config = mesures.mesurer(prefixe, 'rendu', _construire_site, config_file)
+        if 'reconstruction' in etapes:
+            page = next((docs_dir / 'section-000' / 'chapitre-00').glob('*.md'))
+            with open(page, 'a', encoding='utf-8') as f:
+                f.write("\nParagraphe ajouté avant la reconstruction.\n")
+            config = mesures.mesurer(prefixe, 'reconstruction', _construire_site, config_file)
+        if 'recherche' in etapes:
+            mesures.mesurer(prefixe, 'recherche', _indexer, config)
+
+    return {
+        'pages': taille,
+        'articles': nombre_articles,
+        'generation_secondes': generation,
+        'etapes': {etape: mesures.resultats[etape] for etape in STAGES if etape in mesures.resultats},
+    }
+
+
+def _commit_courant():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparer(ancien_fichier, nouveau_fichier):
+    """Affiche, pour chaque taille et chaque étape, les durées des deux fichiers de résultats."""
+    with open(ancien_fichier, 'r', encoding='utf-8') as f:
+        ancien = json.load(f)
+    with open(nouveau_fichier, 'r', encoding='utf-8') as f:
+        nouveau = json.load(f)
+
+    print(f"📊 {ancien.get('commit') or ancien_fichier} -> {nouveau.get('commit') or nouveau_fichier}")
+    for taille in sorted(set(ancien['resultats']) & set(nouveau['resultats']), key=int):
+        print(f"\n📦 {taille} pages")
+        avant = ancien['resultats'][taille]['etapes']
+        apres = nouveau['resultats'][taille]['etapes']
+        for etape in STAGES:
+            if etape not in avant or etape not in apres:
+                continue
+            t_avant = avant[etape]['secondes']
+            t_apres = apres[etape]['secondes']
+            ratio = t_apres / t_avant if t_avant else float('inf')
+            signe = '🟢' if ratio <= 0.95 else '🔴' if ratio >= 1.05 else '⚪'
+            print(f"   {signe} {etape:<10} {t_avant:9.3f} s -> {t_apres:9.3f} s   (x{ratio:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de la chaîne de documentation")
+    parser.add_argument("--tailles", type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"Nombres de pages générées (défaut: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--etapes", nargs='+', choices=STAGES, default=STAGES,
+                        help="Étapes mesurées (défaut: toutes)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads du parcours et de l'extraction des titres (défaut: {DEFAULT_WORKERS})")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="Copies parallèles de tri_wordpress (défaut: 4)")
+    parser.add_argument("--memoire", choices=['rss', 'tracemalloc'], default='rss',
+                        help="Mesure de la mémoire : pic de mémoire résidente du processus (rss, défaut) "
+                             "ou pic des allocations Python de chaque étape (tracemalloc, plus lent)")
+    parser.add_argument("--profil", choices=['cprofile', 'pyinstrument'],
+                        help="Enregistre un profil par étape")
+    parser.add_argument("--profil-dir", default="benchmark_results/profils",
+                        help="Répertoire des profils (défaut: benchmark_results/profils)")
+    parser.add_argument("--sortie", "-o",
+                        help="Fichier JSON des résultats (défaut: benchmark_results/<commit>-<date>.json)")
+    parser.add_argument("--repertoire",
+                        help="Répertoire de travail des données générées (défaut: répertoire temporaire)")
+    parser.add_argument("--garder", action="store_true",
+                        help="Conserve les données générées après les mesures")
+    parser.add_argument("--graine", type=int, default=42,
+                        help="Graine des données générées (défaut: 42)")
+    parser.add_argument("--comparer", nargs=2, metavar=('ANCIEN', 'NOUVEAU'),
+                        help="Compare deux fichiers de résultats au lieu de lancer les mesures")
+    args = parser.parse_args()
+
+    if args.comparer:
+        comparer(*args.comparer)
+        return
+    if args.workers < 1 or args.jobs < 1:
+        parser.error("--workers et --jobs doivent être supérieurs ou égaux à 1")
+
+    logging.getLogger('mkdocs').setLevel(logging.WARNING)
+    commit = _commit_courant()
+    date = datetime.now()
+    sortie = Path(args.sortie or f"benchmark_results/{commit or 'sans-commit'}-{date:%Y%m%d-%H%M%S}.json")
+
+    if args.repertoire:
+        # Répertoire fourni : seuls les sous-dossiers créés par ce lancement sont supprimés
+        base = Path(args.repertoire)
+        occupes = [str(base / str(taille)) for taille in dict.fromkeys(args.tailles)
+                   if (base / str(taille)).exists() and any((base / str(taille)).iterdir())]
+        if occupes:
+            parser.error(f"répertoire(s) déjà utilisé(s), à supprimer ou à changer : {', '.join(occupes)}")
+    else:
+        base = Path(tempfile.mkdtemp(prefix='benchmark-docs-'))
+    crees = []
+    resultats = {}
+    try:
+        for taille in args.tailles:
+            racine = base / str(taille)
+            if racine in crees:
+                # Taille demandée plusieurs fois : données de la mesure précédente
+                shutil.rmtree(racine)
+            else:
+                crees.append(racine)
+            mesures = Mesures(args.memoire, args.profil, Path(args.profil_dir))
+            resultats[str(taille)] = executer_taille(taille, racine, args.etapes, mesures,
+                                                     args.workers, args.jobs, args.graine)
+    finally:
+        if not args.garder:
+            if args.repertoire:
+                for racine in crees:
+                    shutil.rmtree(racine, ignore_errors=True)
+            else:
+                shutil.rmtree(base, ignore_errors=True)
+
+    sortie.parent.mkdir(parents=True, exist_ok=True)
+    with open(sortie, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'date': date.isoformat(timespec='seconds'),
+            'commit': commit,
+            'python': platform.python_version(),
+            'plateforme': platform.platform(),
+            'cpus': os.cpu_count(),
+            'options': {
+                'workers': args.workers,
+                'jobs': args.jobs,
+                'memoire': args.memoire,
+                'graine': args.graine,
+            },
+            'resultats': resultats,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Résultats écrits dans {sortie}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Génère en une seule exécution tous les sites MkDocs du dépôt (public/ et
+internal/, servis par nginx sous /public/ et /internal/).
+
+Au lieu de lancer update_nav.py puis 'mkdocs build' une fois par site :
+
+1. la navigation de chaque site est mise à jour dans ce processus, avec un
+   seul cache des titres (à la racine du dépôt) et un seul pool de threads :
+   les en-têtes Markdown ne sont lus qu'une fois par exécution, quel que soit
+   le nombre de sites ;
+2. les sites sont générés en parallèle, un processus par site (MkDocs et les
+   hooks du thème gardent l'état d'une génération dans des variables de
+   module). Chaque site profite de la génération incrémentale du thème
+   (mkdocs_dsfr/build_cache.py) ;
+3. les fichiers statiques identiques (thème DSFR, copies avec empreinte,
+   versions .gz/.br) sont remplacés par des liens physiques vers un seul
+   exemplaire, dans un même site et d'un site à l'autre ;
+4. avec --check-links, les liens de tous les sites sont vérifiés ensemble
+   (check_links.py), y compris les liens d'un site vers l'autre.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mkdocs.utils.yaml import yaml_load
+
+from run_events import EventLog
+from title_cache import DEFAULT_CACHE_NAME, TitleCache
+from update_nav import DEFAULT_WORKERS, update_mkdocs_nav
+
+# Dossier des fichiers statiques dédoublonnés, dans chaque site généré
+STATIC_DIR = 'static'
+
+
+def find_configs(script_dir: Path) -> List[Path]:
+    """mkdocs.yml des sites présents, aux emplacements cherchés par update_nav.py."""
+    candidates = [script_dir / "public" / "mkdocs.yml", script_dir / "mkdocs.yml",
+                  script_dir / "internal" / "mkdocs.yml"]
+    return [path for path in candidates if path.exists()]
+
+
+def docs_dir_for(mkdocs_path: Path) -> Path:
+    """Dossier docs d'un site (docs_dir de mkdocs.yml, 'docs' par défaut)."""
+    with open(mkdocs_path, 'r', encoding='utf-8') as f:
+        # yaml_load de MkDocs : mkdocs.yml peut contenir des balises !ENV
+        config = yaml_load(f) or {}
+    return mkdocs_path.parent / config.get('docs_dir', 'docs')
+
+
+def update_navs(configs: List[Path], cache: Optional[TitleCache], workers: int,
+                quiet: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Met à jour la navigation de chaque site, avec le cache des titres partagé.
+
+    Returns:
+        dict: Statistiques de update_mkdocs_nav par mkdocs.yml
+    """
+    stats = {}
+    for mkdocs_path in configs:
+        docs_dir = docs_dir_for(mkdocs_path)
+        if not docs_dir.exists():
+            print(f"❌ Répertoire docs non trouvé: {docs_dir}")
+            continue
+        # Sauvegarde écrite seulement si la navigation change, comme update_nav.py
+        backup_path = mkdocs_path.with_suffix('.yml.backup')
+        stats[str(mkdocs_path)] = update_mkdocs_nav(mkdocs_path, docs_dir, cache, workers, quiet,
+                                                    backup_path=backup_path)
+        if stats[str(mkdocs_path)]['modifie'] and not quiet:
+            print(f"💾 Sauvegarde créée: {backup_path}")
+    if cache is not None:
+        cache.prune()
+        cache.save()
+    return stats
+
+
+def build_site(mkdocs_path: str, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Génère un site (exécuté dans un processus du pool).
+
+    Returns:
+        dict: mkdocs.yml, dossier généré, durée, succès et message d'erreur
+    """
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+    from mkdocs.exceptions import MkDocsException
+
+    name = Path(mkdocs_path).parent.name or mkdocs_path
+    logging.basicConfig(format=f"[{name}] %(levelname)s - %(message)s",
+                        level=logging.INFO if verbose else logging.WARNING, force=True)
+
+    start = time.perf_counter()
+    result = {'config': mkdocs_path, 'site_dir': None, 'succes': False, 'erreur': None}
+    try:
+        config = load_config(config_file=mkdocs_path)
+        config.plugins.on_startup(command='build', dirty=False)
+        try:
+            build(config)
+        finally:
+            config.plugins.on_shutdown()
+        result['site_dir'] = config['site_dir']
+        result['succes'] = True
+    except (MkDocsException, OSError) as e:
+        result['erreur'] = str(e)
+    except Exception as e:
+        # Erreur de template, de YAML... : le site échoue sans interrompre les autres
+        result['erreur'] = f"{type(e).__name__}: {e}"
+    result['duree_s'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def build_sites(configs: List[Path], jobs: Optional[int] = None, verbose: bool = False) -> List[Dict[str, Any]]:
+    """Génère les sites en parallèle ; résultats dans l'ordre des configurations."""
+    if len(configs) == 1 or jobs == 1:
+        return [build_site(str(path), verbose) for path in configs]
+    results = []
+    with ProcessPoolExecutor(max_workers=min(len(configs), jobs or len(configs))) as executor:
+        futures = [(str(path), executor.submit(build_site, str(path), verbose)) for path in configs]
+        for path, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # Processus interrompu (BrokenProcessPool...) : les autres résultats sont conservés
+                results.append({'config': path, 'site_dir': None, 'succes': False,
+                                'erreur': f"{type(e).__name__}: {e}", 'duree_s': 0.0})
+    return results
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def deduplicate_static(site_dirs: List[str], workers: int = DEFAULT_WORKERS) -> Dict[str, int]:
+    """
+    Remplace les fichiers statiques identiques par des liens physiques vers un
+    seul exemplaire. Seuls les fichiers de même taille sont comparés (empreinte
+    SHA-256) ; le remplacement passe par un lien temporaire puis os.replace,
+    pour qu'un fichier ne soit jamais absent.
+
+    Returns:
+        dict: 'fichiers' remplacés par un lien et 'octets' économisés
+    """
+    by_size: Dict[int, List[str]] = {}
+    for site_dir in site_dirs:
+        for directory, _, names in os.walk(os.path.join(site_dir, STATIC_DIR)):
+            for name in names:
+                path = os.path.join(directory, name)
+                stat = os.lstat(path)
+                if stat.st_size and not os.path.islink(path):
+                    by_size.setdefault(stat.st_size, []).append(path)
+
+    candidates = [path for paths in by_size.values() if len(paths) > 1 for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        hashes = dict(zip(candidates, executor.map(_file_hash, candidates)))
+
+    by_content: Dict[str, List[str]] = {}
+    for path in candidates:
+        by_content.setdefault(hashes[path], []).append(path)
+
+    stats = {'fichiers': 0, 'octets': 0}
+    for paths in by_content.values():
+        original = paths[0]
+        original_stat = os.stat(original)
+        for path in paths[1:]:
+            stat = os.stat(path)
+            if (stat.st_dev, stat.st_ino) == (original_stat.st_dev, original_stat.st_ino):
+                continue
+            if stat.st_dev != original_stat.st_dev:
+                # Sites sur des systèmes de fichiers différents
+                continue
+            temporary = f"{path}.dedup-tmp"
+            os.link(original, temporary)
+            os.replace(temporary, path)
+            stats['fichiers'] += 1
+            stats['octets'] += stat.st_size
+    return stats
+
+
+def main():
+    """
+    Fonction principale du script.
+    """
+    parser = argparse.ArgumentParser(description="Met à jour la navigation et génère tous les sites MkDocs")
+    parser.add_argument("configs", nargs='*', type=Path,
+                        help="Fichiers mkdocs.yml des sites (défaut: public/mkdocs.yml, mkdocs.yml et internal/mkdocs.yml présents)")
+    parser.add_argument("--no-nav", action="store_true",
+                        help="Ne met pas à jour la navigation avant la génération")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Relit tous les fichiers sans utiliser le cache des titres")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads pour le parcours, l'extraction des titres et le dédoublonnage (défaut: {DEFAULT_WORKERS})")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Sites générés en parallèle (défaut: tous)")
+    parser.add_argument("--no-dedup", action="store_true",
+                        help="Ne remplace pas les fichiers statiques identiques par des liens physiques")
+    parser.add_argument("--check-links", action="store_true",
+                        help="Vérifie les liens de tous les sites après la génération (check_links.py)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Affiche les messages INFO de MkDocs")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="N'affiche que les erreurs")
+    parser.add_argument("--events", metavar="FICHIER",
+                        help="Écrit un événement JSON par ligne dans ce fichier "
+                             "('-' : sortie standard, les messages passent alors sur la sortie d'erreur)")
+    parser.add_argument("--prometheus", metavar="FICHIER",
+                        help="Écrit les métriques au format Prometheus (collecteur textfile de node_exporter)")
+    args = parser.parse_args()
+
+    events = EventLog('build_sites', args.events, args.prometheus)
+    output = contextlib.redirect_stdout(sys.stderr) if events.to_stdout else contextlib.nullcontext()
+    try:
+        with output:
+            sys.exit(run(args, events))
+    finally:
+        events.close()
+
+
+def run(args: argparse.Namespace, events: EventLog) -> int:
+    """
+    Navigation, génération, dédoublonnage puis vérification des liens ;
+    retourne le code de sortie (1 si un site échoue ou si un lien est cassé).
+    """
+    info = (lambda *_: None) if args.quiet else print
+    start = time.perf_counter()
+
+    configs = args.configs or find_configs(Path(__file__).parent)
+    if not configs:
+        print("❌ Aucun fichier mkdocs.yml trouvé")
+        events.emit('erreur', message="mkdocs.yml non trouvé")
+        return 2
+    for mkdocs_path in configs:
+        info(f"📄 Site : {mkdocs_path}")
+    events.emit('debut', sites=[str(path) for path in configs])
+
+    metrics = []
+    if not args.no_nav:
+        # Cache des titres commun à tous les sites, à la racine du dépôt
+        cache = None if args.no_cache else TitleCache(Path(__file__).parent / DEFAULT_CACHE_NAME)
+        nav_start = time.perf_counter()
+        nav_stats = update_navs(configs, cache, args.workers, args.quiet)
+        nav_duration = round(time.perf_counter() - nav_start, 3)
+        files = sum(stats.get('fichiers', 0) for stats in nav_stats.values())
+        cache_text = f", cache des titres : {cache.hits} lu(s), {cache.misses} relu(s)" if cache is not None else ''
+        info(f"🧭 Navigation : {files} fichier(s) en {nav_duration} s{cache_text}")
+        events.emit('navigation', fichiers=files, duree_s=nav_duration,
+                    cache_lus=cache.hits if cache is not None else None,
+                    cache_relus=cache.misses if cache is not None else None)
+        metrics.append(('navigation_duree_secondes', "Durée de la mise à jour des navigations", nav_duration))
+
+    results = build_sites(configs, args.jobs, args.verbose)
+    failed = [result for result in results if not result['succes']]
+    for result in results:
+        if result['succes']:
+            info(f"🏗️  {result['config']} : généré dans {result['site_dir']} en {result['duree_s']} s")
+        else:
+            print(f"❌ {result['config']} : {result['erreur']}")
+        events.emit('site', **result)
+    metrics.append(('generation_duree_secondes', "Durée de la génération par site",
+                    {(('site', result['config']),): result['duree_s'] for result in results}))
+    metrics.append(('generation_succes', "Génération réussie par site (1 ou 0)",
+                    {(('site', result['config']),): int(result['succes']) for result in results}))
+
+    site_dirs = [result['site_dir'] for result in results if result['succes']]
+    if site_dirs and not args.no_dedup:
+        dedup = deduplicate_static(site_dirs, args.workers)
+        info(f"🔗 Fichiers statiques : {dedup['fichiers']} remplacé(s) par un lien physique "
+             f"({dedup['octets'] / 1024 / 1024:.1f} Mo économisés)")
+        events.emit('dedoublonnage', **dedup)
+        metrics.append(('dedoublonnage_octets', "Octets économisés par les liens physiques", dedup['octets']))
+
+    broken = 0
+    if args.check_links and site_dirs:
+        from check_links import check_sites, load_site, print_report, DEFAULT_MAX_SOURCES
+        sites = [load_site(Path(result['config'])) for result in results if result['succes']]
+        problems, stats = check_sites(sites, None)
+        print_report(problems, DEFAULT_MAX_SOURCES)
+        broken = sum(len(entries) for entries in problems.values())
+        info(f"{'✅' if not broken else '❌'} Liens : {stats['pages']} page(s), {broken} problème(s)")
+        events.emit('liens', problemes=broken, **stats)
+        metrics.append(('liens_problemes', "Problèmes de liens trouvés", broken))
+
+    duration = round(time.perf_counter() - start, 3)
+    info(f"⏱️ Durée totale : {duration} s")
+    events.emit('fin', succes=not failed and not broken, duree_s=duration)
+    metrics.append(('duree_secondes', "Durée totale de l'exécution", duration))
+    events.write_prometheus(metrics)
+    return 1 if failed or broken else 0
+
+
+if __name__ == "__main__":
+    main()
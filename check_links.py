@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Vérifie les liens internes, ancres et ressources des sites générés par MkDocs.
+
+nginx sert /public/index.html (ou /internal/index.html) à la place de toute
+URL inexistante (try_files) : un lien cassé par la navigation générée ou par
+le renommage d'un dossier d'article ne produit donc aucune erreur 404. Ce
+script parcourt le HTML de chaque site après 'mkdocs build' et signale :
+
+- les liens vers une page ou un fichier absent ;
+- les ancres (#identifiant) absentes de la page visée ;
+- les ressources absentes (images, scripts, feuilles de style...) ;
+- les liens qui passent d'un site à l'autre (/public/ <-> /internal/).
+
+Les pages sont analysées par lots dans un pool de processus, avec un
+découpage par expressions régulières (sans construire d'arbre DOM). Chaque
+lot renvoie les identifiants de ses pages et ses liens déjà résolus et
+dédoublonnés : le menu latéral, identique sur toutes les pages, ne coûte
+qu'une vérification par cible.
+"""
+
+import argparse
+import contextlib
+import html
+import os
+import posixpath
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+from mkdocs.utils.yaml import yaml_load
+
+from run_events import EventLog, throughput
+
+# Nombre de pages analysées par tâche du pool de processus
+BATCH_SIZE = 200
+# Sources affichées par lien cassé, et conservées au plus pendant l'analyse
+DEFAULT_MAX_SOURCES = 3
+SOURCES_KEPT = 20
+
+# Attributs qui désignent une URL, et leur catégorie (page ou ressource)
+URL_ATTRIBUTES = {
+    ('a', 'href'): 'lien',
+    ('area', 'href'): 'lien',
+    ('iframe', 'src'): 'lien',
+    ('link', 'href'): 'ressource',
+    ('img', 'src'): 'ressource',
+    ('img', 'srcset'): 'ressource',
+    ('script', 'src'): 'ressource',
+    ('source', 'src'): 'ressource',
+    ('source', 'srcset'): 'ressource',
+    ('video', 'src'): 'ressource',
+    ('video', 'poster'): 'ressource',
+    ('audio', 'src'): 'ressource',
+    ('track', 'src'): 'ressource',
+    ('embed', 'src'): 'ressource',
+    ('object', 'data'): 'ressource',
+}
+URL_TAGS = {tag for tag, _ in URL_ATTRIBUTES}
+# Éléments à contenu brut, dont le contenu n'est pas analysé
+RAW_TEXT_TAGS = ('script', 'style', 'textarea', 'template')
+TAG = re.compile(r'<!--.*?-->|<([a-zA-Z][\w:-]*)(\s[^>]*)?>', re.S)
+ATTRIBUTE = re.compile(r'''([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?''')
+# <link rel="..."> qui ne désignent pas un fichier du site à charger
+IGNORED_LINK_RELS = {'preconnect', 'dns-prefetch', 'canonical', 'alternate'}
+SCHEME = re.compile(r'([a-zA-Z][a-zA-Z0-9+.-]*):')
+# Préfixes des sites servis par nginx : un lien vers l'un d'eux passe d'un
+# site à l'autre, même si ce site n'est pas vérifié
+SITE_PREFIXES = ('/public/', '/internal/')
+
+CATEGORIES = {
+    'lien': "Liens cassés",
+    'ancre': "Ancres absentes",
+    'ressource': "Ressources absentes",
+    'inter-sites': "Liens entre sites",
+}
+
+# Lien résolu : (catégorie, chemin de l'URL visée, ancre)
+Target = Tuple[str, str, str]
+# Occurrences d'un lien : (nombre, [(page source, ligne), ...])
+Occurrences = Tuple[int, List[Tuple[str, int]]]
+
+
+class Site:
+    """Site généré, servi sous un préfixe d'URL (ex. /public/)."""
+
+    def __init__(self, prefix: str, site_dir: Path, hosts: Iterable[str] = ()):
+        self.prefix = '/' + prefix.strip('/') + '/' if prefix.strip('/') else '/'
+        self.site_dir = site_dir
+        self.hosts = set(hosts)
+        self.files: Set[str] = set()
+        self.directories: Set[str] = {''}
+
+    def index(self) -> List[str]:
+        """Inventorie les fichiers du site ; retourne les pages HTML (chemins relatifs)."""
+        pages = []
+        for directory, subdirs, names in os.walk(self.site_dir):
+            relative_dir = os.path.relpath(directory, self.site_dir).replace(os.sep, '/')
+            relative_dir = '' if relative_dir == '.' else relative_dir + '/'
+            for name in subdirs:
+                self.directories.add(relative_dir + name)
+            for name in names:
+                self.files.add(relative_dir + name)
+                if name.endswith('.html'):
+                    pages.append(relative_dir + name)
+        return pages
+
+    def resolve(self, relative: str) -> Optional[str]:
+        """Fichier servi par nginx pour ce chemin ($uri puis $uri/ avec index.html), None s'il n'existe pas."""
+        if relative.endswith('/') or not relative:
+            directory = relative.strip('/')
+        elif relative in self.files:
+            return relative
+        else:
+            directory = relative
+        if directory in self.directories:
+            index = f"{directory}/index.html" if directory else 'index.html'
+            if index in self.files:
+                return index
+        return None
+
+
+def load_site(config_path: Path) -> Site:
+    """Site décrit par un mkdocs.yml (site_dir et chemin de site_url)."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        # yaml_load de MkDocs : mkdocs.yml peut contenir des balises !ENV
+        config = yaml_load(f) or {}
+    site_url = urlsplit(config.get('site_url') or '')
+    site_dir = config_path.parent / config.get('site_dir', 'site')
+    return Site(site_url.path or '/', site_dir, [site_url.netloc] if site_url.netloc else [])
+
+
+def parse_site_option(value: str) -> Site:
+    """Option --site PREFIXE=DOSSIER."""
+    prefix, separator, directory = value.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError(f"--site attend PREFIXE=DOSSIER : {value}")
+    return Site(prefix, Path(directory))
+
+
+def _attributes(text: str) -> Dict[str, str]:
+    attributes = {}
+    for attribute in ATTRIBUTE.finditer(text):
+        value = attribute.group(2)
+        if value is None:
+            value = attribute.group(3) if attribute.group(3) is not None else attribute.group(4)
+        attributes[attribute.group(1).lower()] = html.unescape(value) if value and '&' in value else value
+    return attributes
+
+
+def parse_page(content: str) -> Tuple[Set[str], List[Tuple[str, str, int]]]:
+    """
+    Identifiants et URL d'une page HTML.
+
+    Returns:
+        tuple: (identifiants id et <a name>, [(catégorie, URL, ligne), ...])
+    """
+    ids = set()
+    links = []
+    position = 0
+    line = 1
+    line_position = 0
+    while True:
+        match = TAG.search(content, position)
+        if match is None:
+            break
+        position = match.end()
+        tag = match.group(1)
+        if tag is None:
+            continue
+        tag = tag.lower()
+        attributes_text = match.group(2)
+
+        # Seuls les attributs des balises à URL et des éléments avec identifiant sont analysés
+        if attributes_text and (tag in URL_TAGS or 'id=' in attributes_text):
+            attributes = _attributes(attributes_text)
+            if attributes.get('id'):
+                ids.add(attributes['id'])
+            if tag == 'a' and attributes.get('name'):
+                ids.add(attributes['name'])
+
+            for name, value in attributes.items():
+                category = URL_ATTRIBUTES.get((tag, name))
+                if category is None or not value:
+                    continue
+                if tag == 'link' and IGNORED_LINK_RELS & set((attributes.get('rel') or '').lower().split()):
+                    continue
+                line += content.count('\n', line_position, match.start())
+                line_position = match.start()
+                if name == 'srcset':
+                    for candidate in value.split(','):
+                        url = candidate.strip().split(' ')[0]
+                        if url:
+                            links.append((category, url, line))
+                else:
+                    links.append((category, value.strip(), line))
+
+        if tag in RAW_TEXT_TAGS:
+            end = content.find(f'</{tag}', position)
+            position = len(content) if end < 0 else end
+    return ids, links
+
+
+def _page_url(site: Site, relative: str) -> str:
+    return site.prefix + relative
+
+
+def resolve_link(url: str, page_url: str, hosts: Set[str]) -> Optional[Tuple[str, str]]:
+    """
+    URL absolue d'un lien interne (résolution de urljoin, sans son coût pour
+    des dizaines de liens par page).
+
+    Returns:
+        tuple: (chemin décodé, ancre décodée), ou None pour un lien externe
+    """
+    url, _, fragment = url.partition('#')
+    url = url.partition('?')[0]
+    scheme = SCHEME.match(url)
+    if scheme:
+        if scheme.group(1).lower() not in ('http', 'https'):
+            return None
+        url = url[scheme.end():]
+        if not url.startswith('//'):
+            return None
+    if url.startswith('//'):
+        netloc, slash, path = url[2:].partition('/')
+        if netloc not in hosts:
+            return None
+        path = slash + path or '/'
+    elif url.startswith('/'):
+        path = url
+    elif not url:
+        path = page_url
+    else:
+        path = page_url[:page_url.rfind('/') + 1] + url
+
+    if '/.' in path:
+        trailing = path.endswith(('/', '/.', '/..'))
+        path = posixpath.normpath(path)
+        if trailing and path != '/':
+            path += '/'
+    if '%' in path:
+        path = unquote(path)
+    if '%' in fragment:
+        fragment = unquote(fragment)
+    return path, fragment
+
+
+def analyse_batch(prefix: str, site_dir: str, pages: List[str], hosts: Set[str]
+                  ) -> Tuple[Dict[str, Set[str]], Dict[Target, Occurrences], int]:
+    """
+    Analyse un lot de pages d'un site (exécuté dans un processus du pool).
+
+    Returns:
+        tuple: (identifiants par page, occurrences par lien résolu, nombre de liens)
+    """
+    site = Site(prefix, Path(site_dir))
+    ids_by_page = {}
+    targets: Dict[Target, Occurrences] = {}
+    resolved: Dict[Tuple[str, str], Optional[Tuple[str, str]]] = {}
+    total = 0
+    for relative in pages:
+        with open(os.path.join(site_dir, relative), 'r', encoding='utf-8', errors='replace') as f:
+            ids, links = parse_page(f.read())
+        ids_by_page[relative] = ids
+        page_url = _page_url(site, relative)
+        base = page_url.rsplit('/', 1)[0]
+        for category, url, line in links:
+            total += 1
+            # Les liens absolus (menu latéral, site_url) ne sont résolus qu'une fois par lot,
+            # les liens relatifs une fois par dossier
+            if url.startswith(('http:', 'https:', '/')):
+                key = ('', url)
+            elif url.startswith(('#', '?')):
+                key = (page_url, url)
+            else:
+                key = (base, url)
+            if key not in resolved:
+                resolved[key] = resolve_link(url, page_url, hosts)
+            target = resolved[key]
+            if target is None:
+                continue
+            path, fragment = target
+            count, sources = targets.get((category, path, fragment), (0, []))
+            if len(sources) < SOURCES_KEPT:
+                sources.append((relative, line))
+            targets[(category, path, fragment)] = (count + 1, sources)
+    return ids_by_page, targets, total
+
+
+def _batches(pages: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(pages), size):
+        yield pages[start:start + size]
+
+
+def check_sites(sites: List[Site], workers: Optional[int] = None, allow_cross_site: bool = False
+                ) -> Tuple[Dict[str, List[Tuple[str, str, Occurrences]]], Dict[str, int]]:
+    """
+    Vérifie les liens de tous les sites, qui peuvent se référencer entre eux.
+    Un lien vers un autre site de SITE_PREFIXES non fourni est signalé comme
+    lien entre sites, sans vérifier sa cible.
+
+    Returns:
+        tuple: (problèmes par catégorie : [(site source, URL visée, occurrences), ...],
+                statistiques)
+    """
+    start = time.perf_counter()
+    hosts = set().union(*(site.hosts for site in sites))
+    stats = {'pages': 0, 'liens': 0, 'cibles': 0}
+    ids_by_page: Dict[Tuple[str, str], Set[str]] = {}
+    # (préfixe du site source, catégorie, chemin, ancre) -> occurrences
+    targets: Dict[Tuple[str, str, str, str], Occurrences] = {}
+
+    pages_by_site = {site.prefix: site.index() for site in sites}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for site in sites:
+            pages = pages_by_site[site.prefix]
+            stats['pages'] += len(pages)
+            for batch in _batches(pages, BATCH_SIZE):
+                future = executor.submit(analyse_batch, site.prefix, str(site.site_dir), batch, hosts)
+                futures.append((site.prefix, future))
+
+        for prefix, future in futures:
+            batch_ids, batch_targets, total = future.result()
+            stats['liens'] += total
+            for relative, ids in batch_ids.items():
+                ids_by_page[(prefix, relative)] = ids
+            for (category, path, fragment), (count, sources) in batch_targets.items():
+                key = (prefix, category, path, fragment)
+                previous = targets.get(key)
+                if previous is None:
+                    targets[key] = (count, sources)
+                else:
+                    kept = previous[1]
+                    kept.extend(sources[:SOURCES_KEPT - len(kept)])
+                    targets[key] = (previous[0] + count, kept)
+
+    # Préfixes les plus longs d'abord : /public/docs/ avant /public/
+    sites_by_prefix = sorted(sites, key=lambda site: len(site.prefix), reverse=True)
+    problems: Dict[str, List[Tuple[str, str, Occurrences]]] = {category: [] for category in CATEGORIES}
+    stats['cibles'] = len(targets)
+    for (source_prefix, category, path, fragment), occurrences in sorted(targets.items()):
+        url = path + (f"#{fragment}" if fragment else '')
+        target_site = next((site for site in sites_by_prefix
+                            if path.startswith(site.prefix) or path + '/' == site.prefix), None)
+        if target_site is None:
+            other_site = next((prefix for prefix in SITE_PREFIXES if prefix != source_prefix
+                               and (path.startswith(prefix) or path + '/' == prefix)), None)
+            if other_site is None:
+                problems[category].append((source_prefix, url, occurrences))
+            elif not allow_cross_site:
+                # Site non vérifié : seul le passage d'un site à l'autre est signalé
+                problems['inter-sites'].append((source_prefix, url, occurrences))
+            continue
+        if target_site.prefix != source_prefix and not allow_cross_site:
+            problems['inter-sites'].append((source_prefix, url, occurrences))
+        resolved = target_site.resolve(path[len(target_site.prefix):])
+        if resolved is None:
+            problems[category].append((source_prefix, url, occurrences))
+        elif fragment and resolved.endswith('.html') \
+                and fragment not in ids_by_page.get((target_site.prefix, resolved), ()):
+            problems['ancre'].append((source_prefix, url, occurrences))
+
+    stats['duree_s'] = round(time.perf_counter() - start, 3)
+    return problems, stats
+
+
+def print_report(problems: Dict[str, List[Tuple[str, str, Occurrences]]], max_sources: int):
+    """Affiche les problèmes par catégorie, avec les premières pages sources de chacun."""
+    for category, title in CATEGORIES.items():
+        entries = problems[category]
+        if not entries:
+            continue
+        print(f"\n❌ {title} : {len(entries)}")
+        for source_prefix, url, (count, sources) in entries:
+            print(f"   {url} ({count} occurrence(s))")
+            for relative, line in sorted(sources)[:max_sources]:
+                print(f"      ↳ {source_prefix}{relative}:{line}")
+            if count > max_sources:
+                print(f"      ↳ ...")
+
+
+def find_configs(script_dir: Path) -> List[Path]:
+    """mkdocs.yml des sites public et interne présents à côté du script."""
+    return [path for path in (script_dir / "public" / "mkdocs.yml", script_dir / "internal" / "mkdocs.yml")
+            if path.exists()]
+
+
+def main():
+    """
+    Fonction principale du script.
+    """
+    parser = argparse.ArgumentParser(description="Vérifie les liens internes, ancres et ressources des sites générés")
+    parser.add_argument("configs", nargs='*', type=Path,
+                        help="Fichiers mkdocs.yml des sites (défaut: public/mkdocs.yml et internal/mkdocs.yml)")
+    parser.add_argument("--site", action="append", type=parse_site_option, default=[], metavar="PREFIXE=DOSSIER",
+                        help="Site déjà généré servi sous PREFIXE (ex. /public/=/var/www/mkdocs/public), répétable")
+    parser.add_argument("--host", action="append", default=[], metavar="HOTE",
+                        help="Hôte des liens absolus à vérifier (ex. 10.224.165.17), en plus de ceux des site_url, répétable")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processus d'analyse (défaut: nombre de processeurs)")
+    parser.add_argument("--allow-cross-site", action="store_true",
+                        help="Accepte les liens entre sites (/public/ <-> /internal/)")
+    parser.add_argument("--max-sources", type=int, default=DEFAULT_MAX_SOURCES,
+                        help=f"Pages sources affichées par lien cassé (défaut: {DEFAULT_MAX_SOURCES})")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="N'affiche que les problèmes")
+    parser.add_argument("--events", metavar="FICHIER",
+                        help="Écrit un événement JSON par ligne dans ce fichier "
+                             "('-' : sortie standard, les messages passent alors sur la sortie d'erreur)")
+    parser.add_argument("--prometheus", metavar="FICHIER",
+                        help="Écrit les métriques au format Prometheus (collecteur textfile de node_exporter)")
+    args = parser.parse_args()
+
+    events = EventLog('check_links', args.events, args.prometheus)
+    output = contextlib.redirect_stdout(sys.stderr) if events.to_stdout else contextlib.nullcontext()
+    try:
+        with output:
+            sys.exit(run(args, events))
+    finally:
+        events.close()
+
+
+def run(args: argparse.Namespace, events: EventLog) -> int:
+    """
+    Vérifie les sites demandés ; retourne le code de sortie (1 si un problème est trouvé).
+    """
+    info = (lambda *_: None) if args.quiet else print
+
+    configs = args.configs or ([] if args.site else find_configs(Path(__file__).parent))
+    sites = [load_site(path) for path in configs] + args.site
+    for site in sites:
+        site.hosts.update(args.host)
+    missing = [site for site in sites if not site.site_dir.is_dir()]
+    if not sites or missing:
+        for site in missing:
+            print(f"❌ Site non généré : {site.site_dir} (lancer 'mkdocs build')")
+        if not sites:
+            print("❌ Aucun site à vérifier")
+        events.emit('erreur', message="site absent")
+        return 2
+
+    prefixes = [site.prefix for site in sites]
+    if len(set(prefixes)) != len(prefixes):
+        print(f"❌ Plusieurs sites servis sous le même préfixe : {', '.join(prefixes)}")
+        return 2
+
+    for site in sites:
+        info(f"🌐 {site.prefix} : {site.site_dir}")
+    events.emit('debut', sites=prefixes)
+
+    problems, stats = check_sites(sites, args.workers, args.allow_cross_site)
+    print_report(problems, args.max_sources)
+
+    counts = {category: len(entries) for category, entries in problems.items()}
+    total = sum(counts.values())
+    info(f"\n{'✅' if not total else '❌'} {stats['pages']} page(s), {stats['liens']} lien(s) "
+         f"({stats['cibles']} cible(s) distincte(s)) vérifiés en {stats['duree_s']} s "
+         f"({throughput(stats['pages'], stats['duree_s'])} pages/s) : {total} problème(s)")
+
+    events.emit('fin', problemes=counts, **stats)
+    events.write_prometheus([
+        ('pages', "Pages analysées", stats['pages']),
+        ('liens', "Liens analysés", stats['liens']),
+        ('problemes', "Problèmes trouvés par catégorie",
+         {(('categorie', category),): count for category, count in counts.items()}),
+        ('duree_secondes', "Durée de la vérification", stats['duree_s']),
+    ])
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    main()
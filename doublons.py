@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Détection des fichiers identiques de l'export WordPress et mutualisation des
+images des articles copiés
+
+Beaucoup d'articles embarquent les mêmes captures d'écran et logos : chaque
+copie est dupliquée dans chaque destination. Les doublons sont trouvés en
+trois passes, chacune ne portant que sur les candidats restants :
+1. regroupement par taille (un fichier de taille unique n'a pas de doublon) ;
+2. empreinte partielle (SHA-256 du premier bloc de TAILLE_PARTIELLE octets) ;
+3. empreinte complète (SHA-256 du fichier), sauf pour les fichiers assez
+   petits pour que l'empreinte partielle soit déjà complète.
+Les liens physiques vers un même inode ne sont lus qu'une fois. Les
+empreintes sont calculées par un pool de threads (hashlib libère le GIL).
+
+Deux usages :
+- indexer_doublons : index JSON des groupes de doublons d'un dossier (l'export
+  complet), sans rien modifier ;
+- mutualiser_images : après la copie, chaque image référencée en Markdown
+  (![texte](chemin)) dont le contenu apparaît plusieurs fois est stockée une
+  seule fois dans un dossier partagé, les références sont réécrites vers
+  cette copie et les originaux qui ne sont plus référencés sont supprimés.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import unquote
+
+from synchronisation import calculer_hash
+
+INDEX_VERSION = 1
+TAILLE_PARTIELLE = 64 * 1024
+
+# Image Markdown en ligne : ![texte](chemin "titre")
+IMAGE_MARKDOWN = re.compile(r'(!\[[^\]]*\]\(\s*<?)([^)\s>]+)(>?(?:\s+"[^"]*")?\s*\))')
+
+# Toute référence locale restante (liens Markdown, attributs HTML), pour ne
+# supprimer que les originaux qui ne sont plus utilisés
+REFERENCE = re.compile(r'\]\(\s*<?([^)\s>]+)|(?:src|href)\s*=\s*["\']([^"\']+)["\']', re.I)
+
+EXTENSIONS_TEXTE = ('.md', '.markdown', '.html', '.htm')
+
+
+def _empreinte_partielle(chemin):
+    """SHA-256 du premier bloc d'un fichier"""
+    with open(chemin, 'rb') as f:
+        return hashlib.sha256(f.read(TAILLE_PARTIELLE)).hexdigest()
+
+
+def _regrouper(chemins, empreinte, pool):
+    """
+    Sépare des candidats de même taille selon une empreinte calculée en parallèle
+
+    Returns:
+        dict: Empreinte -> chemins, limité aux empreintes partagées par plusieurs chemins
+    """
+    groupes = defaultdict(list)
+    for chemin, valeur in zip(chemins, pool.map(empreinte, chemins)):
+        groupes[valeur].append(chemin)
+    return {valeur: membres for valeur, membres in groupes.items() if len(membres) > 1}
+
+
+def _inode(chemin, infos=None):
+    """Identifiant (périphérique, inode) d'un fichier"""
+    infos = infos or os.stat(chemin)
+    return infos.st_dev, infos.st_ino
+
+
+def trouver_doublons(chemins, jobs=None):
+    """
+    Trouve les fichiers de contenu identique parmi une liste de chemins
+
+    Args:
+        chemins (iterable): Fichiers à comparer (les fichiers vides sont ignorés)
+        jobs (int, optional): Nombre de threads de calcul des empreintes
+            (défaut : choix de ThreadPoolExecutor)
+
+    Returns:
+        list: Groupes {'sha256', 'taille', 'fichiers'} (fichiers triés), du
+              plus coûteux (taille x copies superflues) au moins coûteux
+    """
+    # Un inode partagé par des liens physiques n'est lu qu'une fois
+    inodes = defaultdict(list)
+    par_taille = defaultdict(list)
+    for chemin in chemins:
+        infos = os.stat(chemin)
+        if not infos.st_size:
+            continue
+        cle = _inode(chemin, infos)
+        if cle not in inodes:
+            par_taille[infos.st_size].append(chemin)
+        inodes[cle].append(chemin)
+
+    groupes = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for taille, candidats in par_taille.items():
+            if len(candidats) < 2:
+                continue
+            for partielle, membres in _regrouper(candidats, _empreinte_partielle, pool).items():
+                if taille <= TAILLE_PARTIELLE:
+                    # Le premier bloc est le fichier entier
+                    groupes.append((partielle, taille, membres))
+                else:
+                    groupes.extend((complete, taille, identiques) for complete, identiques
+                                   in _regrouper(membres, calculer_hash, pool).items())
+
+    # Un contenu unique peut aussi être présent sous plusieurs liens physiques
+    regroupes = {chemin for _, _, membres in groupes for chemin in membres}
+    for liens in inodes.values():
+        if len(liens) > 1 and liens[0] not in regroupes:
+            groupes.append((calculer_hash(liens[0]), os.path.getsize(liens[0]), [liens[0]]))
+
+    resultat = []
+    for empreinte, taille, membres in groupes:
+        fichiers = sorted(chemin for membre in membres for chemin in inodes[_inode(membre)])
+        resultat.append({'sha256': empreinte, 'taille': taille, 'fichiers': fichiers})
+    resultat.sort(key=lambda groupe: (-groupe['taille'] * (len(groupe['fichiers']) - 1), groupe['fichiers'][0]))
+    return resultat
+
+
+def _lister(racine):
+    """Fichiers d'un dossier (ou le fichier lui-même), fichiers et dossiers cachés exclus"""
+    if os.path.isfile(racine):
+        yield racine
+        return
+    for dossier, sous_dossiers, noms in os.walk(racine):
+        sous_dossiers[:] = [nom for nom in sous_dossiers if not nom.startswith('.')]
+        for nom in noms:
+            chemin = os.path.join(dossier, nom)
+            if not nom.startswith('.') and not os.path.islink(chemin):
+                yield chemin
+
+
+def indexer_doublons(racine, jobs=None):
+    """
+    Construit l'index des groupes de fichiers identiques d'un dossier
+
+    Args:
+        racine (str): Dossier analysé (l'export WordPress)
+        jobs (int, optional): Nombre de threads de calcul des empreintes
+
+    Returns:
+        dict: Index (version, date, racine, totaux, groupes), chemins relatifs à la racine
+    """
+    fichiers = list(_lister(racine))
+    groupes = trouver_doublons(fichiers, jobs)
+    for groupe in groupes:
+        groupe['fichiers'] = [os.path.relpath(chemin, racine).replace(os.sep, '/') for chemin in groupe['fichiers']]
+    return {
+        'version': INDEX_VERSION,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'racine': os.path.abspath(racine),
+        'totaux': {
+            'fichiers': len(fichiers),
+            'groupes': len(groupes),
+            'doublons': sum(len(groupe['fichiers']) - 1 for groupe in groupes),
+            'octets_dupliques': sum(groupe['taille'] * (len(groupe['fichiers']) - 1) for groupe in groupes),
+        },
+        'groupes': groupes,
+    }
+
+
+def ecrire_index(index, chemin):
+    """Écrit l'index des doublons en JSON."""
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+def _cible_locale(reference, dossier):
+    """
+    Résout une référence relative vers un fichier existant
+
+    Returns:
+        str|None: Chemin normalisé du fichier, None pour une URL, un chemin
+                  absolu, une ancre ou un fichier inexistant
+    """
+    if '://' in reference or reference.startswith(('/', '#', 'data:', 'mailto:')):
+        return None
+    chemin = unquote(reference.split('#', 1)[0].split('?', 1)[0])
+    if not chemin:
+        return None
+    cible = os.path.normpath(os.path.join(dossier, chemin))
+    return cible if os.path.isfile(cible) else None
+
+
+def _lire(chemin):
+    """Lit un fichier texte en conservant ses fins de ligne"""
+    with open(chemin, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def mutualiser_images(destinations, repertoire_partage, jobs=None):
+    """
+    Stocke une seule fois les images référencées en double dans les articles
+
+    Seules les images référencées par une image Markdown et dont le contenu
+    apparaît sous plusieurs chemins sont concernées. Chaque contenu est copié
+    dans repertoire_partage sous <sha256[:16]><extension> (avec sa version
+    .webp éventuelle, voir medias.py), les références sont réécrites en
+    chemins relatifs, puis chaque original qui n'est plus référencé par aucun
+    fichier Markdown ou HTML des destinations est supprimé.
+
+    Args:
+        destinations (list): Dossiers ou fichiers copiés (un par article)
+        repertoire_partage (str): Dossier des images mutualisées, à placer
+            dans le docs_dir du site pour être publié
+        jobs (int, optional): Nombre de threads de calcul des empreintes
+
+    Returns:
+        dict: Bilan : images (mutualisées), groupes, references (réécrites),
+              supprimes, octets_liberes, et par_destination (octets libérés
+              par destination)
+    """
+    bilan = {'images': 0, 'groupes': 0, 'references': 0, 'supprimes': 0, 'octets_liberes': 0,
+             'par_destination': {destination: 0 for destination in destinations}}
+
+    textes = [(destination, chemin) for destination in destinations for chemin in _lister(destination)
+              if chemin.lower().endswith(EXTENSIONS_TEXTE)]
+    references = set()
+    for _, chemin in textes:
+        if chemin.lower().endswith(('.md', '.markdown')):
+            dossier = os.path.dirname(chemin)
+            for correspondance in IMAGE_MARKDOWN.finditer(_lire(chemin)):
+                cible = _cible_locale(correspondance.group(2), dossier)
+                if cible is not None:
+                    references.add(cible)
+
+    partage = {}
+    for groupe in trouver_doublons(sorted(references), jobs):
+        extension = os.path.splitext(groupe['fichiers'][0])[1].lower()
+        chemin_partage = os.path.join(repertoire_partage, f"{groupe['sha256'][:16]}{extension}")
+        if not os.path.isfile(chemin_partage) or os.path.getsize(chemin_partage) != groupe['taille']:
+            os.makedirs(repertoire_partage, exist_ok=True)
+            source = groupe['fichiers'][0]
+            for suffixe in ('', '.webp'):
+                if os.path.isfile(source + suffixe):
+                    shutil.copy2(source + suffixe, f"{chemin_partage}{suffixe}.tmp")
+                    os.replace(f"{chemin_partage}{suffixe}.tmp", chemin_partage + suffixe)
+        for chemin in groupe['fichiers']:
+            partage[chemin] = chemin_partage
+        bilan['groupes'] += 1
+        bilan['images'] += len(groupe['fichiers'])
+    if not partage:
+        return bilan
+
+    # Réécriture des références, puis recensement de celles qui restent
+    restantes = set()
+    for _, chemin in textes:
+        texte = _lire(chemin)
+        dossier = os.path.dirname(chemin)
+
+        def reecrire(correspondance):
+            cible = _cible_locale(correspondance.group(2), dossier)
+            if cible not in partage:
+                return correspondance.group(0)
+            bilan['references'] += 1
+            relatif = os.path.relpath(partage[cible], dossier).replace(os.sep, '/')
+            return f"{correspondance.group(1)}{relatif}{correspondance.group(3)}"
+
+        if chemin.lower().endswith(('.md', '.markdown')):
+            nouveau = IMAGE_MARKDOWN.sub(reecrire, texte)
+            if nouveau != texte:
+                with open(f"{chemin}.tmp", 'w', encoding='utf-8', newline='') as f:
+                    f.write(nouveau)
+                shutil.copymode(chemin, f"{chemin}.tmp")
+                os.replace(f"{chemin}.tmp", chemin)
+                texte = nouveau
+        for correspondance in REFERENCE.finditer(texte):
+            cible = _cible_locale(correspondance.group(1) or correspondance.group(2), dossier)
+            if cible is not None:
+                restantes.add(cible)
+
+    racines = [(os.path.normpath(destination), destination) for destination in destinations]
+    for chemin in partage:
+        if chemin in restantes:
+            continue
+        for suffixe in ('', '.webp'):
+            if os.path.isfile(chemin + suffixe):
+                taille = os.path.getsize(chemin + suffixe)
+                os.remove(chemin + suffixe)
+                bilan['octets_liberes'] += taille
+                for racine, destination in racines:
+                    if chemin == racine or chemin.startswith(racine + os.sep):
+                        bilan['par_destination'][destination] += taille
+                        break
+        bilan['supprimes'] += 1
+    return bilan
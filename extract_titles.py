@@ -1,67 +1,230 @@
 #!/usr/bin/env python3
+import argparse
 import os
-import re
 import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-def extract_title_from_markdown(file_path):
-    """Extrait le titre depuis l'en-tête YAML d'un fichier markdown"""
+from markdown_header import EXTRACTOR_ID, read_markdown_header
+from title_cache import DEFAULT_CACHE_NAME, TitleCache
+
+# Colonnes du fichier CSV produit
+FIELDNAMES = ['folder', 'title', 'size_bytes', 'images']
+
+# Extensions comptées comme images dans chaque dossier d'article
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp', '.tif', '.tiff', '.avif'}
+
+DEFAULT_WORKERS = 8
+
+def extract_title_from_markdown(file_path, cache=None):
+    """Extrait le titre depuis l'en-tête YAML d'un fichier markdown (via le cache si fourni)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Rechercher le titre dans l'en-tête YAML
-        title_match = re.search(r'^title:\s*["\']?([^"\']*)["\']?$', content, re.MULTILINE)
-        if title_match:
-            return title_match.group(1).strip()
-        
-        # Si pas de titre dans l'en-tête, chercher un titre de niveau 1
-        h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        if h1_match:
-            return h1_match.group(1).strip()
-            
-        return None
+        if cache is not None:
+            title, _ = cache.lookup(file_path, read_markdown_header, EXTRACTOR_ID)
+        else:
+            title, _ = read_markdown_header(file_path)
+        return title
     except Exception as e:
         print(f"Erreur lors de la lecture de {file_path}: {e}")
         return None
 
+def mesurer_dossier(dossier):
+    """
+    Calcule la taille totale (en octets) et le nombre d'images d'un dossier
+    d'article, sous-dossiers compris. Les liens symboliques ne sont pas suivis.
+
+    Returns:
+        tuple: (taille en octets, nombre d'images)
+    """
+    taille = 0
+    images = 0
+    a_parcourir = [dossier]
+    while a_parcourir:
+        courant = a_parcourir.pop()
+        try:
+            entrees = list(os.scandir(courant))
+        except OSError as e:
+            print(f"Erreur lors du parcours de {courant}: {e}")
+            continue
+        for entree in entrees:
+            if entree.is_dir(follow_symlinks=False):
+                a_parcourir.append(entree.path)
+            elif entree.is_file(follow_symlinks=False):
+                taille += entree.stat(follow_symlinks=False).st_size
+                if os.path.splitext(entree.name)[1].lower() in IMAGE_EXTENSIONS:
+                    images += 1
+    return taille, images
+
+def inventorier_dossier(dossier, cache=None):
+    """
+    Titre, taille et nombre d'images d'un dossier d'article.
+
+    Returns:
+        dict: Ligne du CSV, 'title' vaut None si aucun titre n'est trouvé ;
+        None si le dossier ne contient pas d'index.md
+    """
+    index_file = dossier / "index.md"
+    if not index_file.exists():
+        return None
+    taille, images = mesurer_dossier(dossier)
+    return {
+        'folder': dossier.name,
+        'title': extract_title_from_markdown(index_file, cache),
+        'size_bytes': taille,
+        'images': images,
+    }
+
+def lire_checkpoint(chemin_checkpoint):
+    """
+    Lit le fichier de reprise : une ligne par dossier traité, au format
+    'dossier<TAB>position dans le CSV après écriture de sa ligne'.
+
+    Une dernière ligne incomplète (arrêt brutal pendant l'écriture) est ignorée.
+
+    Returns:
+        tuple: (noms des dossiers traités, position du CSV à conserver ou None)
+    """
+    traites = set()
+    position = None
+    if not chemin_checkpoint.exists():
+        return traites, position
+    with open(chemin_checkpoint, 'r', encoding='utf-8') as f:
+        for ligne in f:
+            if not ligne.endswith('\n'):
+                break
+            nom, _, valeur = ligne.rstrip('\n').rpartition('\t')
+            if not nom or not valeur.isdigit():
+                break
+            traites.add(nom)
+            position = int(valeur)
+    return traites, position
+
+def iterer_resultats(dossiers, cache, executor, ordonne):
+    """
+    Produit les lignes au fil de l'eau : dans l'ordre d'arrivée, ou dans
+    l'ordre des dossiers si ordonne est vrai (les résultats en avance sont
+    gardés jusqu'à ce que les précédents soient arrivés).
+    """
+    futures = {executor.submit(inventorier_dossier, dossier, cache): numero
+               for numero, dossier in enumerate(dossiers)}
+    if not ordonne:
+        for future in as_completed(futures):
+            yield dossiers[futures[future]], future.result()
+        return
+
+    en_attente = {}
+    suivant = 0
+    for future in as_completed(futures):
+        en_attente[futures[future]] = future.result()
+        while suivant in en_attente:
+            yield dossiers[suivant], en_attente.pop(suivant)
+            suivant += 1
+
+def inventorier(base_dir, csv_filename, cache=None, workers=DEFAULT_WORKERS, ordonne=False,
+                chemin_checkpoint=None, reprendre=True):
+    """
+    Écrit l'inventaire des articles dans le CSV au fur et à mesure de leur
+    lecture. Après chaque ligne, le CSV est vidé (flush) puis le dossier est
+    ajouté au fichier de reprise ; une exécution interrompue reprend au
+    dossier suivant. Le fichier de reprise est supprimé en fin de parcours.
+
+    Returns:
+        tuple: (lignes écrites, dossiers déjà traités lors d'une exécution précédente)
+    """
+    csv_path = Path(csv_filename)
+    if chemin_checkpoint is None:
+        chemin_checkpoint = csv_path.with_name(csv_path.name + '.checkpoint')
+
+    traites, position = set(), None
+    if reprendre and csv_path.exists():
+        traites, position = lire_checkpoint(chemin_checkpoint)
+    if not traites:
+        position = None
+
+    dossiers = [dossier for dossier in sorted(base_dir.iterdir())
+                if dossier.is_dir() and dossier.name not in traites]
+    if traites:
+        print(f"↩️  Reprise : {len(traites)} dossier(s) déjà traité(s), {len(dossiers)} restant(s)")
+
+    ecrits = 0
+    with open(csv_path, 'r+' if position is not None else 'w', newline='', encoding='utf-8') as csvfile, \
+            open(chemin_checkpoint, 'a' if position is not None else 'w', encoding='utf-8') as checkpoint:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        if position is not None:
+            # Lignes écrites après le dernier point de reprise : réécrites à la reprise
+            csvfile.seek(position)
+            csvfile.truncate()
+        else:
+            # Écrire l'en-tête
+            writer.writeheader()
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for dossier, ligne in iterer_resultats(dossiers, cache, executor, ordonne):
+                if ligne is not None:
+                    if ligne['title']:
+                        writer.writerow(ligne)
+                        ecrits += 1
+                        print(f"Trouvé: {ligne['title']}")
+                    else:
+                        print(f"Aucun titre trouvé dans: {dossier.name}")
+                # La ligne est sur disque avant d'être marquée comme traitée
+                csvfile.flush()
+                checkpoint.write(f"{dossier.name}\t{csvfile.tell()}\n")
+                checkpoint.flush()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    chemin_checkpoint.unlink()
+    return ecrits, len(traites)
+
 def main():
+    parser = argparse.ArgumentParser(description="Inventaire des titres des articles WordPress")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Relit tous les fichiers sans utiliser le cache des titres")
+    parser.add_argument("--base-dir", default="wordpress-content-to-sort",
+                        help="Répertoire contenant les dossiers d'articles (défaut: wordpress-content-to-sort)")
+    parser.add_argument("--output", "-o", default="wordpress_articles_titles.csv",
+                        help="Fichier CSV produit (défaut: wordpress_articles_titles.csv)")
+    parser.add_argument("--workers", "-j", type=int, default=DEFAULT_WORKERS,
+                        help=f"Nombre de threads de lecture (défaut: {DEFAULT_WORKERS})")
+    parser.add_argument("--ordre-dossiers", action="store_true",
+                        help="Écrit les lignes dans l'ordre alphabétique des dossiers "
+                             "(par défaut : dans l'ordre d'arrivée des résultats)")
+    parser.add_argument("--checkpoint",
+                        help="Fichier de reprise (défaut: <output>.checkpoint)")
+    parser.add_argument("--recommencer", action="store_true",
+                        help="Ignore le fichier de reprise et refait l'inventaire complet")
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers doit être supérieur ou égal à 1")
+
     # Répertoire de base contenant les articles WordPress
-    base_dir = Path("wordpress-content-to-sort")
-    
-    # Liste pour stocker les titres
-    titles = []
-    
-    # Parcourir tous les dossiers dans le répertoire de base
-    for folder in sorted(base_dir.iterdir()):
-        if folder.is_dir():
-            index_file = folder / "index.md"
-            if index_file.exists():
-                title = extract_title_from_markdown(index_file)
-                if title:
-                    titles.append({
-                        'folder': folder.name,
-                        'title': title
-                    })
-                    print(f"Trouvé: {title}")
-                else:
-                    print(f"Aucun titre trouvé dans: {folder.name}")
-    
-    # Créer le fichier CSV
-    csv_filename = "wordpress_articles_titles.csv"
-    with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['folder', 'title']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        # Écrire l'en-tête
-        writer.writeheader()
-        
-        # Écrire les données
-        for item in titles:
-            writer.writerow(item)
-    
-    print(f"\nFichier CSV créé: {csv_filename}")
-    print(f"Nombre d'articles traités: {len(titles)}")
+    base_dir = Path(args.base_dir)
+
+    # Cache des titres : seuls les index.md modifiés sont relus
+    cache = None if args.no_cache else TitleCache(Path(DEFAULT_CACHE_NAME))
+
+    checkpoint = Path(args.checkpoint) if args.checkpoint else None
+    try:
+        ecrits, deja_traites = inventorier(base_dir, args.output, cache, args.workers, args.ordre_dossiers,
+                                           checkpoint, reprendre=not args.recommencer)
+    except KeyboardInterrupt:
+        print("\n🛑 Inventaire interrompu : relancer la même commande pour le reprendre")
+        return
+    finally:
+        if cache is not None:
+            cache.save()
+
+    if cache is not None:
+        cache.prune()
+        cache.save()
+
+    print(f"\nFichier CSV créé: {args.output}")
+    print(f"Nombre d'articles traités: {ecrits}")
+    if deja_traites:
+        print(f"Dossiers repris d'une exécution précédente: {deja_traites}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Modes de liaison des fichiers copiés vers leur destination
+
+Les exports WordPress sont surtout composés d'images : plutôt que de
+dupliquer chaque octet, un fichier de destination peut partager le contenu
+de sa source :
+- copy : copie complète (shutil.copy2), comportement historique ;
+- hardlink : lien physique (même inode, même système de fichiers) ;
+- reflink : clone copy-on-write (ioctl FICLONE sur btrfs, XFS...), sinon
+  copy_file_range (copie dans le noyau, qui partage aussi les blocs quand le
+  système de fichiers le permet) ;
+- symlink : lien symbolique vers le chemin absolu de la source.
+
+Quand le mode demandé n'est pas possible (systèmes de fichiers différents,
+FICLONE non supporté...), le fichier est copié normalement. Chaque fonction
+renvoie le mode réellement utilisé, pour le rapport.
+"""
+
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+MODES_LIAISON = ('copy', 'hardlink', 'reflink', 'symlink')
+
+# ioctl Linux FICLONE : _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+LIBELLES_MODES = {
+    'copy': 'copie',
+    'hardlink': 'lien physique',
+    'reflink': 'reflink',
+    'copy_file_range': 'copy_file_range',
+    'symlink': 'lien symbolique',
+}
+
+
+def _cloner(source, destination):
+    """
+    Clone le contenu de source dans destination sans dupliquer les blocs
+
+    Returns:
+        str: 'reflink' (FICLONE), 'copy_file_range' ou 'copy' (copie normale)
+    """
+    with open(source, 'rb') as f_source, open(destination, 'wb') as f_dest:
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(f_dest.fileno(), FICLONE, f_source.fileno())
+                return 'reflink'
+            except OSError:
+                pass
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                taille = os.fstat(f_source.fileno()).st_size
+                copie = 0
+                while copie < taille:
+                    octets = os.copy_file_range(f_source.fileno(), f_dest.fileno(), taille - copie)
+                    if octets == 0:
+                        break
+                    copie += octets
+                return 'copy_file_range'
+            except OSError:
+                # Anciens noyaux : pas de copy_file_range entre systèmes de fichiers
+                f_dest.seek(0)
+                f_dest.truncate()
+
+        f_source.seek(0)
+        shutil.copyfileobj(f_source, f_dest)
+        return 'copy'
+
+
+def lier_fichier(source, destination, mode='copy'):
+    """
+    Crée destination à partir de source selon le mode demandé, avec repli
+    sur une copie normale si ce mode n'est pas possible
+
+    Une destination existante est d'abord supprimée : écrire à travers un
+    lien créé par une exécution précédente modifierait la source.
+
+    Args:
+        source (str): Fichier source
+        destination (str): Fichier à créer
+        mode (str): Un des MODES_LIAISON
+
+    Returns:
+        str: Mode réellement utilisé ('copy', 'hardlink', 'reflink',
+             'copy_file_range' ou 'symlink')
+    """
+    if os.path.lexists(destination) and not os.path.isdir(destination):
+        os.unlink(destination)
+
+    if mode == 'hardlink':
+        try:
+            os.link(source, destination)
+            return 'hardlink'
+        except OSError:
+            pass
+    elif mode == 'symlink':
+        try:
+            os.symlink(os.path.abspath(source), destination)
+            return 'symlink'
+        except OSError:
+            pass
+    elif mode == 'reflink':
+        utilise = _cloner(source, destination)
+        shutil.copystat(source, destination)
+        return utilise
+
+    shutil.copy2(source, destination)
+    return 'copy'
+
+
+def lier_arborescence(source, destination, mode='copy', bilan=None):
+    """
+    Équivalent de shutil.copytree où chaque fichier est créé par lier_fichier
+
+    Args:
+        source (str): Dossier source
+        destination (str): Dossier à créer (ne doit pas exister)
+        mode (str): Un des MODES_LIAISON
+        bilan (dict, optional): Complété au fil des fichiers : 'modes'
+            (Counter des modes réellement utilisés), 'fichiers' et 'octets'
+
+    Returns:
+        str: Chemin du dossier de destination
+    """
+    def lier(chemin_source, chemin_dest):
+        utilise = lier_fichier(chemin_source, chemin_dest, mode)
+        if bilan is not None:
+            bilan['modes'][utilise] += 1
+            bilan['fichiers'] += 1
+            bilan['octets'] += os.stat(chemin_source).st_size
+        return chemin_dest
+
+    return shutil.copytree(source, destination, copy_function=lier)
+
+
+def decrire_modes(modes):
+    """
+    Résumé lisible d'un compteur de modes (ex. "12 reflink, 1 copie")
+
+    Args:
+        modes (Counter): Nombre de fichiers par mode réellement utilisé
+
+    Returns:
+        str: Résumé, du mode le plus utilisé au moins utilisé
+    """
+    if not modes:
+        return "aucun fichier"
+    return ", ".join(f"{nombre} {LIBELLES_MODES.get(mode, mode)}" for mode, nombre in modes.most_common())
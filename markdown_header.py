@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Lecture en flux de l'en-tête d'un fichier Markdown.
+
+Le titre se trouve presque toujours dans les premières lignes : le front
+matter YAML ou le premier titre '# '. Le fichier est donc lu ligne par ligne
+et la lecture s'arrête dès que le titre est trouvé, ou après MAX_HEADER_BYTES
+octets, au lieu de charger tout le fichier en mémoire.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+# Nombre maximal d'octets lus pour trouver le titre
+MAX_HEADER_BYTES = 64 * 1024
+
+# Identifiant enregistré dans le cache des titres (title_cache.TitleCache) :
+# à incrémenter si le résultat de read_markdown_header change
+EXTRACTOR_ID = "markdown_header/1"
+
+FRONT_MATTER_DELIMITER = '---'
+H1_PATTERN = re.compile(r'^#\s+(.+)$')
+TITLE_PATTERN = re.compile(r'^title:\s*["\']?([^"\']*)["\']?$')
+
+
+def _parse_front_matter(lines) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Analyse les lignes du front matter et retourne (titre, front matter).
+
+    Si le YAML est invalide (fréquent dans les exports WordPress), le titre est
+    recherché ligne par ligne avec une expression régulière.
+    """
+    try:
+        front_matter = yaml.safe_load(''.join(lines))
+    except yaml.YAMLError:
+        front_matter = None
+
+    if isinstance(front_matter, dict):
+        title = front_matter.get('title')
+        return title, front_matter
+
+    for line in lines:
+        match = TITLE_PATTERN.match(line.rstrip('\r\n'))
+        if match:
+            return match.group(1).strip(), None
+    return None, None
+
+
+def read_markdown_header(file_path: Path,
+                         max_bytes: int = MAX_HEADER_BYTES) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Lit le début d'un fichier Markdown et retourne (titre, front matter).
+
+    Le titre provient du champ 'title' du front matter, sinon du premier
+    titre '# '. Il vaut None si aucun n'est trouvé dans les max_bytes premiers
+    octets. Les erreurs de lecture ou de décodage sont propagées.
+    """
+    scanned = 0
+    front_matter_lines = None
+    in_front_matter = False
+    front_matter = None
+
+    with open(file_path, 'rb') as f:
+        while scanned < max_bytes:
+            raw = f.readline(max_bytes - scanned)
+            if not raw:
+                break
+            first_line = scanned == 0
+            scanned += len(raw)
+            if scanned >= max_bytes and not raw.endswith(b'\n'):
+                # Ligne tronquée par la limite : ne pas la décoder à moitié
+                break
+            line = raw.decode('utf-8')
+            if first_line:
+                line = line.lstrip('\ufeff')
+
+            if first_line and line.rstrip() == FRONT_MATTER_DELIMITER:
+                in_front_matter = True
+                front_matter_lines = []
+                continue
+
+            if in_front_matter:
+                if line.rstrip() == FRONT_MATTER_DELIMITER:
+                    # Fin du front matter : s'arrêter si le titre y figure
+                    in_front_matter = False
+                    title, front_matter = _parse_front_matter(front_matter_lines)
+                    if title is not None:
+                        return title, front_matter
+                else:
+                    front_matter_lines.append(line)
+                continue
+
+            match = H1_PATTERN.match(line.strip())
+            if match:
+                return match.group(1).strip(), front_matter
+
+    return None, front_matter
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Optimisation des images des articles WordPress copiés
+
+Les exports WordPress contiennent les images téléversées en pleine taille
+(plusieurs Mo par photo) : copiées telles quelles, elles alourdissent les
+pages DSFR. Après la copie, chaque image JPEG ou PNG de la destination est :
+- réduite à une largeur maximale (proportions conservées) ;
+- réencodée sans ses métadonnées (EXIF, XMP, commentaires), l'orientation
+  EXIF étant appliquée aux pixels avant d'être supprimée ;
+- accompagnée d'une version WebP (<image>.jpg.webp) quand elle est plus
+  légère, que nginx peut servir aux navigateurs qui l'acceptent.
+
+Les résultats sont rangés dans un cache adressé par le contenu : la clé est
+l'empreinte SHA-256 de l'image source et les paramètres d'encodage. Une image
+inchangée n'est donc jamais réencodée d'une exécution à l'autre, même si
+l'article est recopié intégralement. Le résultat est aussi enregistré sous sa
+propre empreinte : une image déjà optimisée est reconnue sans réencodage.
+
+Les images sont traitées par un pool de processus (l'encodage est limité par
+le CPU). Pillow est une dépendance optionnelle : sans lui, l'étape n'est pas
+disponible (voir Image).
+"""
+
+import hashlib
+import io
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # dépendance optionnelle (pip install Pillow)
+    Image = ImageOps = None
+
+VERSION_CACHE = 2
+DOSSIER_CACHE = '.medias-cache'
+LARGEUR_MAX = 1600
+QUALITE = 82
+EXTENSION_WEBP = '.webp'
+
+# Format Pillow de chaque extension traitée
+FORMATS_IMAGES = {
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.png': 'PNG',
+}
+
+
+def lister_images(destination):
+    """
+    Liste les images à optimiser d'une destination (dossier ou fichier)
+
+    Les fichiers cachés (manifestes de synchronisation...) sont ignorés.
+
+    Args:
+        destination (str): Dossier ou fichier copié
+
+    Returns:
+        list: Chemins des images, dans l'ordre du parcours
+    """
+    if os.path.isfile(destination):
+        candidats = [destination]
+    else:
+        candidats = []
+        for dossier, sous_dossiers, noms in os.walk(destination):
+            sous_dossiers[:] = sorted(nom for nom in sous_dossiers if not nom.startswith('.'))
+            candidats.extend(os.path.join(dossier, nom) for nom in sorted(noms) if not nom.startswith('.'))
+    return [chemin for chemin in candidats
+            if os.path.splitext(chemin)[1].lower() in FORMATS_IMAGES and not os.path.islink(chemin)]
+
+
+def cle_parametres(largeur_max, qualite):
+    """Partie de la clé du cache qui dépend des paramètres d'encodage"""
+    return f"v{VERSION_CACHE}-l{largeur_max}-q{qualite}"
+
+
+def _chemin_cache(repertoire_cache, empreinte, cle, extension):
+    """Chemin d'un résultat dans le cache (sous-dossier par préfixe d'empreinte)"""
+    return os.path.join(repertoire_cache, empreinte[:2], f"{empreinte}-{cle}{extension}")
+
+
+def _ecrire_atomique(chemin, donnees, modele=None):
+    """
+    Écrit un fichier via un fichier temporaire puis un renommage
+
+    Le renommage remplace l'entrée du répertoire sans écrire dans l'ancien
+    fichier : une destination liée à sa source (lien physique ou symbolique,
+    voir liaison.py) ne modifie jamais la source.
+
+    Args:
+        chemin (str): Fichier à écrire
+        donnees (bytes): Contenu
+        modele (str, optional): Fichier dont les permissions sont reprises
+    """
+    os.makedirs(os.path.dirname(chemin) or '.', exist_ok=True)
+    temporaire = f"{chemin}.{os.getpid()}.tmp"
+    with open(temporaire, 'wb') as f:
+        f.write(donnees)
+    if modele is not None:
+        shutil.copymode(modele, temporaire)
+    os.replace(temporaire, chemin)
+
+
+def _lier_cache(existant, alias):
+    """Enregistre un résultat du cache sous une seconde clé (lien physique, sinon copie)"""
+    if os.path.exists(alias):
+        return
+    os.makedirs(os.path.dirname(alias), exist_ok=True)
+    temporaire = f"{alias}.{os.getpid()}.tmp"
+    try:
+        os.link(existant, temporaire)
+    except OSError:
+        shutil.copyfile(existant, temporaire)
+    os.replace(temporaire, alias)
+
+
+def encoder_image(donnees, format_image, largeur_max, qualite, webp=True):
+    """
+    Réduit et réencode une image sans ses métadonnées
+
+    Args:
+        donnees (bytes): Contenu de l'image source
+        format_image (str): Format Pillow de sortie ('JPEG' ou 'PNG')
+        largeur_max (int): Largeur maximale en pixels
+        qualite (int): Qualité JPEG et WebP (1-95)
+        webp (bool): Si True, produit aussi une version WebP
+
+    Returns:
+        tuple: (bytes, bytes|None) - image réencodée et version WebP. Le
+        réencodage est conservé même s'il n'est pas plus léger que la source :
+        il est le seul à garantir l'absence de métadonnées
+    """
+    with Image.open(io.BytesIO(donnees)) as originale:
+        image = ImageOps.exif_transpose(originale)
+        image.load()
+    # Le profil de couleurs n'est pas une métadonnée : il est conservé
+    profil = originale.info.get('icc_profile')
+    reduite = image.width > largeur_max
+    if reduite:
+        hauteur = max(1, round(image.height * largeur_max / image.width))
+        image = image.resize((largeur_max, hauteur), Image.LANCZOS)
+
+    options = {'icc_profile': profil} if profil else {}
+    sortie = io.BytesIO()
+    if format_image == 'JPEG':
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        image.save(sortie, 'JPEG', quality=qualite, optimize=True, progressive=True, **options)
+    else:
+        image.save(sortie, 'PNG', optimize=True, **options)
+    resultat = sortie.getvalue()
+
+    version_webp = None
+    if webp:
+        if image.mode not in ('RGB', 'RGBA'):
+            transparente = 'A' in image.mode or 'transparency' in image.info
+            image = image.convert('RGBA' if transparente else 'RGB')
+        sortie = io.BytesIO()
+        image.save(sortie, 'WEBP', quality=qualite, **options)
+        version_webp = sortie.getvalue()
+    return resultat, version_webp
+
+
+def optimiser_image(chemin, largeur_max=LARGEUR_MAX, qualite=QUALITE, webp=True, repertoire_cache=DOSSIER_CACHE):
+    """
+    Optimise une image en place, en passant par le cache
+
+    Fonction de niveau module pour pouvoir être envoyée à un pool de processus.
+
+    Args:
+        chemin (str): Image de la destination
+        largeur_max (int): Largeur maximale en pixels
+        qualite (int): Qualité JPEG et WebP (1-95)
+        webp (bool): Si True, écrit aussi <chemin>.webp
+        repertoire_cache (str): Dossier du cache des résultats
+
+    Returns:
+        dict: Bilan de l'image : statut ('encodee', 'cache' ou 'erreur'),
+              octets avant et après optimisation, octets de la version WebP,
+              message en cas d'erreur
+    """
+    bilan = {'chemin': chemin, 'statut': 'cache', 'avant': 0, 'apres': 0, 'webp': 0}
+    try:
+        with open(chemin, 'rb') as f:
+            donnees = f.read()
+        bilan['avant'] = bilan['apres'] = len(donnees)
+
+        extension = os.path.splitext(chemin)[1].lower()
+        cle = cle_parametres(largeur_max, qualite)
+        empreinte = hashlib.sha256(donnees).hexdigest()
+        en_cache = _chemin_cache(repertoire_cache, empreinte, cle, extension)
+        en_cache_webp = _chemin_cache(repertoire_cache, empreinte, cle, EXTENSION_WEBP)
+
+        if os.path.exists(en_cache) and (not webp or os.path.exists(en_cache_webp)):
+            with open(en_cache, 'rb') as f:
+                resultat = f.read()
+        else:
+            resultat, version_webp = encoder_image(donnees, FORMATS_IMAGES[extension], largeur_max, qualite, webp)
+            bilan['statut'] = 'encodee'
+            _ecrire_atomique(en_cache, resultat)
+            if version_webp is not None:
+                _ecrire_atomique(en_cache_webp, version_webp)
+            # Une image déjà optimisée retrouvera ce résultat sans réencodage
+            empreinte_resultat = hashlib.sha256(resultat).hexdigest()
+            if empreinte_resultat != empreinte:
+                _lier_cache(en_cache, _chemin_cache(repertoire_cache, empreinte_resultat, cle, extension))
+                if version_webp is not None:
+                    _lier_cache(en_cache_webp,
+                                _chemin_cache(repertoire_cache, empreinte_resultat, cle, EXTENSION_WEBP))
+
+        if resultat != donnees:
+            _ecrire_atomique(chemin, resultat, modele=chemin)
+        bilan['apres'] = len(resultat)
+
+        if webp:
+            # Une version WebP plus lourde que l'image optimisée n'est pas servie
+            chemin_webp = chemin + EXTENSION_WEBP
+            taille_webp = os.path.getsize(en_cache_webp)
+            if taille_webp >= len(resultat):
+                if os.path.isfile(chemin_webp):
+                    os.remove(chemin_webp)
+            else:
+                if not os.path.isfile(chemin_webp) or os.path.getsize(chemin_webp) != taille_webp:
+                    temporaire = f"{chemin_webp}.{os.getpid()}.tmp"
+                    shutil.copyfile(en_cache_webp, temporaire)
+                    os.replace(temporaire, chemin_webp)
+                bilan['webp'] = taille_webp
+    except Image.UnidentifiedImageError:
+        bilan['statut'] = 'erreur'
+        bilan['message'] = "format d'image non reconnu"
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        bilan['statut'] = 'erreur'
+        bilan['message'] = f"{type(e).__name__}: {e}"
+    return bilan
+
+
+def optimiser_medias(destinations, largeur_max=LARGEUR_MAX, qualite=QUALITE, webp=True, jobs=None,
+                     repertoire_cache=DOSSIER_CACHE):
+    """
+    Optimise les images de plusieurs destinations sur un pool de processus
+
+    Args:
+        destinations (list): Dossiers ou fichiers copiés (un par article)
+        largeur_max (int): Largeur maximale en pixels
+        qualite (int): Qualité JPEG et WebP (1-95)
+        webp (bool): Si True, produit aussi les versions WebP
+        jobs (int, optional): Nombre de processus (défaut : nombre de CPU)
+        repertoire_cache (str): Dossier du cache des résultats
+
+    Returns:
+        dict: Bilan par destination, dans l'ordre reçu : images, encodees,
+              cache, octets_avant, octets_apres, octets_webp, optimisees
+              (chemins des images traitées sans erreur) et erreurs (liste de
+              (chemin, message))
+    """
+    if Image is None:
+        raise RuntimeError("Pillow n'est pas installé (pip install Pillow)")
+
+    bilans = {}
+    taches = []
+    for destination in destinations:
+        bilans[destination] = {'images': 0, 'encodees': 0, 'cache': 0, 'octets_avant': 0,
+                               'octets_apres': 0, 'octets_webp': 0, 'optimisees': [], 'erreurs': []}
+        taches.extend((destination, chemin) for chemin in lister_images(destination))
+    if not taches:
+        return bilans
+
+    repertoire_cache = os.path.abspath(repertoire_cache)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(optimiser_image, chemin, largeur_max, qualite, webp, repertoire_cache): destination
+                   for destination, chemin in taches}
+        for future in as_completed(futures):
+            bilan_image = future.result()
+            bilan = bilans[futures[future]]
+            bilan['images'] += 1
+            if bilan_image['statut'] == 'erreur':
+                bilan['erreurs'].append((bilan_image['chemin'], bilan_image['message']))
+                continue
+            bilan['encodees' if bilan_image['statut'] == 'encodee' else 'cache'] += 1
+            bilan['optimisees'].append(bilan_image['chemin'])
+            bilan['octets_avant'] += bilan_image['avant']
+            bilan['octets_apres'] += bilan_image['apres']
+            bilan['octets_webp'] += bilan_image['webp']
+    return bilans
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Mode --watch de update_nav.py : surveille le dossier 'docs' et met à jour la
+section 'nav' du fichier mkdocs.yml au fil des modifications.
+
+L'arbre des répertoires et les titres sont gardés en mémoire. À chaque
+création, suppression, renommage ou modification d'un fichier Markdown, seul
+le sous-arbre concerné est relu ; les rafales d'événements sont regroupées
+(debounce) avant une unique écriture de mkdocs.yml, et seulement si la
+navigation a changé.
+
+Les événements proviennent d'inotify (Linux, via ctypes) ou, à défaut, d'une
+scrutation périodique de l'arborescence.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from run_events import EventLog
+from title_cache import TitleCache
+from update_nav import (DirectoryNode, _scan_entries, build_nav, extract_titles,
+                        walk_directory, write_nav)
+
+# Constantes inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+              | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _is_relevant(path: Path, is_dir: bool) -> bool:
+    """Seuls les dossiers non cachés et les fichiers .md influencent la navigation."""
+    if path.name.startswith('.'):
+        return False
+    return is_dir or path.suffix == '.md'
+
+
+class InotifySource:
+    """Source d'événements inotify : une surveillance par répertoire non caché."""
+
+    def __init__(self, docs_dir: Path):
+        libc_name = ctypes.util.find_library('c')
+        if libc_name is None:
+            raise OSError("libc introuvable")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError("inotify non disponible")
+
+        self._fd = self._libc.inotify_init1(IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._watches: Dict[int, Path] = {}
+        self.docs_dir = docs_dir
+        self.add_tree(docs_dir)
+
+    def add_tree(self, directory: Path):
+        """Ajoute une surveillance sur un répertoire et ses sous-répertoires non cachés."""
+        for current, subdirs, _ in os.walk(directory):
+            subdirs[:] = [name for name in subdirs if not name.startswith('.')]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(current), WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = Path(current)
+
+    def remove_tree(self, directory: Path):
+        """Retire les surveillances d'un répertoire déplacé hors de sa position et de ses sous-répertoires."""
+        for wd, path in list(self._watches.items()):
+            if path == directory or directory in path.parents:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+    def read(self, timeout: Optional[float]) -> Set[Path]:
+        """Attend des événements pendant au plus timeout secondes (None = indéfiniment)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        data = os.read(self._fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Événements perdus : tout relire
+                changed.add(self.docs_dir)
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = directory / os.fsdecode(name)
+            is_dir = bool(mask & IN_ISDIR)
+            if not _is_relevant(path, is_dir):
+                continue
+            if is_dir and mask & IN_MOVED_FROM:
+                self.remove_tree(path)
+            if is_dir and mask & (IN_CREATE | IN_MOVED_TO):
+                self.add_tree(path)
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingSource:
+    """Source d'événements par scrutation périodique (dates et tailles des fichiers)."""
+
+    def __init__(self, docs_dir: Path, interval: float):
+        self.docs_dir = docs_dir
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[Path, Any]:
+        snapshot = {}
+        pending = [self.docs_dir]
+        while pending:
+            directory = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                path = directory / entry.name
+                if entry.is_dir():
+                    if _is_relevant(path, True):
+                        snapshot[path] = None
+                        pending.append(path)
+                elif entry.is_file() and _is_relevant(path, False):
+                    stat = entry.stat()
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout: Optional[float]) -> Set[Path]:
+        """Attend un intervalle de scrutation (borné par timeout) et retourne les changements."""
+        delay = self.interval if timeout is None else min(timeout, self.interval)
+        time.sleep(delay)
+
+        snapshot = self._take_snapshot()
+        previous = self._snapshot
+        self._snapshot = snapshot
+        changed = set(snapshot.keys() ^ previous.keys())
+        changed.update(path for path, state in snapshot.items()
+                       if state is not None and previous.get(path, state) != state)
+        return changed
+
+    def close(self):
+        pass
+
+
+class NavWatcher:
+    """
+    Arbre des répertoires et titres gardés en mémoire, mis à jour par sous-arbre.
+    """
+
+    def __init__(self, docs_dir: Path, cache: Optional[TitleCache] = None, workers: int = 1):
+        self.docs_dir = docs_dir
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.root = walk_directory(docs_dir, self.executor)
+        self.nodes: Dict[Path, DirectoryNode] = {}
+        self._register(self.root)
+        self.titles = extract_titles(list(self.root.iter_md_files()), cache, self.executor)
+
+    def _register(self, node: DirectoryNode):
+        self.nodes[node.path] = node
+        for subdir in node.subdirs:
+            self._register(subdir)
+
+    def _forget(self, node: DirectoryNode):
+        self.nodes.pop(node.path, None)
+        for md_file in node.md_files:
+            self.titles.pop(md_file, None)
+        for subdir in node.subdirs:
+            self._forget(subdir)
+
+    def nav(self) -> List[Any]:
+        return build_nav(self.root, self.docs_dir, self.titles)
+
+    def _relist(self, directory: Path, invalidated: Set[Path]) -> List[Path]:
+        """
+        Relit le contenu d'un répertoire. Les sous-répertoires déjà connus et
+        non invalidés sont conservés tels quels ; les nouveaux sont parcourus.
+
+        Returns:
+            Fichiers Markdown apparus dans le sous-arbre relu
+        """
+        node = self.nodes[directory]
+        if not directory.is_dir():
+            return []
+
+        fresh = _scan_entries(DirectoryNode(directory))
+        known = {subdir.path: subdir for subdir in node.subdirs}
+        new_files = [md_file for md_file in fresh.md_files if md_file not in self.titles]
+
+        for md_file in node.md_files:
+            if md_file not in fresh.md_files:
+                self.titles.pop(md_file, None)
+
+        subdirs = []
+        for subdir in fresh.subdirs:
+            existing = known.pop(subdir.path, None)
+            if existing is not None and subdir.path not in invalidated:
+                subdirs.append(existing)
+                continue
+            if existing is not None:
+                self._forget(existing)
+            walked = walk_directory(subdir.path, self.executor)
+            self._register(walked)
+            new_files.extend(walked.iter_md_files())
+            subdirs.append(walked)
+
+        for removed in known.values():
+            self._forget(removed)
+
+        node.md_files = fresh.md_files
+        node.subdirs = subdirs
+        return new_files
+
+    def apply(self, changed: Set[Path]):
+        """Met à jour l'arbre et les titres pour un lot de chemins modifiés."""
+        if self.docs_dir in changed:
+            # Relecture complète (file d'événements inotify saturée...)
+            self.nodes.clear()
+            self.root = walk_directory(self.docs_dir, self.executor)
+            self._register(self.root)
+            self.titles = extract_titles(list(self.root.iter_md_files()), self.cache, self.executor)
+            return
+
+        to_relist = set()
+        invalidated = set()
+        to_refresh = set()
+        for path in changed:
+            if path.parent not in self.nodes:
+                # Le répertoire parent sera relu (nouveau dossier) ou est ignoré
+                continue
+            if path in self.nodes or path.is_dir():
+                # Dossier créé, supprimé ou renommé : relire le parent et tout le sous-arbre
+                to_relist.add(path.parent)
+                invalidated.add(path)
+            elif path.suffix == '.md':
+                if path.exists() != (path in self.titles):
+                    to_relist.add(path.parent)
+                if path.exists():
+                    to_refresh.add(path)
+
+        # Les répertoires les moins profonds d'abord : un dossier supprimé
+        # disparaît de self.nodes avant d'être relu
+        for directory in sorted(to_relist, key=lambda p: len(p.parts)):
+            if directory in self.nodes:
+                to_refresh.update(self._relist(directory, invalidated))
+
+        to_refresh = [path for path in to_refresh if path.parent in self.nodes and path.exists()]
+        self.titles.update(extract_titles(to_refresh, self.cache, self.executor))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def _open_source(docs_dir: Path, poll_interval: float, force_polling: bool):
+    if not force_polling:
+        try:
+            return InotifySource(docs_dir)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify indisponible ({e}), scrutation toutes les {poll_interval}s")
+    return PollingSource(docs_dir, poll_interval)
+
+
+def watch_nav(mkdocs_path: Path, docs_dir: Path, cache: Optional[TitleCache] = None, workers: int = 1,
+              debounce: float = 1.0, poll_interval: float = 2.0, force_polling: bool = False,
+              event_log: Optional[EventLog] = None, quiet: bool = False,
+              backup_path: Optional[Path] = None):
+    """
+    Surveille docs_dir et réécrit la section 'nav' de mkdocs.yml quand elle change.
+    S'arrête avec Ctrl+C.
+
+    Chaque mise à jour produit un événement 'mise_a_jour' et réécrit les
+    métriques Prometheus (nombre de mises à jour, durée de la dernière).
+    La sauvegarde backup_path est écrite à la première modification de mkdocs.yml.
+    """
+    if event_log is None:
+        event_log = EventLog('update_nav')
+    source = _open_source(docs_dir, poll_interval, force_polling)
+    start = time.perf_counter()
+    watcher = NavWatcher(docs_dir, cache, workers)
+
+    current_nav = watcher.nav()
+    written = write_nav(mkdocs_path, current_nav, backup_path)
+    if written:
+        backup_path = None
+    if cache is not None:
+        cache.prune()
+        cache.save()
+    updates = 0
+    event_log.emit('debut', docs_dir=str(docs_dir), mkdocs=str(mkdocs_path), surveillance=type(source).__name__,
+                duree_s=round(time.perf_counter() - start, 3))
+    if not quiet:
+        print(f"✅ Navigation {'mise à jour' if written else 'inchangée'} dans {mkdocs_path}")
+        print(f"👀 Surveillance de {docs_dir} ({type(source).__name__}), Ctrl+C pour arrêter")
+
+    pending: Set[Path] = set()
+    deadline = None
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            events = source.read(timeout)
+            if events:
+                pending |= events
+                deadline = time.monotonic() + debounce
+                continue
+            if not pending or time.monotonic() < deadline:
+                continue
+
+            start = time.perf_counter()
+            watcher.apply(pending)
+            new_nav = watcher.nav()
+            changed = new_nav != current_nav
+            if changed:
+                if write_nav(mkdocs_path, new_nav, backup_path):
+                    backup_path = None
+                current_nav = new_nav
+                updates += 1
+                if not quiet:
+                    print(f"🔄 {len(pending)} changement(s) : navigation mise à jour")
+            if cache is not None:
+                cache.save()
+            duration = time.perf_counter() - start
+            event_log.emit('mise_a_jour', changements=len(pending), nav_modifiee=changed,
+                        duree_s=round(duration, 4))
+            event_log.write_prometheus([
+                ('mises_a_jour', "Écritures de mkdocs.yml depuis le démarrage de la surveillance", updates),
+                ('changements', "Chemins modifiés traités par la dernière mise à jour",
+                 len(pending)),
+                ('duree_secondes', "Durée de la dernière mise à jour", round(duration, 4)),
+            ])
+            pending = set()
+            deadline = None
+    except KeyboardInterrupt:
+        event_log.emit('fin', mises_a_jour=updates)
+        if not quiet:
+            print("\n🛑 Surveillance arrêtée")
+    finally:
+        source.close()
+        watcher.close()
+        if cache is not None:
+            cache.prune()
+            cache.save()
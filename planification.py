@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Planification du tri WordPress : validation complète d'un fichier tri.csv
+avant toute copie.
+
+Le plan est construit en mémoire en une passe :
+- lecture du CSV et vérification des en-têtes attendus ('Destination ' avec
+  son espace final, notamment) ;
+- une seule lecture (os.scandir) par répertoire parent des sources, puis un
+  parcours par source distincte pour les tailles ;
+- détection des sources manquantes, des lignes écrivant au même endroit
+  (la dernière l'emporte), des destinations imbriquées dans une source (ou
+  l'inverse) et des cycles entre lignes dont la destination modifie la
+  source d'une autre.
+
+Le plan est affiché sous forme de résumé (texte) ou écrit en JSON ; un plan
+valide peut ensuite être exécuté par tri_wordpress.py (--executer-plan) sans
+nouvelle vérification du système de fichiers.
+"""
+
+import bisect
+import csv
+import json
+import os
+from datetime import datetime
+
+from tri_wordpress import detecter_conflits_destination, nettoyer_titre_pour_fichier
+
+PLAN_VERSION = 1
+
+# Colonnes de tri.csv utilisées par tri_wordpress.lire_fichier_tri
+COLONNES_REQUISES = ['Titre', "Répertoire d'export", 'Destination ']
+
+
+def _normaliser(chemin):
+    return os.path.normcase(os.path.abspath(chemin))
+
+
+def _contient(parent, chemin):
+    """Vrai si chemin est parent lui-même ou se trouve sous parent (chemins normalisés)."""
+    return chemin == parent or chemin.startswith(parent.rstrip(os.sep) + os.sep)
+
+
+def verifier_entetes(colonnes):
+    """
+    Vérifie la présence des colonnes requises.
+
+    Returns:
+        list: Messages d'erreur (vide si tout est présent)
+    """
+    colonnes = colonnes or []
+    erreurs = []
+    for requise in COLONNES_REQUISES:
+        if requise in colonnes:
+            continue
+        approchante = next((colonne for colonne in colonnes
+                            if colonne.strip().lower() == requise.strip().lower()), None)
+        if approchante is not None:
+            erreurs.append(f"Colonne '{requise}' absente (colonne '{approchante}' trouvée : "
+                           f"vérifier les espaces et la casse)")
+        else:
+            erreurs.append(f"Colonne '{requise}' absente")
+    return erreurs
+
+
+def lire_lignes(fichier_csv):
+    """
+    Lit le CSV en conservant le numéro de ligne de chaque enregistrement.
+
+    Returns:
+        tuple: (colonnes, liste de (numéro de ligne, dictionnaire de la ligne))
+    """
+    with open(fichier_csv, 'r', encoding='utf-8') as f:
+        lecteur = csv.DictReader(f)
+        lignes = [(lecteur.line_num, ligne) for ligne in lecteur]
+        return lecteur.fieldnames, lignes
+
+
+def lister_sources(chemins):
+    """
+    Type de chaque source ('dossier', 'fichier' ou None si absente), avec une
+    seule lecture de chaque répertoire parent.
+    """
+    par_parent = {}
+    for chemin in chemins:
+        par_parent.setdefault(os.path.dirname(chemin), set()).add(os.path.basename(chemin))
+
+    types = {}
+    for parent, noms in par_parent.items():
+        try:
+            with os.scandir(parent or '.') as entrees:
+                contenu = {entree.name: entree for entree in entrees if entree.name in noms}
+        except OSError:
+            contenu = {}
+        for nom in noms:
+            entree = contenu.get(nom)
+            if entree is not None and entree.is_dir():
+                type_source = 'dossier'
+            elif entree is not None and entree.is_file():
+                type_source = 'fichier'
+            else:
+                type_source = None
+            types[os.path.join(parent, nom)] = type_source
+    return types
+
+
+def mesurer_source(chemin, type_source):
+    """
+    Returns:
+        tuple: (nombre de fichiers, octets) à copier pour cette source
+    """
+    if type_source == 'fichier':
+        return 1, os.stat(chemin).st_size
+    fichiers = 0
+    octets = 0
+    a_parcourir = [chemin]
+    while a_parcourir:
+        courant = a_parcourir.pop()
+        try:
+            entrees = list(os.scandir(courant))
+        except OSError:
+            continue
+        for entree in entrees:
+            # copytree copie les liens symboliques comme les fichiers qu'ils désignent
+            if entree.is_dir():
+                a_parcourir.append(entree.path)
+            elif entree.is_file():
+                fichiers += 1
+                octets += entree.stat().st_size
+    return fichiers, octets
+
+
+def _chevauchements(destinations, sources):
+    """
+    Couples (i, j) où la destination de la ligne i contient la source de la
+    ligne j ou se trouve à l'intérieur (la copie i modifie ce que lit j).
+    """
+    ordre = sorted(range(len(sources)), key=lambda j: sources[j])
+    triees = [sources[j] for j in ordre]
+    par_chemin = {}
+    for j, source in enumerate(sources):
+        par_chemin.setdefault(source, []).append(j)
+
+    couples = []
+    for i, destination in enumerate(destinations):
+        # Sources contenant la destination (destination égale ou plus profonde)
+        parent = destination
+        while True:
+            couples.extend((i, j) for j in par_chemin.get(parent, ()))
+            suivant = os.path.dirname(parent)
+            if suivant == parent:
+                break
+            parent = suivant
+        # Sources situées sous la destination
+        prefixe = destination.rstrip(os.sep) + os.sep
+        position = bisect.bisect_left(triees, prefixe)
+        while position < len(triees) and triees[position].startswith(prefixe):
+            couples.append((i, ordre[position]))
+            position += 1
+    return couples
+
+
+def _composantes_cycliques(nombre, aretes):
+    """Composantes fortement connexes de plus d'un sommet (Tarjan, itératif)."""
+    voisins = [[] for _ in range(nombre)]
+    for i, j in aretes:
+        voisins[i].append(j)
+
+    index = [None] * nombre
+    bas = [0] * nombre
+    sur_pile = [False] * nombre
+    pile = []
+    compteur = 0
+    composantes = []
+
+    for depart in range(nombre):
+        if index[depart] is not None:
+            continue
+        travail = [(depart, 0)]
+        while travail:
+            sommet, position = travail.pop()
+            if position == 0:
+                index[sommet] = bas[sommet] = compteur
+                compteur += 1
+                pile.append(sommet)
+                sur_pile[sommet] = True
+            if position < len(voisins[sommet]):
+                travail.append((sommet, position + 1))
+                voisin = voisins[sommet][position]
+                if index[voisin] is None:
+                    travail.append((voisin, 0))
+                elif sur_pile[voisin]:
+                    bas[sommet] = min(bas[sommet], index[voisin])
+                continue
+            if bas[sommet] == index[sommet]:
+                composante = []
+                while True:
+                    membre = pile.pop()
+                    sur_pile[membre] = False
+                    composante.append(membre)
+                    if membre == sommet:
+                        break
+                if len(composante) > 1:
+                    composantes.append(sorted(composante))
+            if travail:
+                parent = travail[-1][0]
+                bas[parent] = min(bas[parent], bas[sommet])
+    return composantes
+
+
+def construire_plan(repertoire_base, fichier_csv):
+    """
+    Construit le plan de tri complet.
+
+    Returns:
+        dict: Plan sérialisable en JSON : 'operations' (une entrée par ligne
+        retenue, dans l'ordre du CSV), 'problemes', 'totaux' et 'valide'
+        (False si le plan contient des erreurs bloquantes)
+    """
+    colonnes, lignes = lire_lignes(fichier_csv)
+    problemes = {
+        'entetes': verifier_entetes(colonnes),
+        'lignes_ignorees': [],
+        'sources_manquantes': [],
+        'collisions': [],
+        'imbrications': [],
+        'cycles': [],
+        'dependances': [],
+    }
+
+    operations = []
+    if not problemes['entetes']:
+        for numero_ligne, ligne in lignes:
+            operation = {
+                'ligne': numero_ligne,
+                'titre': ligne.get('Titre') or '',
+                'chemin_actuel': ligne.get('Chemin actuel') or '',
+                'repertoire_export': ligne.get("Répertoire d'export") or '',
+                'destination': ligne.get('Destination ') or '',
+            }
+            # Mêmes lignes retenues que lire_fichier_tri
+            if not operation['repertoire_export'] or not operation['destination']:
+                problemes['lignes_ignorees'].append(numero_ligne)
+                continue
+            operation['nom_final'] = nettoyer_titre_pour_fichier(operation['titre'])
+            operation['source'] = os.path.normpath(os.path.join(repertoire_base, operation['repertoire_export']))
+            operation['destination_finale'] = os.path.join(operation['destination'], operation['nom_final'])
+            operations.append(operation)
+
+    # Lecture groupée du système de fichiers
+    types = lister_sources({operation['source'] for operation in operations})
+    mesures = {}
+    for operation in operations:
+        operation['type_source'] = types[operation['source']]
+        if operation['type_source'] is None:
+            problemes['sources_manquantes'].append({'ligne': operation['ligne'],
+                                                    'source': operation['source']})
+            operation['fichiers'], operation['octets'] = 0, 0
+            continue
+        if operation['source'] not in mesures:
+            mesures[operation['source']] = mesurer_source(operation['source'], operation['type_source'])
+        operation['fichiers'], operation['octets'] = mesures[operation['source']]
+
+    for index_groupe in detecter_conflits_destination(operations).values():
+        if len(index_groupe) > 1:
+            problemes['collisions'].append({
+                'destination': operations[index_groupe[0]]['destination_finale'],
+                'lignes': [operations[index]['ligne'] for index in index_groupe],
+                'gagnante': operations[index_groupe[-1]]['ligne'],
+            })
+
+    sources = [_normaliser(operation['source']) for operation in operations]
+    destinations = [_normaliser(operation['destination_finale']) for operation in operations]
+    aretes = []
+    for i, j in _chevauchements(destinations, sources):
+        if i == j:
+            if _contient(sources[i], destinations[i]):
+                raison = "destination à l'intérieur de la source"
+            else:
+                raison = "source à l'intérieur de la destination (supprimée avant la copie)"
+            problemes['imbrications'].append({'ligne': operations[i]['ligne'], 'raison': raison})
+            continue
+        aretes.append((i, j))
+        problemes['dependances'].append({
+            'ligne': operations[i]['ligne'],
+            'modifie_source_de': operations[j]['ligne'],
+        })
+    for composante in _composantes_cycliques(len(operations), aretes):
+        problemes['cycles'].append([operations[index]['ligne'] for index in composante])
+
+    executables = [operation for operation in operations if operation['type_source'] is not None]
+    erreurs = (len(problemes['entetes']) + len(problemes['imbrications']) + len(problemes['cycles']))
+    return {
+        'version': PLAN_VERSION,
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'repertoire_base': repertoire_base,
+        'fichier_csv': fichier_csv,
+        'operations': operations,
+        'problemes': problemes,
+        'totaux': {
+            'lignes': len(lignes),
+            'operations': len(operations),
+            'executables': len(executables),
+            'fichiers': sum(operation['fichiers'] for operation in executables),
+            'octets': sum(operation['octets'] for operation in executables),
+        },
+        'valide': erreurs == 0,
+    }
+
+
+def _taille_lisible(octets):
+    for unite in ('o', 'Ko', 'Mo', 'Go'):
+        if octets < 1024 or unite == 'Go':
+            return f"{octets:.1f} {unite}" if unite != 'o' else f"{octets} o"
+        octets /= 1024
+
+
+def afficher_plan(plan):
+    """Affiche le résumé du plan."""
+    totaux = plan['totaux']
+    problemes = plan['problemes']
+    print(f"🗺️  PLAN DE TRI : {plan['fichier_csv']}")
+    print("=" * 60)
+    for erreur in problemes['entetes']:
+        print(f"❌ {erreur}")
+    print(f"📄 {totaux['lignes']} ligne(s) lue(s), {totaux['operations']} opération(s)"
+          f", {len(problemes['lignes_ignorees'])} ignorée(s) (source ou destination vide)")
+    print(f"📦 {totaux['executables']} copie(s) exécutable(s) : {totaux['fichiers']} fichier(s), "
+          f"{_taille_lisible(totaux['octets'])}")
+
+    if problemes['sources_manquantes']:
+        print(f"\n⚠️  {len(problemes['sources_manquantes'])} source(s) manquante(s) (lignes non copiées) :")
+        for manquante in problemes['sources_manquantes']:
+            print(f"   - ligne {manquante['ligne']} : {manquante['source']}")
+    if problemes['collisions']:
+        print(f"\n⚠️  {len(problemes['collisions'])} destination(s) visée(s) par plusieurs lignes "
+              f"(la dernière l'emporte) :")
+        for collision in problemes['collisions']:
+            lignes = ", ".join(str(ligne) for ligne in collision['lignes'])
+            print(f"   - {collision['destination']} : lignes {lignes}")
+    if problemes['dependances']:
+        print(f"\n⚠️  {len(problemes['dependances'])} copie(s) modifiant la source d'une autre ligne "
+              f"(résultat dépendant de l'ordre) :")
+        for dependance in problemes['dependances']:
+            print(f"   - ligne {dependance['ligne']} -> source de la ligne {dependance['modifie_source_de']}")
+    if problemes['imbrications']:
+        print(f"\n❌ {len(problemes['imbrications'])} ligne(s) dont la source et la destination s'imbriquent :")
+        for imbrication in problemes['imbrications']:
+            print(f"   - ligne {imbrication['ligne']} : {imbrication['raison']}")
+    if problemes['cycles']:
+        print(f"\n❌ {len(problemes['cycles'])} cycle(s) entre lignes :")
+        for cycle in problemes['cycles']:
+            print(f"   - lignes {', '.join(str(ligne) for ligne in cycle)}")
+
+    print("\n" + "=" * 60)
+    if plan['valide']:
+        print("✅ Plan valide : exécutable avec --executer-plan")
+    else:
+        print("❌ Plan invalide : corriger tri.csv avant l'exécution")
+
+
+def ecrire_plan(plan, chemin):
+    """Écrit le plan en JSON."""
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, ensure_ascii=False, indent=2)
+
+
+def charger_plan(chemin):
+    """
+    Charge un plan JSON produit par ecrire_plan.
+
+    Raises:
+        ValueError: Version inconnue ou plan invalide
+    """
+    with open(chemin, 'r', encoding='utf-8') as f:
+        plan = json.load(f)
+    if plan.get('version') != PLAN_VERSION:
+        raise ValueError(f"version de plan non prise en charge : {plan.get('version')}")
+    if not plan.get('valide'):
+        raise ValueError("le plan contient des erreurs bloquantes")
+    return plan
@@ -4,8 +4,29 @@ from mkdocs.theme import Theme
 import os
 import logging
 
+from .assets import process_assets
+from .build_cache import create_build_cache
+from .bundles import build_bundles, template_globals
+from .nav_render import NavRenderer, lazy_nav_enabled
+from .search_index import build_search_index
+from .sitemap import build_sitemap, disable_mkdocs_sitemap
+
 logger = logging.getLogger('mkdocs')
 
+# Commande MkDocs en cours ('build', 'serve' ou 'gh-deploy') et option --dirty
+_command = None
+_dirty = False
+
+# Menu latéral de la génération en cours (recréé à chaque génération)
+_nav_renderer = None
+_nav = None
+
+# Fichiers de la génération en cours (pour le plan du site)
+_files = None
+
+# Génération incrémentale en cours (None pendant 'mkdocs serve' ou si désactivée)
+_build_cache = None
+
 class DSFRTheme(Theme):
     """Thème MkDocs conforme au Système de Design de l'État Français (DSFR)"""
     
@@ -14,13 +35,86 @@ class DSFRTheme(Theme):
             name='dsfr',
             static_templates={
                 '404.html',
-                'sitemap.xml',
-                'sitemap.xml.template',
             }
         ) 
 
+def on_startup(command, dirty):
+    """Hook de démarrage : mémorise la commande MkDocs en cours."""
+    global _command, _dirty
+    _command = command
+    _dirty = dirty
+
 def on_config(config):
-    """Hook pour le chargement de la configuration."""
+    """Hook pour le chargement de la configuration : le site est généré dans un répertoire temporaire."""
+    global _build_cache
     logger.info(f"Thème DSFR : {os.path.abspath(__file__)}")
     logger.info(f"Templates : {os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')}")
-    return config 
\ No newline at end of file
+    _build_cache = create_build_cache(config, _command, _dirty)
+    disable_mkdocs_sitemap(config)
+    return config
+
+def on_nav(nav, config, files):
+    """Hook pour la navigation : le menu latéral sera rendu une seule fois pour toutes les pages."""
+    global _nav_renderer, _nav
+    _nav_renderer = NavRenderer(nav, config.get('site_url'), lazy_nav_enabled(config))
+    _nav = nav
+    return nav
+
+def on_page_context(context, page, config, nav):
+    """Hook par page : menu latéral précalculé, avec le chemin de la page marqué actif."""
+    if _build_cache is not None:
+        # Menu inséré par on_post_page : le rendu mis en cache n'en dépend pas
+        return _build_cache.update_context(context, page)
+    if _nav_renderer is not None:
+        context['dsfr_nav_html'] = _nav_renderer.render(page)
+    return context
+
+def on_post_page(output, page, config):
+    """Hook par page : mise en cache du rendu, puis insertion du menu latéral."""
+    if _build_cache is None:
+        return output
+    return _build_cache.finish_page(output, page, _nav_renderer.render(page))
+
+def on_env(env, config, files):
+    """
+    Hook pour l'environnement Jinja : expose les fichiers regroupés aux
+    templates. Toutes les pages sont lues à ce stade : les pages inchangées
+    sont repérées avant le choix de leur template.
+    """
+    global _files
+    _files = files
+    env.globals['dsfr_bundles'] = template_globals(config)
+    env.globals['dsfr_nav_lazy'] = lazy_nav_enabled(config)
+    if _build_cache is not None:
+        _build_cache.plan(files, _nav)
+    return env
+
+def on_post_build(config):
+    """
+    Hook exécuté après la génération du site : menu différé, index de
+    recherche fragmenté, plan du site fragmenté, regroupement des CSS/JS, puis empreintes et précompression des fichiers
+    (en dernier, pour couvrir tout ce qui a été écrit avant). En génération
+    incrémentale, les pages inchangées sont reprises du site précédent avant
+    ces étapes (comme les fragments inchangés du plan du site), puis le site
+    généré remplace l'ancien.
+    """
+    classes = None
+    skip = ()
+    previous_site_dir = None
+    if _build_cache is not None:
+        classes = _build_cache.prepare_post_build()
+        skip = _build_cache.reused
+        previous_site_dir = _build_cache.site_dir
+    if _nav_renderer is not None and _nav_renderer.lazy:
+        _nav_renderer.write_payload(config['site_dir'])
+    build_search_index(config)
+    build_sitemap(config, _files, previous_site_dir)
+    build_bundles(config, _command, classes=classes, skip=skip)
+    process_assets(config, _command, skip=skip)
+    if _build_cache is not None:
+        _build_cache.commit()
+
+def on_build_error(error):
+    """Hook en cas d'échec : le répertoire temporaire est supprimé, le site précédent reste en place."""
+    if _build_cache is not None:
+        _build_cache.abort()
@@ -0,0 +1,155 @@
+"""Empreintes de contenu et précompression des fichiers du site généré.
+
+Après la génération du site :
+
+1. chaque fichier de static/css et static/js reçoit une copie nommée avec
+   l'empreinte de son contenu (custom.css -> custom.3f2a9c1b7e.css), et les
+   références produites par main.html et partials/*.html sont réécrites dans
+   les pages générées. Ces fichiers peuvent être mis en cache un an
+   (Cache-Control immutable) : un changement de contenu change leur nom ;
+2. les fichiers texte reçoivent des copies .gz (et .br si le module brotli
+   est installé), servies telles quelles par nginx (gzip_static /
+   brotli_static) sans compression à chaque requête.
+
+Les fichiers d'origine sont conservés pour les URL construites en JavaScript
+(search.worker.js, fragments de l'index de recherche...).
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    brotli = None
+
+logger = logging.getLogger('mkdocs')
+
+HASH_LENGTH = 10
+FINGERPRINT_DIRS = ('static/css', 'static/js')
+FINGERPRINT_EXTENSIONS = ('.css', '.js')
+FINGERPRINTED_NAME = re.compile(r'\.[0-9a-f]{%d}\.(css|js)$' % HASH_LENGTH)
+STATIC_REFERENCE = re.compile(r'''(?<=["'/])(static/(?:css|js)/[\w.\-]+\.(?:css|js))(?=["'?#])''')
+
+COMPRESS_EXTENSIONS = ('.html', '.css', '.js', '.json', '.xml', '.svg', '.txt', '.map')
+COMPRESS_MIN_SIZE = 256
+
+
+def _options(config):
+    options = {'fingerprint': True, 'precompress': True}
+    options.update(config['extra'].get('dsfr', {}).get('assets', {}))
+    return options
+
+
+def _content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def fingerprint_static(site_dir):
+    """
+    Crée les copies avec empreinte des fichiers CSS/JS.
+
+    Returns:
+        dict: Chemin relatif d'origine -> chemin relatif avec empreinte
+    """
+    mapping = {}
+    for directory in FINGERPRINT_DIRS:
+        absolute_dir = os.path.join(site_dir, directory)
+        if not os.path.isdir(absolute_dir):
+            continue
+        for name in sorted(os.listdir(absolute_dir)):
+            stem, extension = os.path.splitext(name)
+            if extension not in FINGERPRINT_EXTENSIONS or FINGERPRINTED_NAME.search(name):
+                continue
+            source = os.path.join(absolute_dir, name)
+            hashed_name = f"{stem}.{_content_hash(source)}{extension}"
+            shutil.copy2(source, os.path.join(absolute_dir, hashed_name))
+            mapping[f"{directory}/{name}"] = f"{directory}/{hashed_name}"
+    return mapping
+
+
+def _iter_files(site_dir, extensions):
+    # Les fichiers cachés (manifestes) ne sont pas servis par nginx
+    for directory, _, names in os.walk(site_dir):
+        for name in names:
+            if name.endswith(extensions) and not name.startswith('.'):
+                yield os.path.join(directory, name)
+
+
+def rewrite_references(site_dir, mapping, skip=()):
+    """
+    Remplace les références aux fichiers CSS/JS par leur nom avec empreinte
+    dans les pages HTML (sauf les chemins de skip, déjà à jour).
+    """
+    def replace(match):
+        return mapping.get(match.group(1), match.group(1))
+
+    rewritten = 0
+    for path in _iter_files(site_dir, ('.html',)):
+        if path in skip:
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content = STATIC_REFERENCE.sub(replace, content)
+        if new_content != content:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+            rewritten += 1
+    return rewritten
+
+
+def _compress_file(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return 0
+
+    # mtime=0 : sortie identique d'une génération à l'autre
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+    return 1
+
+
+def precompress(site_dir, workers=None, skip=()):
+    """Écrit les copies .gz (et .br) des fichiers texte du site (sauf ceux de skip)."""
+    files = [path for path in _iter_files(site_dir, COMPRESS_EXTENSIONS) if path not in skip]
+    # zlib et brotli libèrent le GIL : des threads suffisent
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(_compress_file, files))
+
+
+def process_assets(config, command=None, skip=()):
+    """
+    Empreintes puis précompression du site généré.
+
+    Ignoré pendant 'mkdocs serve', où ces étapes ralentiraient chaque rechargement.
+    skip : pages reprises telles quelles de la génération précédente (build_cache.py).
+    """
+    if command == 'serve':
+        return
+
+    site_dir = config['site_dir']
+    options = _options(config)
+
+    if options['fingerprint']:
+        mapping = fingerprint_static(site_dir)
+        rewritten = rewrite_references(site_dir, mapping, skip)
+        logger.info(f"Thème DSFR : {len(mapping)} fichier(s) CSS/JS avec empreinte, "
+                    f"{rewritten} page(s) mise(s) à jour")
+
+    if options['precompress']:
+        compressed = precompress(site_dir, skip=skip)
+        formats = 'gzip + brotli' if brotli is not None else 'gzip'
+        logger.info(f"Thème DSFR : {compressed} fichier(s) précompressé(s) ({formats})")
@@ -0,0 +1,324 @@
+"""Génération incrémentale : seules les pages dont les entrées ont changé sont rendues.
+
+Pour chaque page, le cache (.dsfr-build-cache/ à côté de mkdocs.yml) mémorise
+ses dépendances et le HTML produit par main.html :
+
+- entrées du rendu : contenu Markdown converti, titre et URL de la page,
+  entrées de navigation affichées (fil d'Ariane : sections parentes et page
+  d'accueil), modèle utilisé. Les modèles et hooks du thème et la
+  configuration forment une clé commune à toutes les pages ;
+- le menu latéral, qui contient tous les titres de la navigation, n'est pas
+  rendu dans la page mise en cache : un marqueur y est remplacé par le menu
+  de NavRenderer. Un titre modifié par update_nav ne fait donc rendre de
+  nouveau que la page concernée et les pages dont le fil d'Ariane l'affiche ;
+- fichiers statiques référencés (static/css, static/js), dont le contenu
+  détermine les noms avec empreinte (assets.py), et feuille critique
+  (bundles.py) : si ni la page ni ces fichiers n'ont changé, la page finale
+  de la génération précédente (et ses copies .gz/.br) est reprise telle
+  quelle, sans repasser par les étapes de fin de génération.
+
+Une page inchangée n'est pas rendue par Jinja : le modèle CACHED_TEMPLATE
+restitue le HTML mis en cache. La conversion Markdown reste faite pour
+toutes les pages (l'index de recherche et la vérification des ancres en
+ont besoin).
+
+Le site est généré dans un répertoire temporaire voisin (site_dir +
+STAGING_SUFFIX), échangé avec site_dir à la fin de la génération
+(renameat2(RENAME_EXCHANGE) sous Linux, deux renommages ailleurs) : une
+génération interrompue ou en échec laisse le site précédent intact.
+
+Actif pour 'mkdocs build' et 'mkdocs gh-deploy' (ni 'serve', ni --dirty).
+Options : extra.dsfr.build_cache.enabled (défaut : true) et
+extra.dsfr.build_cache.dir (défaut : .dsfr-build-cache).
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+import mkdocs
+
+from .assets import FINGERPRINT_DIRS, STATIC_REFERENCE, brotli
+from .bundles import CRITICAL_MARKER, CSS_BUNDLE, CSS_DIR, CSS_SOURCES, JS_BUNDLES, JS_DIR, collect_used_classes
+
+logger = logging.getLogger('mkdocs')
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = '.dsfr-build-cache'
+MANIFEST_NAME = 'manifest.json'
+PAGES_DIR = 'pages'
+STAGING_SUFFIX = '.dsfr-tmp'
+CACHED_TEMPLATE = 'dsfr_cached.html'
+NAV_MARKER = '<!-- dsfr:nav -->'
+# Fichiers du thème qui déterminent le rendu (les fichiers statiques sont suivis page par page)
+THEME_EXTENSIONS = ('.html', '.py', '.yml', '.po', '.mo')
+IGNORED_THEME_DIRS = ('static', '__pycache__')
+# Clés de configuration utilisées par les modèles et la conversion Markdown
+CONFIG_KEYS = ('site_name', 'site_url', 'site_description', 'site_author', 'copyright', 'repo_url',
+               'edit_uri', 'use_directory_urls', 'extra', 'extra_css', 'extra_javascript',
+               'markdown_extensions', 'mdx_configs', 'theme', 'hooks')
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
+
+def _options(config):
+    options = {'enabled': True, 'dir': DEFAULT_CACHE_DIR}
+    options.update(config['extra'].get('dsfr', {}).get('build_cache', {}))
+    return options
+
+
+def _digest(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(json.dumps(part, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _theme_files(config):
+    """Empreinte des modèles, traductions et hooks de chaque répertoire du thème."""
+    files = {}
+    for theme_dir in config['theme'].dirs:
+        for directory, subdirs, names in os.walk(theme_dir):
+            subdirs[:] = [name for name in subdirs if name not in IGNORED_THEME_DIRS]
+            for name in names:
+                if name.endswith(THEME_EXTENSIONS):
+                    path = os.path.join(directory, name)
+                    files[path] = _file_hash(path)
+    return files
+
+
+def _link_or_copy(source, destination):
+    if os.path.lexists(destination):
+        os.unlink(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _exchange(first, second):
+    """Échange atomiquement deux chemins (Linux) ; False si renameat2 est indisponible."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+    return renameat2(AT_FDCWD, os.fsencode(first), AT_FDCWD, os.fsencode(second), RENAME_EXCHANGE) == 0
+
+
+def swap_directories(staging, site_dir):
+    """Remplace site_dir par staging, puis supprime l'ancien site."""
+    if not os.path.exists(site_dir):
+        os.rename(staging, site_dir)
+        return
+    if not _exchange(staging, site_dir):
+        previous = site_dir.rstrip(os.sep) + '.dsfr-old'
+        shutil.rmtree(previous, ignore_errors=True)
+        os.rename(site_dir, previous)
+        os.rename(staging, site_dir)
+        staging = previous
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+class BuildCache:
+    """Cache d'une génération ; remplace config['site_dir'] par le répertoire temporaire."""
+
+    def __init__(self, config):
+        self.config = config
+        options = _options(config)
+        self.site_dir = os.path.abspath(config['site_dir'])
+        self.staging = self.site_dir.rstrip(os.sep) + STAGING_SUFFIX
+        self.cache_dir = os.path.join(os.path.dirname(os.path.abspath(config.config_file_path)), options['dir'])
+        self.pages_dir = os.path.join(self.cache_dir, PAGES_DIR)
+        self.previous = self._load()
+        self.global_key = _digest(CACHE_VERSION, mkdocs.__version__, _theme_files(config),
+                                  {key: config.get(key) for key in CONFIG_KEYS},
+                                  list(config['plugins'].keys()))
+        if self.previous.get('global_key') != self.global_key:
+            self.previous['pages'] = {}
+        self.pages = {}
+        self.fresh = set()
+        self.reused = set()
+        self.rendered = 0
+        config['site_dir'] = self.staging
+
+    def _load(self):
+        try:
+            with open(os.path.join(self.cache_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {'pages': {}}
+        if not isinstance(manifest, dict) or manifest.get('version') != CACHE_VERSION:
+            return {'pages': {}}
+        return manifest
+
+    def _cached_path(self, page):
+        return os.path.join(self.pages_dir, *page.file.dest_uri.split('/'))
+
+    def plan(self, files, nav):
+        """
+        Calcule la clé de chaque page, une fois toutes les pages lues (on_env),
+        et sélectionne CACHED_TEMPLATE pour celles dont le rendu est inchangé.
+        """
+        homepage = nav.homepage.url if nav is not None and nav.homepage else None
+        previous = self.previous['pages']
+        for file in files.documentation_pages():
+            page = file.page
+            if page is None:
+                continue
+            nav_entries = [[ancestor.title, getattr(ancestor, 'url', None)] for ancestor in page.ancestors]
+            entry = {
+                'dest': file.dest_uri,
+                'template': page.meta.get('template', 'main.html'),
+                'nav': nav_entries + [['', homepage]],
+            }
+            entry['key'] = _digest(self.global_key, page.url, page.title, page.content, page.meta,
+                                   page.canonical_url, file.inclusion.is_excluded(), entry)
+            self.pages[file.src_uri] = entry
+
+            if previous.get(file.src_uri, {}).get('key') == entry['key'] \
+                    and os.path.exists(self._cached_path(page)):
+                self.fresh.add(file.src_uri)
+                page.meta['template'] = CACHED_TEMPLATE
+
+    def update_context(self, context, page):
+        """Marqueur à la place du menu latéral ; HTML mis en cache pour une page inchangée."""
+        context['dsfr_nav_html'] = NAV_MARKER
+        if page.file.src_uri in self.fresh:
+            with open(self._cached_path(page), 'r', encoding='utf-8') as f:
+                context['dsfr_cached_html'] = f.read()
+        return context
+
+    def finish_page(self, output, page, nav_html):
+        """Met en cache le rendu de la page puis y insère le menu latéral."""
+        entry = self.pages.get(page.file.src_uri)
+        if entry is None:
+            return output.replace(NAV_MARKER, nav_html, 1)
+
+        previous = self.previous['pages'].get(page.file.src_uri, {})
+        if page.file.src_uri not in self.fresh:
+            path = self._cached_path(page)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.rendered += 1
+
+        if page.file.src_uri in self.fresh and 'static' in previous:
+            entry['static'] = previous['static']
+            entry['critical'] = previous['critical']
+        else:
+            # Le menu latéral ne contient que des liens vers les pages
+            entry['static'] = sorted(set(STATIC_REFERENCE.findall(output)))
+            entry['critical'] = CRITICAL_MARKER in output
+
+        output = output.replace(NAV_MARKER, nav_html, 1)
+        entry['output'] = hashlib.sha256(output.encode('utf-8')).hexdigest()
+        return output
+
+    def _static_state(self, used, above_the_fold):
+        """
+        Empreinte de chaque fichier CSS/JS avant regroupement ; les fichiers
+        regroupés et la feuille critique dépendent aussi des classes utilisées.
+        """
+        state = {}
+        for directory in FINGERPRINT_DIRS:
+            absolute_dir = os.path.join(self.staging, directory)
+            if os.path.isdir(absolute_dir):
+                for name in os.listdir(absolute_dir):
+                    state[f"{directory}/{name}"] = _file_hash(os.path.join(absolute_dir, name))
+        css_sources = [state.get(f"{CSS_DIR}/{name}") for name in CSS_SOURCES]
+        state[f"{CSS_DIR}/{CSS_BUNDLE}"] = _digest(css_sources, sorted(used))
+        for page_type, names in JS_BUNDLES.items():
+            state[f"{JS_DIR}/bundle-{page_type}.js"] = _digest([state.get(f"{JS_DIR}/{name}") for name in names])
+        state[CRITICAL_MARKER] = _digest(css_sources, sorted(above_the_fold))
+        return state
+
+    def prepare_post_build(self):
+        """
+        Avant les étapes de fin de génération : classes utilisées (reprises du
+        cache pour les pages inchangées) et reprise des pages finales dont ni
+        le HTML ni les fichiers statiques référencés n'ont changé.
+
+        Returns:
+            tuple: (classes utilisées, classes de la partie visible), pour bundles.py
+        """
+        previous = self.previous['pages']
+        known = {}
+        for src_uri, entry in self.pages.items():
+            old = previous.get(src_uri, {})
+            if 'output' in entry and old.get('output') == entry['output'] and 'classes' in old:
+                known[os.path.join(self.staging, *entry['dest'].split('/'))] = (old['classes'], old['above'])
+
+        collected = {}
+        used, above_the_fold = collect_used_classes(self.staging, known, collected)
+        state = self._static_state(used, above_the_fold)
+
+        for src_uri, entry in self.pages.items():
+            if 'output' not in entry:
+                continue
+            staged = os.path.join(self.staging, *entry['dest'].split('/'))
+            classes, above = collected.get(staged, ((), ()))
+            entry['classes'] = sorted(classes)
+            entry['above'] = sorted(above)
+            entry['post'] = _digest(entry['output'], brotli is not None,
+                                    [state.get(reference) for reference in entry['static']],
+                                    state[CRITICAL_MARKER] if entry['critical'] else None)
+
+            final = os.path.join(self.site_dir, *entry['dest'].split('/'))
+            if previous.get(src_uri, {}).get('post') == entry['post'] and os.path.exists(final):
+                _link_or_copy(final, staged)
+                for suffix in COMPRESSED_SUFFIXES:
+                    if os.path.exists(final + suffix):
+                        _link_or_copy(final + suffix, staged + suffix)
+                self.reused.add(staged)
+        return used, above_the_fold
+
+    def commit(self):
+        """Échange le site généré avec site_dir et enregistre le manifeste."""
+        swap_directories(self.staging, self.site_dir)
+        self.config['site_dir'] = self.site_dir
+
+        kept = {entry['dest'] for entry in self.pages.values()}
+        for entry in self.previous['pages'].values():
+            if entry.get('dest') not in kept:
+                try:
+                    os.remove(os.path.join(self.pages_dir, *entry['dest'].split('/')))
+                except OSError:
+                    pass
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        manifest_path = os.path.join(self.cache_dir, MANIFEST_NAME)
+        with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'global_key': self.global_key, 'pages': self.pages},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+        logger.info(f"Thème DSFR : génération incrémentale, {self.rendered} page(s) rendue(s), "
+                    f"{len(self.fresh)} reprise(s) du cache, {len(self.reused)} page(s) finale(s) inchangée(s)")
+
+    def abort(self):
+        """Génération en échec : le site précédent reste en place."""
+        shutil.rmtree(self.staging, ignore_errors=True)
+        self.config['site_dir'] = self.site_dir
+
+
+def create_build_cache(config, command, dirty=False):
+    """BuildCache pour 'build' et 'gh-deploy', None sinon ou si le cache est désactivé."""
+    if command not in ('build', 'gh-deploy') or dirty or not _options(config)['enabled']:
+        return None
+    return BuildCache(config)
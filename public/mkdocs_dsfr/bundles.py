@@ -0,0 +1,571 @@
+"""Regroupement des feuilles de style et scripts du thème.
+
+Après la génération du site :
+
+1. dsfr.min.css, utility.min.css et custom.css sont réunis dans
+   static/css/bundle.css, débarrassé des sélecteurs dont aucune classe n'est
+   utilisée par les pages générées ni par les scripts ;
+2. les règles qui s'appliquent aux éléments de l'en-tête et du fil d'Ariane
+   (partie visible au chargement) forment une feuille critique. main.html
+   encadre le lien vers la feuille regroupée par CRITICAL_MARKER et
+   CRITICAL_END : si la feuille critique tient dans critical_max_size octets
+   une fois compressée (défaut : CRITICAL_MAX_SIZE, le premier aller-retour
+   TCP), le bloc devient un <style> en ligne suivi du chargement asynchrone
+   de la feuille regroupée ; sinon il reste un lien bloquant vers la feuille
+   regroupée, mise en cache d'une page à l'autre ;
+3. les scripts du thème sont réunis en un fichier par type de page
+   (static/js/bundle-base.js, static/js/bundle-code.js avec la copie de code).
+
+dsfr.module.min.js et dsfr.nomodule.min.js restent séparés : le navigateur
+n'en exécute qu'un selon sa prise en charge des modules.
+
+Le regroupement a lieu avant les empreintes (assets.py), qui couvrent donc
+aussi les fichiers regroupés.
+"""
+
+import gzip
+import logging
+import os
+import re
+
+logger = logging.getLogger('mkdocs')
+
+CSS_DIR = 'static/css'
+JS_DIR = 'static/js'
+CSS_SOURCES = ('dsfr.min.css', 'utility.min.css', 'custom.css')
+CSS_BUNDLE = 'bundle.css'
+# Scripts DSFR chargés séparément par main.html (module / nomodule)
+DSFR_SCRIPTS = ('dsfr.module.min.js', 'dsfr.nomodule.min.js')
+# Scripts du thème par type de page, dans l'ordre de chargement
+JS_BUNDLES = {
+    'base': ('search.js', 'responsive.js', 'theme.js'),
+    'code': ('search.js', 'code-copy.js', 'responsive.js', 'theme.js'),
+}
+CRITICAL_MARKER = '<!-- dsfr:critical-css -->'
+CRITICAL_END = '<!-- /dsfr:critical-css -->'
+CRITICAL_BLOCK = re.compile(re.escape(CRITICAL_MARKER) + r'(.*?)' + re.escape(CRITICAL_END), re.S)
+HREF = re.compile(r'href="([^"]*)"')
+# Fenêtre initiale de congestion TCP (10 segments de 1460 octets, en-têtes compris)
+CRITICAL_MAX_SIZE = 14 * 1024
+
+# Préfixe ajouté par l'API DSFR aux noms de classes construits en JavaScript
+JS_CLASS_PREFIX = 'fr-'
+# Règles de groupe dont le contenu est filtré comme une feuille de style
+GROUP_AT_RULES = ('@media', '@supports', '@layer', '@container', '@-moz-document')
+
+COMMENT_OR_STRING = re.compile(r'''/\*.*?\*/|("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''', re.S)
+CSS_SPECIAL = re.compile(r'''[{};"']''')
+STRING = re.compile(r'''"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*\'''', re.S)
+# Contenu des pseudo-classes fonctionnelles : ne conditionne pas l'usage du sélecteur
+FUNCTIONAL_PSEUDO = re.compile(r':(?:not|is|where|has|matches|-\w+-any)\((?:[^()]|\([^()]*\))*\)')
+ATTRIBUTE_SELECTOR = re.compile(r'\[[^\]]*\]')
+# [class^=fr-icon-], [class*=" fr-icon-"] : une classe utilisée doit contenir le fragment
+CLASS_FRAGMENT_SELECTOR = re.compile(r'''\[class[*^]=(["']?)\s*([^\]"']*?)\1\]''')
+CLASS_SELECTOR = re.compile(r'\.((?:[\w-]|\\.)+)')
+CSS_ESCAPE = re.compile(r'\\(.)')
+CLASS_ATTRIBUTE = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+JS_TOKEN = re.compile(r'[A-Za-z_][\w-]*')
+CUSTOM_PROPERTY = re.compile(r'\s*(--[\w-]+)\s*:')
+VAR_REFERENCE = re.compile(r'var\(\s*(--[\w-]+)')
+ABOVE_THE_FOLD_END = '<main'
+# Éléments de la partie visible : balise ouvrante, puis attribut class
+OPENING_TAG = re.compile(r'<([a-zA-Z][\w-]*)(\s[^>]*)?>')
+# États d'interaction ou de formulaire, sans effet sur le premier affichage
+# (hors :not(...), déjà retiré)
+INTERACTION_PSEUDO = re.compile(r':(?:hover|focus|focus-visible|focus-within|active|target|visited'
+                                r'|disabled|checked|indeterminate|invalid|autofill|-webkit-autofill)\b')
+PSEUDO = re.compile(r'::?[\w-]+(?:\([^()]*\))?')
+COMBINATOR = re.compile(r'\s*[>+~]\s*|\s+')
+TYPE_SELECTOR = re.compile(r'[a-zA-Z][\w-]*')
+ATTRIBUTE_PLACEHOLDER = re.compile(r'\[(\d+)\]')
+# Requêtes média réservées à Internet Explorer et au mode contraste élevé de Windows
+LEGACY_MEDIA = re.compile(r'\\0|-ms-high-contrast')
+
+
+def _options(config):
+    options = {'enabled': True, 'prune_css': True, 'critical_css': True, 'critical_max_size': CRITICAL_MAX_SIZE}
+    options.update(config['extra'].get('dsfr', {}).get('bundles', {}))
+    return options
+
+
+def template_globals(config):
+    """
+    Variables exposées aux templates (dsfr_bundles), None si le regroupement
+    est désactivé : main.html garde alors les fichiers séparés.
+    """
+    if not _options(config)['enabled']:
+        return None
+    return {
+        'css': f"{CSS_DIR}/{CSS_BUNDLE}",
+        'css_sources': [f"{CSS_DIR}/{name}" for name in CSS_SOURCES],
+        'js': {page_type: f"{JS_DIR}/bundle-{page_type}.js" for page_type in JS_BUNDLES},
+        'dsfr_scripts': [f"{JS_DIR}/{name}" for name in DSFR_SCRIPTS],
+    }
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _write(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _strip_comments(css):
+    """Supprime les commentaires CSS sans toucher aux chaînes."""
+    return COMMENT_OR_STRING.sub(lambda match: match.group(1) or '', css)
+
+
+def _block_end(css, position):
+    """Position qui suit l'accolade fermant le bloc ouvert juste avant position."""
+    depth = 1
+    while depth:
+        match = CSS_SPECIAL.search(css, position)
+        if match is None:
+            return len(css)
+        if match.group() in '"\'':
+            position = STRING.match(css, match.start()).end()
+            continue
+        position = match.end()
+        if match.group() == '{':
+            depth += 1
+        elif match.group() == '}':
+            depth -= 1
+    return position
+
+
+def parse_css(css, position=0):
+    """
+    Découpe une feuille de style (sans commentaires) en blocs (prélude, corps).
+
+    Le corps vaut None pour une instruction (@charset, @import), une liste de
+    blocs pour une règle de groupe (@media, @supports...) et le texte des
+    déclarations sinon (règles, @font-face, @keyframes...).
+
+    Returns:
+        tuple: (blocs, position qui suit le bloc parent ou la fin du texte)
+    """
+    blocks = []
+    start = position
+    while True:
+        match = CSS_SPECIAL.search(css, position)
+        if match is None:
+            return blocks, len(css)
+        token = match.group()
+        if token in '"\'':
+            position = STRING.match(css, match.start()).end()
+            continue
+        if token == '}':
+            return blocks, match.end()
+
+        prelude = css[start:match.start()].strip()
+        if token == ';':
+            if prelude:
+                blocks.append((prelude, None))
+            position = match.end()
+        elif prelude.startswith(GROUP_AT_RULES):
+            children, position = parse_css(css, match.end())
+            blocks.append((prelude, children))
+        else:
+            position = _block_end(css, match.end())
+            blocks.append((prelude, css[match.end():position - 1]))
+        start = position
+
+
+def serialize_css(blocks):
+    """Reconstitue le texte CSS ; les règles de groupe vides sont omises."""
+    parts = []
+    for prelude, body in blocks:
+        if body is None:
+            parts.append(f"{prelude};")
+        elif isinstance(body, list):
+            inner = serialize_css(body)
+            if inner:
+                parts.append(f"{prelude}{{{inner}}}")
+        else:
+            parts.append(f"{prelude}{{{body}}}")
+    return ''.join(parts)
+
+
+def split_selectors(prelude):
+    """Sépare une liste de sélecteurs sur les virgules hors parenthèses et crochets."""
+    selectors = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(prelude):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:index])
+            start = index + 1
+    selectors.append(prelude[start:])
+    return [selector.strip() for selector in selectors if selector.strip()]
+
+
+def selector_requirements(selector):
+    """
+    Ce qu'un élément de la page doit porter pour que le sélecteur s'applique.
+
+    Returns:
+        tuple: (classes exigées, fragments de classes exigés par [class^=...] et [class*=...])
+    """
+    selector = FUNCTIONAL_PSEUDO.sub('', selector)
+    fragments = {value for _, value in CLASS_FRAGMENT_SELECTOR.findall(selector)}
+    selector = ATTRIBUTE_SELECTOR.sub('', selector)
+    classes = {CSS_ESCAPE.sub(r'\1', name) for name in CLASS_SELECTOR.findall(selector)}
+    return classes, fragments
+
+
+def selector_compounds(selector):
+    """
+    Éléments exigés par un sélecteur, un par sélecteur composé (a.fr-btn,
+    .fr-header__tools-links...), hors :not(...) et pseudo-classes.
+
+    Returns:
+        list: (balise ou None, classes, fragments de classes) de chaque élément
+    """
+    attributes = []
+
+    def hold(match):
+        # Les valeurs d'attributs peuvent contenir des espaces : mises de côté avant le découpage
+        attributes.append(match.group(0))
+        return f"[{len(attributes) - 1}]"
+
+    selector = ATTRIBUTE_SELECTOR.sub(hold, FUNCTIONAL_PSEUDO.sub('', selector))
+    compounds = []
+    for compound in COMBINATOR.split(PSEUDO.sub('', selector).strip()):
+        if not compound:
+            continue
+        held = ''.join(attributes[int(index)] for index in ATTRIBUTE_PLACEHOLDER.findall(compound))
+        compound = ATTRIBUTE_PLACEHOLDER.sub('', compound)
+        tag = TYPE_SELECTOR.match(compound)
+        classes = {CSS_ESCAPE.sub(r'\1', name) for name in CLASS_SELECTOR.findall(compound)}
+        fragments = {value.strip() for _, value in CLASS_FRAGMENT_SELECTOR.findall(held)}
+        compounds.append((tag.group(0).lower() if tag else None, classes, fragments))
+    return compounds
+
+
+class ClassUsage:
+    """Ensemble des classes utilisées, interrogé sélecteur par sélecteur."""
+
+    def __init__(self, classes):
+        self.classes = set(classes)
+        self._fragments = {}
+
+    def _has_class(self, name):
+        # Les variantes BEM (--modificateur) d'un bloc utilisé sont conservées :
+        # le JavaScript DSFR les ajoute à la volée (selector(`${e}--${t}`))
+        return name in self.classes or name.split('--', 1)[0] in self.classes
+
+    def _has_fragment(self, fragment):
+        if fragment not in self._fragments:
+            self._fragments[fragment] = any(fragment in name for name in self.classes)
+        return self._fragments[fragment]
+
+    def uses(self, selector):
+        classes, fragments = selector_requirements(selector)
+        return (all(self._has_class(name) for name in classes)
+                and all(self._has_fragment(fragment) for fragment in fragments))
+
+
+class CriticalUsage:
+    """
+    Éléments de la partie visible au chargement (voir collect_used_classes).
+
+    Plus strict que ClassUsage : chaque sélecteur composé doit correspondre à
+    un même élément du HTML généré (balise, classes et fragments de classes,
+    sans les variantes BEM ajoutées par le JavaScript), et le sélecteur ne
+    doit pas dépendre d'un état d'interaction (survol, focus, champ
+    désactivé...).
+    """
+
+    def __init__(self, above_the_fold):
+        self.elements = []
+        for signature in above_the_fold:
+            tag, *classes = signature.split('.')
+            self.elements.append((tag, frozenset(classes)))
+
+    def _matches(self, tag, classes, fragments):
+        return any((tag is None or tag == element_tag) and classes <= element_classes
+                   and all(any(fragment in name for name in element_classes) for fragment in fragments)
+                   for element_tag, element_classes in self.elements)
+
+    def uses(self, selector):
+        if INTERACTION_PSEUDO.search(FUNCTIONAL_PSEUDO.sub('', selector)):
+            return False
+        return all(self._matches(*compound) for compound in selector_compounds(selector))
+
+
+def filter_rules(blocks, keep_selector, keep_at_rule=lambda prelude: True):
+    """
+    Filtre les sélecteurs de chaque règle ; les règles sans sélecteur
+    conservé disparaissent. Les autres règles @ sont soumises à keep_at_rule.
+    """
+    kept = []
+    for prelude, body in blocks:
+        if isinstance(body, list):
+            kept.append((prelude, filter_rules(body, keep_selector, keep_at_rule)))
+        elif prelude.startswith('@') or body is None:
+            if keep_at_rule(prelude):
+                kept.append((prelude, body))
+        else:
+            selectors = [selector for selector in split_selectors(prelude) if keep_selector(selector)]
+            if selectors:
+                kept.append((','.join(selectors), body))
+    return kept
+
+
+def split_declarations(body):
+    """Sépare les déclarations d'une règle sur les ';' hors parenthèses et chaînes."""
+    declarations = []
+    depth = 0
+    start = 0
+    position = 0
+    while position < len(body):
+        char = body[position]
+        if char in '"\'':
+            position = STRING.match(body, position).end()
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ';' and depth == 0:
+            declarations.append(body[start:position])
+            start = position + 1
+        position += 1
+    declarations.append(body[start:])
+    return [declaration for declaration in declarations if declaration.strip()]
+
+
+def _iter_rules(blocks):
+    for prelude, body in blocks:
+        if isinstance(body, list):
+            yield from _iter_rules(body)
+        elif isinstance(body, str) and not prelude.startswith('@'):
+            yield prelude, body
+
+
+def prune_custom_properties(blocks):
+    """
+    Retire les propriétés personnalisées (--nom: ...) qu'aucune déclaration
+    n'utilise, directement ou par l'intermédiaire d'une autre propriété.
+    """
+    definitions = {}
+    needed = set()
+    for _, body in _iter_rules(blocks):
+        for declaration in split_declarations(body):
+            match = CUSTOM_PROPERTY.match(declaration)
+            if match:
+                definitions.setdefault(match.group(1), []).append(declaration)
+            else:
+                needed.update(VAR_REFERENCE.findall(declaration))
+
+    pending = list(needed)
+    while pending:
+        for declaration in definitions.get(pending.pop(), ()):
+            for name in VAR_REFERENCE.findall(declaration):
+                if name not in needed:
+                    needed.add(name)
+                    pending.append(name)
+
+    def prune(blocks):
+        kept = []
+        for prelude, body in blocks:
+            if isinstance(body, list):
+                kept.append((prelude, prune(body)))
+            elif isinstance(body, str) and not prelude.startswith('@'):
+                declarations = [declaration for declaration in split_declarations(body)
+                                if not CUSTOM_PROPERTY.match(declaration)
+                                or CUSTOM_PROPERTY.match(declaration).group(1) in needed]
+                if declarations:
+                    kept.append((prelude, ';'.join(declarations)))
+            else:
+                kept.append((prelude, body))
+        return kept
+
+    return prune(blocks)
+
+
+def _iter_html(site_dir):
+    for directory, _, names in os.walk(site_dir):
+        for name in names:
+            if name.endswith('.html'):
+                yield os.path.join(directory, name)
+
+
+def collect_used_classes(site_dir, known=None, collected=None):
+    """
+    Classes utilisées par les pages HTML et les scripts du site.
+
+    Args:
+        known (dict, optional): Chemin d'une page -> (classes, classes de la
+            partie visible) déjà connues : la page n'est pas relue
+        collected (dict, optional): Complété avec les classes de chaque page
+
+    Returns:
+        tuple: (toutes les classes, éléments de la partie visible au
+                chargement sous la forme 'balise.classe1.classe2')
+    """
+    known = known or {}
+    used = set()
+    above_the_fold = set()
+    for path in _iter_html(site_dir):
+        if path in known:
+            page_used, page_above = known[path]
+        else:
+            html = _read(path)
+            fold = html.find(ABOVE_THE_FOLD_END)
+            page_used = set()
+            page_above = set()
+            for match in CLASS_ATTRIBUTE.finditer(html):
+                page_used.update((match.group(1) or match.group(2) or '').split())
+            for tag, attributes in OPENING_TAG.findall(html if fold < 0 else html[:fold]):
+                match = CLASS_ATTRIBUTE.search(attributes)
+                names = (match.group(1) or match.group(2) or '').split() if match else ()
+                page_above.add('.'.join([tag.lower(), *sorted(set(names))]))
+        used.update(page_used)
+        above_the_fold.update(page_above)
+        if collected is not None:
+            collected[path] = (page_used, page_above)
+
+    # Noms de classes écrits en toutes lettres ou construits par l'API DSFR
+    js_dir = os.path.join(site_dir, JS_DIR)
+    if os.path.isdir(js_dir):
+        for name in os.listdir(js_dir):
+            if name.endswith('.js'):
+                for token in set(JS_TOKEN.findall(_read(os.path.join(js_dir, name)))):
+                    used.add(token)
+                    used.add(JS_CLASS_PREFIX + token)
+    return used, above_the_fold
+
+
+def build_css_bundle(site_dir, prune=True, critical=True, classes=None):
+    """
+    Écrit static/css/bundle.css et retourne la feuille critique ('' si non demandée).
+
+    classes : résultat de collect_used_classes s'il est déjà calculé.
+    """
+    css_dir = os.path.join(site_dir, CSS_DIR)
+    sources = [os.path.join(css_dir, name) for name in CSS_SOURCES
+               if os.path.exists(os.path.join(css_dir, name))]
+    bundle_path = os.path.join(css_dir, CSS_BUNDLE)
+
+    if not prune:
+        _write(bundle_path, '\n'.join(_read(path) for path in sources))
+        return ''
+
+    blocks = []
+    for path in sources:
+        blocks.extend(parse_css(_strip_comments(_read(path)))[0])
+    # Un seul @charset, en tête du fichier regroupé
+    blocks = [block for block in blocks if not block[0].startswith('@charset')]
+
+    used, above_the_fold = classes or collect_used_classes(site_dir)
+    blocks = filter_rules(blocks, ClassUsage(used).uses)
+    _write(bundle_path, '@charset "UTF-8";' + serialize_css(blocks))
+
+    if not critical:
+        return ''
+    critical_blocks = filter_rules(_critical_candidates(blocks), CriticalUsage(above_the_fold).uses,
+                                   keep_at_rule=lambda prelude: False)
+    # Les variables DSFR (:root) pèsent plus que les règles de l'en-tête elles-mêmes
+    return serialize_css(prune_custom_properties(critical_blocks))
+
+
+def _critical_candidates(blocks):
+    """
+    Règles pouvant figurer dans la feuille critique. Les chemins relatifs
+    (url(...)) seraient résolus depuis la page et non depuis static/css, et les
+    requêtes média historiques ne concernent pas le premier affichage : ces
+    règles restent dans la feuille complète.
+    """
+    kept = []
+    for prelude, body in blocks:
+        if isinstance(body, list):
+            if not LEGACY_MEDIA.search(prelude):
+                kept.append((prelude, _critical_candidates(body)))
+        elif body is None or 'url(' not in body:
+            kept.append((prelude, body))
+    return kept
+
+
+def build_js_bundles(site_dir):
+    """Écrit un script regroupé par type de page ; retourne le nombre de fichiers écrits."""
+    js_dir = os.path.join(site_dir, JS_DIR)
+    for page_type, names in JS_BUNDLES.items():
+        parts = [_read(os.path.join(js_dir, name)) for name in names
+                 if os.path.exists(os.path.join(js_dir, name))]
+        # ';' : un script sans point-virgule final ne doit pas se fondre dans le suivant
+        _write(os.path.join(js_dir, f"bundle-{page_type}.js"), '\n;\n'.join(parts))
+    return len(JS_BUNDLES)
+
+
+def inline_critical_css(site_dir, critical_css, skip=()):
+    """
+    Remplace le bloc encadré par CRITICAL_MARKER et CRITICAL_END dans chaque
+    page (sauf les chemins de skip, déjà à jour) : feuille critique en ligne
+    et feuille regroupée chargée en asynchrone, ou, sans feuille critique, le
+    lien bloquant du bloc seul.
+    """
+    def replace(match):
+        block = match.group(1).strip()
+        if not critical_css:
+            return block
+        href = HREF.search(block).group(1)
+        return (f'<style>{critical_css}</style>'
+                f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+                f'<noscript>{block}</noscript>')
+
+    inlined = 0
+    for path in _iter_html(site_dir):
+        if path in skip:
+            continue
+        html = _read(path)
+        if CRITICAL_MARKER in html:
+            _write(path, CRITICAL_BLOCK.sub(replace, html, count=1))
+            inlined += 1
+    return inlined
+
+
+def build_bundles(config, command=None, classes=None, skip=()):
+    """
+    Regroupe les CSS/JS du thème. Pendant 'mkdocs serve', les feuilles sont
+    seulement concaténées (ni filtrage ni feuille critique) pour garder des
+    rechargements rapides.
+
+    classes et skip viennent de la génération incrémentale (build_cache.py) :
+    classes déjà collectées et pages reprises de la génération précédente.
+    """
+    options = _options(config)
+    if not options['enabled']:
+        return
+
+    site_dir = config['site_dir']
+    serve = command == 'serve'
+    prune = options['prune_css'] and not serve
+    critical_css = build_css_bundle(site_dir, prune=prune, critical=prune and options['critical_css'],
+                                    classes=classes)
+    bundles = build_js_bundles(site_dir)
+    # Taille transmise : les pages sont servies compressées (assets.py, gzip_static)
+    critical_size = len(gzip.compress(critical_css.encode('utf-8'), compresslevel=9)) if critical_css else 0
+    over_budget = critical_size > options['critical_max_size']
+    if over_budget:
+        # Répétée dans chaque page, elle coûterait plus que la feuille regroupée en cache
+        critical_css = ''
+    inlined = inline_critical_css(site_dir, critical_css, skip)
+
+    bundle_size = os.path.getsize(os.path.join(site_dir, CSS_DIR, CSS_BUNDLE))
+    if over_budget:
+        critical_report = (f"feuille critique de {critical_size // 1024} Ko compressés au-delà de "
+                           f"{options['critical_max_size'] // 1024} Ko, lien bloquant dans {inlined} page(s)")
+    elif critical_css:
+        critical_report = f"{critical_size // 1024} Ko critiques compressés en ligne dans {inlined} page(s)"
+    else:
+        critical_report = f"lien bloquant dans {inlined} page(s)"
+    logger.info(f"Thème DSFR : CSS regroupé ({bundle_size // 1024} Ko, {critical_report}), "
+                f"{bundles} script(s) regroupé(s)")
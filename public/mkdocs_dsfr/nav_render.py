@@ -0,0 +1,209 @@
+"""Menu latéral rendu une seule fois par génération.
+
+La macro render_nav (partials/nav_item.html) reconstruisait tout l'arbre de
+navigation pour chaque page. Le menu est ici rendu une fois, en fragments :
+les parties qui dépendent de la page (classes --active, aria-expanded,
+aria-current) sont gardées sous leurs deux formes. Pour chaque page, on
+précalcule l'ensemble des entrées à marquer (ses occurrences dans le menu et
+les sections qui les contiennent) ; le menu de la page n'est alors qu'une
+concaténation de fragments, quelle que soit la profondeur de l'arbre.
+
+Le balisage est celui de render_nav, qui reste utilisé par les pages rendues
+hors de ce hook (404.html).
+
+Menu différé (extra.dsfr.nav.lazy) : avec des milliers d'entrées, le menu
+complet pèse sur chaque page. Le menu est alors écrit une fois dans un
+fichier JSON compact et versionné (static/nav/nav.<empreinte>.json, voir
+write_payload). Chaque page ne contient plus que les entrées de premier niveau
+et, pour les sections de la page en cours, leurs entrées (branche active) ;
+les autres sections sont rendues repliées et vides, et static/js/navigation.js
+les remplit à partir du fichier JSON, chargé à la première interaction avec
+le menu (ou quand le navigateur est inactif) et conservé dans le
+localStorage.
+"""
+
+import hashlib
+import html
+import json
+import os
+
+PAYLOAD_VERSION = 1
+PAYLOAD_DIR = 'static/nav'
+
+
+def lazy_nav_enabled(config):
+    """Menu différé activé (extra.dsfr.nav.lazy, désactivé par défaut)."""
+    return bool(config['extra'].get('dsfr', {}).get('nav', {}).get('lazy', False))
+
+
+class NavRenderer:
+    """Menu latéral d'une génération, rendu à la première demande."""
+
+    def __init__(self, nav, site_url=None, lazy=False):
+        self.nav = nav
+        self.site_url = site_url or ''
+        self.lazy = lazy
+        self._fragments = None
+        # Menu différé : contenu du fichier JSON, son URL, et src_uri de la
+        # page -> identifiants des entrées actives
+        self._payload = None
+        self._payload_url = None
+        self._active_ids = {}
+        # src_uri de la page -> numéros des entrées actives
+        self._active = {}
+        self._count = 0
+
+    def _toggle(self, key, active, inactive=''):
+        self._fragments.append((key, active, inactive))
+
+    def _text(self, text):
+        self._fragments.append(text)
+
+    def _render_items(self, items, parent_id, ancestors):
+        self._text('<ul class="fr-sidemenu__list">')
+        for index, item in enumerate(items, start=1):
+            item_id = f"{parent_id}-{index}" if parent_id else str(index)
+            key = self._count
+            self._count += 1
+
+            self._text('<li class="fr-sidemenu__item">')
+            children = getattr(item, 'children', None)
+            if children:
+                self._text('<button class="fr-sidemenu__btn')
+                self._toggle(key, ' fr-sidemenu__btn--active')
+                self._text('" aria-expanded="')
+                self._toggle(key, 'true', 'false')
+                self._text(f'" aria-controls="fr-sidemenu-{item_id}">{item.title}</button>'
+                           '<div class="fr-collapse')
+                self._toggle(key, ' fr-collapse--expanded')
+                self._text(f'" id="fr-sidemenu-{item_id}">')
+                self._render_items(children, item_id, ancestors + (key,))
+                self._text('</div>')
+            elif getattr(item, 'url', None):
+                self._text('<a class="fr-sidemenu__link')
+                self._toggle(key, ' fr-sidemenu__link--active')
+                self._text(f'" href="{self.site_url}{item.url}"')
+                self._toggle(key, ' aria-current="page"')
+                self._text(f'>{item.title}</a>')
+            else:
+                self._text('<span class="fr-sidemenu__link')
+                self._toggle(key, ' fr-sidemenu__link--active')
+                self._text(f'">{item.title}</span>')
+            self._text('</li>')
+
+            if getattr(item, 'is_page', False):
+                self._active.setdefault(item.file.src_uri, set()).update(ancestors + (key,))
+        # Élément invisible si la liste est vide pour éviter les erreurs DSFR
+        if not items:
+            self._text('<li style="display:none"></li>')
+        self._text('</ul>')
+
+    def _build(self):
+        self._fragments = []
+        self._render_items(self.nav.items, '', ())
+        # Fusion des textes consécutifs : moins d'éléments à concaténer par page
+        merged = []
+        for fragment in self._fragments:
+            if isinstance(fragment, str) and merged and isinstance(merged[-1], str):
+                merged[-1] += fragment
+            else:
+                merged.append(fragment)
+        self._fragments = merged
+
+    def render(self, page):
+        """HTML du menu avec le chemin de la page marqué comme actif."""
+        if self.lazy:
+            return self._render_lazy(page)
+        # Rendu différé : les titres des pages ne sont connus qu'après leur lecture
+        if self._fragments is None:
+            self._build()
+        active = self._active.get(page.file.src_uri, ()) if page is not None else ()
+        return ''.join(
+            fragment if isinstance(fragment, str)
+            else fragment[1] if fragment[0] in active else fragment[2]
+            for fragment in self._fragments
+        )
+
+    def _payload_items(self, items, parent_id, ancestors):
+        """Entrées du fichier JSON : [titre, lien] ou [titre, null, [enfants]] ([titre] sans lien).
+
+        Les titres MkDocs sont échappés pour le HTML (R&amp;D) : navigation.js les
+        insère en texte, ils sont donc écrits en clair dans le fichier JSON.
+        """
+        nodes = []
+        for index, item in enumerate(items, start=1):
+            item_id = f"{parent_id}-{index}" if parent_id else str(index)
+            title = html.unescape(item.title) if item.title else item.title
+            children = getattr(item, 'children', None)
+            if children:
+                nodes.append([title, None, self._payload_items(children, item_id, ancestors + (item_id,))])
+            elif getattr(item, 'url', None):
+                nodes.append([title, f"{self.site_url}{item.url}"])
+            else:
+                nodes.append([title])
+            if getattr(item, 'is_page', False):
+                self._active_ids.setdefault(item.file.src_uri, set()).update(ancestors + (item_id,))
+        return nodes
+
+    def _build_payload(self):
+        items = self._payload_items(self.nav.items, '', ())
+        content = json.dumps(items, ensure_ascii=False, separators=(',', ':'))
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+        self._payload = (f'{{"version":{PAYLOAD_VERSION},"hash":"{digest}","items":{content}}}', digest)
+        self._payload_url = f"{self.site_url}{PAYLOAD_DIR}/nav.{digest}.json"
+
+    def _render_lazy_items(self, items, parent_id, active, parts, attributes=''):
+        parts.append(f'<ul class="fr-sidemenu__list"{attributes}>')
+        for index, item in enumerate(items, start=1):
+            item_id = f"{parent_id}-{index}" if parent_id else str(index)
+            is_active = item_id in active
+            parts.append('<li class="fr-sidemenu__item">')
+            children = getattr(item, 'children', None)
+            if children:
+                modifier = ' fr-sidemenu__btn--active' if is_active else ''
+                expanded = 'true' if is_active else 'false'
+                parts.append(f'<button class="fr-sidemenu__btn{modifier}" aria-expanded="{expanded}" '
+                             f'aria-controls="fr-sidemenu-{item_id}">{item.title}</button>')
+                if is_active:
+                    parts.append(f'<div class="fr-collapse fr-collapse--expanded" id="fr-sidemenu-{item_id}">')
+                    self._render_lazy_items(children, item_id, active, parts)
+                else:
+                    # Section repliée : remplie par navigation.js
+                    parts.append(f'<div class="fr-collapse" id="fr-sidemenu-{item_id}" '
+                                 f'data-dsfr-nav-lazy="{item_id}">'
+                                 '<ul class="fr-sidemenu__list"><li style="display:none"></li></ul>')
+                parts.append('</div>')
+            else:
+                modifier = ' fr-sidemenu__link--active' if is_active else ''
+                if getattr(item, 'url', None):
+                    current = ' aria-current="page"' if is_active else ''
+                    parts.append(f'<a class="fr-sidemenu__link{modifier}" href="{self.site_url}{item.url}"{current}>'
+                                 f'{item.title}</a>')
+                else:
+                    parts.append(f'<span class="fr-sidemenu__link{modifier}">{item.title}</span>')
+            parts.append('</li>')
+        if not items:
+            parts.append('<li style="display:none"></li>')
+        parts.append('</ul>')
+
+    def _render_lazy(self, page):
+        """Menu différé : premier niveau et branche active, URL du fichier JSON en attribut."""
+        if self._payload is None:
+            self._build_payload()
+        active = self._active_ids.get(page.file.src_uri, set()) if page is not None else set()
+        parts = []
+        attributes = (f' data-dsfr-nav="{self._payload_url}"'
+                      f' data-dsfr-nav-active="{" ".join(sorted(active))}"')
+        self._render_lazy_items(self.nav.items, '', active, parts, attributes)
+        return ''.join(parts)
+
+    def write_payload(self, site_dir):
+        """Écrit le fichier JSON du menu différé dans site_dir ; renvoie son chemin relatif."""
+        if self._payload is None:
+            self._build_payload()
+        content, digest = self._payload
+        directory = os.path.join(site_dir, *PAYLOAD_DIR.split('/'))
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"nav.{digest}.json"), 'w', encoding='utf-8') as f:
+            f.write(content)
+        return f"{PAYLOAD_DIR}/nav.{digest}.json"
@@ -0,0 +1,138 @@
+"""Index de recherche inversé, découpé en fragments par préfixe.
+
+Construit après la génération du site à partir de search/search_index.json
+(plugin search de MkDocs). Les termes sont normalisés comme les noms de
+fichiers de tri_wordpress (décomposition NFD, suppression des accents,
+minuscules), puis répartis dans des fragments JSON compacts selon leurs
+premiers caractères. Les titres et extraits des documents sont eux aussi
+répartis par blocs. Le client (static/js/search.worker.js) ne télécharge que
+les fragments correspondant aux termes saisis et les blocs des résultats
+affichés.
+"""
+
+import json
+import logging
+import os
+import re
+import unicodedata
+
+logger = logging.getLogger('mkdocs')
+
+INDEX_VERSION = 1
+INDEX_DIR = os.path.join('search', 'dsfr')
+PREFIX_LENGTH = 2
+EXCERPT_LENGTH = 200
+DOCS_PER_CHUNK = 500
+MIN_TERM_LENGTH = 2
+TITLE_WEIGHT = 10
+TEXT_WEIGHT = 1
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+SAFE_PREFIX_PATTERN = re.compile(r'^[a-z0-9]+$')
+
+
+def normaliser(texte):
+    """Supprime les accents et met en minuscules (comme nettoyer_titre_pour_fichier)."""
+    texte_normalise = unicodedata.normalize('NFD', texte)
+    return ''.join(c for c in texte_normalise if unicodedata.category(c) != 'Mn').lower()
+
+
+def termes(texte):
+    """Découpe un texte normalisé en termes (lettres et chiffres, au moins deux caractères)."""
+    return [terme for terme in TOKEN_PATTERN.findall(normaliser(texte)) if len(terme) >= MIN_TERM_LENGTH]
+
+
+def nom_fragment(prefixe):
+    """Nom de fichier d'un fragment ; les préfixes non ASCII sont encodés en hexadécimal."""
+    if SAFE_PREFIX_PATTERN.match(prefixe):
+        return f"{prefixe}.json"
+    return f"x{prefixe.encode('utf-8').hex()}.json"
+
+
+def construire_index(docs, prefix_length=PREFIX_LENGTH):
+    """
+    Construit l'index inversé.
+
+    Args:
+        docs: Entrées de search_index.json (location, title, text)
+        prefix_length: Nombre de caractères du préfixe de fragment
+
+    Returns:
+        tuple: (documents, fragments) - documents est la liste
+        [location, titre, extrait] ; fragments associe un préfixe à
+        {terme: [[id_document, score], ...]}
+    """
+    documents = []
+    postings = {}
+
+    for doc_id, doc in enumerate(docs):
+        title = doc.get('title') or ''
+        text = doc.get('text') or ''
+        excerpt = text[:EXCERPT_LENGTH] + ('...' if len(text) > EXCERPT_LENGTH else '')
+        documents.append([doc.get('location', ''), title, excerpt])
+
+        scores = {}
+        for terme in termes(title):
+            scores[terme] = scores.get(terme, 0) + TITLE_WEIGHT
+        for terme in termes(text):
+            scores[terme] = scores.get(terme, 0) + TEXT_WEIGHT
+        for terme, score in scores.items():
+            postings.setdefault(terme, []).append([doc_id, score])
+
+    fragments = {}
+    for terme in sorted(postings):
+        fragments.setdefault(terme[:prefix_length], {})[terme] = postings[terme]
+    return documents, fragments
+
+
+def _ecrire_json(chemin, donnees):
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump(donnees, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def build_search_index(config):
+    """
+    Écrit l'index fragmenté dans site/search/dsfr/ à partir de l'index MkDocs.
+
+    Sans index MkDocs (plugin search désactivé), rien n'est écrit et le
+    client garde la recherche d'origine.
+    """
+    site_dir = config['site_dir']
+    source = os.path.join(site_dir, 'search', 'search_index.json')
+    if not os.path.exists(source):
+        logger.info("Thème DSFR : pas d'index MkDocs, index fragmenté non généré")
+        return
+
+    options = config['extra'].get('dsfr', {}).get('search', {})
+    prefix_length = options.get('prefix_length', PREFIX_LENGTH)
+
+    with open(source, 'r', encoding='utf-8') as f:
+        mkdocs_index = json.load(f)
+
+    documents, fragments = construire_index(mkdocs_index.get('docs', []), prefix_length)
+
+    index_dir = os.path.join(site_dir, INDEX_DIR)
+    os.makedirs(index_dir, exist_ok=True)
+    for nom in os.listdir(index_dir):
+        os.remove(os.path.join(index_dir, nom))
+
+    shards = {}
+    for prefixe, contenu in fragments.items():
+        shards[prefixe] = nom_fragment(prefixe)
+        _ecrire_json(os.path.join(index_dir, shards[prefixe]), contenu)
+
+    docs_files = []
+    for debut in range(0, len(documents), DOCS_PER_CHUNK):
+        docs_files.append(f"docs-{debut // DOCS_PER_CHUNK}.json")
+        _ecrire_json(os.path.join(index_dir, docs_files[-1]), documents[debut:debut + DOCS_PER_CHUNK])
+
+    _ecrire_json(os.path.join(index_dir, 'manifest.json'), {
+        'version': INDEX_VERSION,
+        'prefix_length': prefix_length,
+        'min_search_length': mkdocs_index.get('config', {}).get('min_search_length', 3),
+        'docs_per_chunk': DOCS_PER_CHUNK,
+        'docs': docs_files,
+        'shards': shards,
+    })
+    logger.info(f"Thème DSFR : index de recherche fragmenté ({len(documents)} documents, "
+                f"{len(shards)} fragments)")
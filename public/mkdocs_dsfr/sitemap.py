@@ -0,0 +1,245 @@
+"""Plan du site fragmenté et incrémental.
+
+Remplace le sitemap.xml de MkDocs, rendu en une fois à chaque génération :
+
+- sitemap.xml est un index (<sitemapindex>) qui liste des fragments
+  sitemaps/sitemap-<n>.xml.gz d'au plus MAX_URLS adresses (limite du
+  protocole sitemaps.org : 50 000) ;
+- chaque page est placée dans un fragment selon l'empreinte de son URL : une
+  page ajoutée, supprimée ou modifiée ne change que son fragment. Le nombre
+  de fragments est une puissance de deux, qui ne double que lorsqu'un
+  fragment dépasse la limite ;
+- <lastmod> vient de la date du dernier commit git du fichier source (ou de
+  sa date de modification pour un fichier hors git ou modifié depuis), à la
+  journée près ;
+- un fragment dont les entrées n'ont pas changé est repris tel quel du site
+  précédent (lien physique) : même contenu, même date de modification, donc
+  mêmes en-têtes ETag / Last-Modified pour les robots d'indexation, qui ne
+  téléchargent plus que les fragments modifiés. Les empreintes des fragments
+  sont conservées dans sitemaps/.manifest.json (fichier caché, non servi par
+  nginx).
+
+La reprise utilise le site précédent laissé en place par la génération
+incrémentale (build_cache.py). Sans elle (mkdocs serve, --dirty, cache
+désactivé), tous les fragments sont écrits.
+
+Les adresses sont absolues : sans site_url, aucun plan du site n'est généré.
+Options (extra.dsfr.sitemap) : enabled (défaut : true), max_urls (défaut :
+50000) et lastmod ('git' ou 'mtime', défaut : git).
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger('mkdocs')
+
+SITEMAP_VERSION = 1
+INDEX_NAME = 'sitemap.xml'
+SHARDS_DIR = 'sitemaps'
+MANIFEST_NAME = '.manifest.json'
+MAX_URLS = 50000
+XMLNS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
+def _options(config):
+    options = {'enabled': True, 'max_urls': MAX_URLS, 'lastmod': 'git'}
+    options.update(config['extra'].get('dsfr', {}).get('sitemap', {}))
+    return options
+
+
+def disable_mkdocs_sitemap(config):
+    """Retire sitemap.xml des modèles statiques : le plan du site est écrit par build_sitemap."""
+    if _options(config)['enabled'] and config.get('site_url'):
+        config['theme'].static_templates.discard(INDEX_NAME)
+
+
+def _day(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d')
+
+
+def git_dates(directory):
+    """
+    Date du dernier commit de chaque fichier suivi par git sous directory.
+
+    Un seul 'git log' pour tout le répertoire. Les fichiers modifiés depuis
+    le dernier commit sont absents du résultat (leur date de modification
+    fait foi), comme tout le résultat si git est indisponible.
+
+    Returns:
+        dict: Chemin absolu -> horodatage du commit
+    """
+    base = ['git', '-c', 'core.quotepath=false', '-C', directory]
+    try:
+        root = subprocess.run(base + ['rev-parse', '--show-toplevel'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+        log = subprocess.run(base + ['log', '--format=@%ct', '--name-only', '--no-renames', '--', '.'],
+                             capture_output=True, text=True, check=True).stdout
+        status = subprocess.run(base + ['status', '--porcelain', '-z', '--untracked-files=no', '--', '.'],
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    dates = {}
+    timestamp = None
+    for line in log.splitlines():
+        if line.startswith('@'):
+            timestamp = int(line[1:])
+        elif line:
+            # Le journal va du plus récent au plus ancien : la première date est la bonne
+            dates.setdefault(os.path.join(root, line), timestamp)
+    for entry in status.split('\0'):
+        if len(entry) > 3:
+            dates.pop(os.path.join(root, entry[3:]), None)
+    return dates
+
+
+def collect_entries(files, config):
+    """
+    Entrées du plan du site : (URL absolue, date de dernière modification).
+
+    Args:
+        files: Fichiers de la génération (mkdocs.structure.files.Files)
+        config: Configuration MkDocs
+
+    Returns:
+        list: (loc, lastmod) de chaque page, dans l'ordre des fichiers
+    """
+    dates = git_dates(config['docs_dir']) if _options(config)['lastmod'] == 'git' else {}
+    entries = []
+    for file in files.documentation_pages():
+        page = file.page
+        if page is None or page.is_link or not page.canonical_url:
+            continue
+        source = os.path.realpath(file.abs_src_path) if file.abs_src_path else None
+        timestamp = dates.get(source)
+        if timestamp is None and source and os.path.exists(source):
+            timestamp = os.path.getmtime(source)
+        entries.append((page.canonical_url, _day(timestamp) if timestamp is not None else None))
+    return entries
+
+
+def _shard_of(loc, shards):
+    return int.from_bytes(hashlib.sha256(loc.encode('utf-8')).digest()[:4], 'big') % shards
+
+
+def split_entries(entries, max_urls=MAX_URLS):
+    """
+    Répartit les entrées en fragments selon l'empreinte de leur URL.
+
+    Returns:
+        list: Fragments (listes d'entrées triées par URL) ; le nombre de
+              fragments est la plus petite puissance de deux qui respecte max_urls
+              (un fragment peut être vide, son numéro reste alors inutilisé)
+    """
+    shards = 1
+    while True:
+        buckets = [[] for _ in range(shards)]
+        for entry in entries:
+            buckets[_shard_of(entry[0], shards)].append(entry)
+        if all(len(bucket) <= max_urls for bucket in buckets):
+            return [sorted(bucket) for bucket in buckets]
+        shards *= 2
+
+
+def render_urlset(entries):
+    """XML d'un fragment (<urlset>)."""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<urlset xmlns="{XMLNS}">']
+    for loc, lastmod in entries:
+        lastmod_tag = f'<lastmod>{lastmod}</lastmod>' if lastmod else ''
+        lines.append(f'<url><loc>{escape(loc)}</loc>{lastmod_tag}</url>')
+    lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
+
+
+def render_index(shards):
+    """XML de l'index (<sitemapindex>) ; shards : (URL, lastmod) de chaque fragment."""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<sitemapindex xmlns="{XMLNS}">']
+    for loc, lastmod in shards:
+        lastmod_tag = f'<lastmod>{lastmod}</lastmod>' if lastmod else ''
+        lines.append(f'<sitemap><loc>{escape(loc)}</loc>{lastmod_tag}</sitemap>')
+    lines.append('</sitemapindex>')
+    return '\n'.join(lines) + '\n'
+
+
+def _gzip(text):
+    """Compression reproductible (sans nom ni date dans l'en-tête gzip)."""
+    return gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0)
+
+
+def _read_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != SITEMAP_VERSION:
+        return {}
+    return manifest.get('shards', {})
+
+
+def _link_or_copy(source, destination):
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def build_sitemap(config, files, previous_site_dir=None):
+    """
+    Écrit l'index et les fragments du plan du site dans site_dir.
+
+    Args:
+        config: Configuration MkDocs
+        files: Fichiers de la génération
+        previous_site_dir: Site de la génération précédente, dont les
+            fragments inchangés sont repris (None : tout est écrit)
+    """
+    options = _options(config)
+    site_url = config.get('site_url')
+    if not options['enabled'] or not site_url:
+        if options['enabled']:
+            logger.info("Thème DSFR : pas de site_url, plan du site non généré")
+        return
+
+    site_dir = config['site_dir']
+    shards_dir = os.path.join(site_dir, SHARDS_DIR)
+    shutil.rmtree(shards_dir, ignore_errors=True)
+    os.makedirs(shards_dir)
+
+    previous, previous_dir = {}, None
+    if previous_site_dir is not None:
+        previous_dir = os.path.join(previous_site_dir, SHARDS_DIR)
+        previous = _read_manifest(os.path.join(previous_dir, MANIFEST_NAME))
+
+    base_url = site_url if site_url.endswith('/') else site_url + '/'
+    index = []
+    digests = {}
+    reused = 0
+    for number, entries in enumerate(split_entries(collect_entries(files, config), options['max_urls'])):
+        if not entries:
+            continue
+        name = f"sitemap-{number}.xml.gz"
+        path = os.path.join(shards_dir, name)
+        digests[name] = hashlib.sha256(json.dumps(entries).encode('utf-8')).hexdigest()
+        old = os.path.join(previous_dir, name) if previous_dir else None
+        if previous.get(name) == digests[name] and os.path.exists(old):
+            _link_or_copy(old, path)
+            reused += 1
+        else:
+            with open(path, 'wb') as f:
+                f.write(_gzip(render_urlset(entries)))
+        dates = [lastmod for _, lastmod in entries if lastmod]
+        index.append((f"{base_url}{SHARDS_DIR}/{name}", max(dates) if dates else None))
+
+    with open(os.path.join(shards_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump({'version': SITEMAP_VERSION, 'shards': digests}, f, separators=(',', ':'))
+    with open(os.path.join(site_dir, INDEX_NAME), 'w', encoding='utf-8') as f:
+        f.write(render_index(index))
+    logger.info(f"Thème DSFR : plan du site en {len(index)} fragment(s), {reused} repris du site précédent")
@@ -1,8 +1,13 @@
 /**
  * Module de navigation DSFR
- * Gère le scroll vers l'élément actif
+ * Gère le scroll vers l'élément actif et le menu différé
+ * (extra.dsfr.nav.lazy, voir nav_render.py) : les sections repliées du menu
+ * sont remplies à partir du fichier JSON du menu, chargé une seule fois puis
+ * conservé dans le localStorage.
  */
 
+const NAV_STORAGE_PREFIX = 'dsfr-nav:';
+
 class NavigationModule {
   constructor() {
     this.init();
@@ -12,28 +17,176 @@ class NavigationModule {
     // Highlight de l'élément actif au chargement
     document.addEventListener('DOMContentLoaded', () => {
       this.highlightActiveNavigation();
+      this.initLazyNavigation();
     });
   }
 
   highlightActiveNavigation() {
     // Scroll vers l'élément actif si nécessaire
     const activeLink = document.querySelector('.fr-sidemenu__link--active');
-    
+
     if (activeLink) {
       // Faire défiler vers l'élément actif si nécessaire
       setTimeout(() => {
-        activeLink.scrollIntoView({ 
-          behavior: 'smooth', 
+        activeLink.scrollIntoView({
+          behavior: 'smooth',
           block: 'nearest',
           inline: 'nearest'
         });
       }, 100);
     }
   }
+
+  initLazyNavigation() {
+    const root = document.querySelector('[data-dsfr-nav]');
+    if (!root || !document.querySelector('[data-dsfr-nav-lazy]')) {
+      return;
+    }
+
+    // Chargement à la première interaction avec le menu, sinon quand le navigateur est inactif
+    let started = false;
+    const start = () => {
+      if (started) {
+        return;
+      }
+      started = true;
+      this.loadPayload(root.dataset.dsfrNav)
+        .then((payload) => this.fillSections(payload.items))
+        .catch((error) => console.warn('Menu de navigation indisponible :', error));
+    };
+    const menu = root.closest('.fr-sidemenu') || root;
+    ['pointerover', 'focusin', 'touchstart'].forEach((type) => {
+      menu.addEventListener(type, start, { once: true, passive: true });
+    });
+    (window.requestIdleCallback || ((callback) => setTimeout(callback, 2000)))(start);
+  }
+
+  payloadUrl(src) {
+    // URL relative (site sans site_url) : résolue depuis la racine du site
+    if (/^([a-z]+:)?\//i.test(src)) {
+      return src;
+    }
+    return `${window.base_url || '.'}/${src}`;
+  }
+
+  loadPayload(src) {
+    // Le nom du fichier contient l'empreinte du menu : une clé par version
+    const key = NAV_STORAGE_PREFIX + src.split('/').pop();
+    try {
+      const stored = localStorage.getItem(key);
+      if (stored) {
+        return Promise.resolve(JSON.parse(stored));
+      }
+    } catch (error) {
+      // localStorage indisponible ou contenu invalide : chargement réseau
+    }
+
+    return fetch(this.payloadUrl(src))
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error(`HTTP ${response.status}`);
+        }
+        return response.text();
+      })
+      .then((text) => {
+        try {
+          Object.keys(localStorage)
+            .filter((name) => name.startsWith(NAV_STORAGE_PREFIX) && name !== key)
+            .forEach((name) => localStorage.removeItem(name));
+          localStorage.setItem(key, text);
+        } catch (error) {
+          // Quota dépassé : le navigateur garde le fichier dans son cache HTTP
+        }
+        return JSON.parse(text);
+      });
+  }
+
+  findItems(items, id) {
+    // Identifiant "2-1-3" : 3e entrée de la 1re entrée de la 2e entrée
+    let node = null;
+    for (const index of id.split('-')) {
+      node = items[Number(index) - 1];
+      if (!node || !node[2]) {
+        return null;
+      }
+      items = node[2];
+    }
+    return items;
+  }
+
+  fillSections(items) {
+    document.querySelectorAll('[data-dsfr-nav-lazy]').forEach((section) => {
+      const id = section.dataset.dsfrNavLazy;
+      const children = this.findItems(items, id);
+      if (children) {
+        section.replaceChildren(this.renderItems(children, id));
+        section.removeAttribute('data-dsfr-nav-lazy');
+      }
+    });
+  }
+
+  renderItems(items, parentId) {
+    // Même balisage que nav_render.py, sections repliées
+    const list = document.createElement('ul');
+    list.className = 'fr-sidemenu__list';
+    items.forEach(([title, href, children], position) => {
+      const id = `${parentId}-${position + 1}`;
+      const item = document.createElement('li');
+      item.className = 'fr-sidemenu__item';
+
+      if (children) {
+        const button = document.createElement('button');
+        button.className = 'fr-sidemenu__btn';
+        button.setAttribute('aria-expanded', 'false');
+        button.setAttribute('aria-controls', `fr-sidemenu-${id}`);
+        button.textContent = title;
+        button.addEventListener('click', () => this.toggleFallback(button));
+
+        const collapse = document.createElement('div');
+        collapse.className = 'fr-collapse';
+        collapse.id = `fr-sidemenu-${id}`;
+        collapse.appendChild(this.renderItems(children, id));
+        item.append(button, collapse);
+      } else {
+        const link = document.createElement(href ? 'a' : 'span');
+        link.className = 'fr-sidemenu__link';
+        if (href) {
+          link.href = href;
+        }
+        link.textContent = title;
+        item.appendChild(link);
+      }
+      list.appendChild(item);
+    });
+
+    if (!items.length) {
+      // Élément invisible si la liste est vide pour éviter les erreurs DSFR
+      const empty = document.createElement('li');
+      empty.style.display = 'none';
+      list.appendChild(empty);
+    }
+    return list;
+  }
+
+  toggleFallback(button) {
+    // Comme pour le menu de la page : bascule manuelle si DSFR n'a pas géré le clic
+    const target = document.getElementById(button.getAttribute('aria-controls'));
+    const stateBeforeClick = button.getAttribute('aria-expanded');
+    setTimeout(() => {
+      if (!target || button.getAttribute('aria-expanded') !== stateBeforeClick) {
+        return;
+      }
+      const expanded = stateBeforeClick !== 'true';
+      button.setAttribute('aria-expanded', expanded.toString());
+      target.classList.toggle('fr-collapse--expanded', expanded);
+      target.style.maxHeight = expanded ? 'none' : '0';
+      target.style.overflow = expanded ? 'visible' : 'hidden';
+    }, 200);
+  }
 }
 
 // Export pour utilisation
 window.NavigationModule = NavigationModule;
 
 // Initialisation automatique
-new NavigationModule();
\ No newline at end of file
+new NavigationModule();
@@ -1,25 +1,76 @@
 /**
  * Module de recherche MkDocs
  * Gère la recherche dans la documentation
+ *
+ * Si l'index fragmenté du thème (search/dsfr/) est disponible, les requêtes
+ * sont exécutées dans un Web Worker qui ne télécharge que les fragments
+ * utiles. Sinon, l'index complet de MkDocs est chargé comme auparavant.
  */
 
 class SearchModule {
   constructor() {
     this.searchIndex = null;
     this.searchConfig = null;
+    this.worker = null;
+    this.lastRequestId = 0;
+    this.inputTimer = null;
+    // URL absolue de la racine du site (base_url est défini par main.html)
+    this.baseUrl = new URL(window.base_url || '.', document.baseURI).href.replace(/\/$/, '');
     this.init();
   }
 
   async init() {
     console.log('Initialisation du module de recherche...');
-    await this.loadSearchIndex();
+    if (!(await this.initWorker())) {
+      await this.loadSearchIndex();
+    }
     this.setupEventListeners();
   }
 
+  // Démarre le worker de recherche ; résout false si l'index fragmenté est absent
+  initWorker() {
+    if (!window.Worker) {
+      return Promise.resolve(false);
+    }
+
+    return new Promise((resolve) => {
+      try {
+        this.worker = new Worker(`${this.baseUrl}/static/js/search.worker.js`);
+      } catch (error) {
+        this.worker = null;
+        resolve(false);
+        return;
+      }
+
+      const fallback = () => {
+        if (this.worker) {
+          this.worker.terminate();
+          this.worker = null;
+        }
+        resolve(false);
+      };
+
+      this.worker.addEventListener('message', (event) => {
+        const data = event.data;
+        if (data.type === 'ready') {
+          console.log('Index de recherche fragmenté disponible');
+          resolve(true);
+        } else if (data.type === 'unavailable') {
+          fallback();
+        } else if (data.type === 'results' && data.id === this.lastRequestId) {
+          // Seule la réponse à la dernière requête est affichée
+          this.displaySearchResults(data.results, data.query);
+        }
+      });
+      this.worker.addEventListener('error', fallback);
+      this.worker.postMessage({ type: 'init', baseUrl: this.baseUrl });
+    });
+  }
+
   // Fonction pour charger l'index de recherche
   async loadSearchIndex() {
     try {
-      const response = await fetch('search/search_index.json');
+      const response = await fetch(`${this.baseUrl}/search/search_index.json`);
       const data = await response.json();
       this.searchIndex = data.docs;
       this.searchConfig = data.config;
@@ -89,7 +140,7 @@ class SearchModule {
       
       html += '<div class="fr-list">';
       results.forEach(result => {
-        const url = result.location ? `${result.location}` : '#';
+        const url = result.location !== undefined ? `${this.baseUrl}/${result.location}` : '#';
         const title = result.title || 'Sans titre';
         const excerpt = result.text ? result.text.substring(0, 200) + '...' : '';
         
@@ -132,6 +183,12 @@ class SearchModule {
       return;
     }
     
+    if (this.worker) {
+      this.lastRequestId += 1;
+      this.worker.postMessage({ type: 'search', id: this.lastRequestId, query: query.trim(), limit: 10 });
+      return;
+    }
+    
     const results = this.searchDocuments(query.trim());
     this.displaySearchResults(results, query.trim());
   }
@@ -153,10 +210,14 @@ class SearchModule {
         }
       });
       
-      // Gestionnaire pour effacer la recherche
+      // Gestionnaire pour effacer la recherche, et recherche à la frappe
+      // quand le worker est disponible (hors du thread principal)
       searchInput.addEventListener('input', (e) => {
+        clearTimeout(this.inputTimer);
         if (e.target.value === '') {
           this.hideSearchResults();
+        } else if (this.worker) {
+          this.inputTimer = setTimeout(() => this.performSearch(e.target.value), 150);
         }
       });
     }
@@ -0,0 +1,358 @@
+/**
+ * Module de recherche MkDocs
+ * Gère la recherche dans la documentation
+ *
+ * Si l'index fragmenté du thème (search/dsfr/) est disponible, les requêtes
+ * sont exécutées dans un Web Worker qui ne télécharge que les fragments
+ * utiles. Sinon, l'index complet de MkDocs est chargé comme auparavant.
+ */
+
+class SearchModule {
+  constructor() {
+    this.searchIndex = null;
+    this.searchConfig = null;
+    this.worker = null;
+    this.lastRequestId = 0;
+    this.inputTimer = null;
+    // URL absolue de la racine du site (base_url est défini par main.html)
+    this.baseUrl = new URL(window.base_url || '.', document.baseURI).href.replace(/\/$/, '');
+    this.init();
+  }
+
+  async init() {
+    console.log('Initialisation du module de recherche...');
+    if (!(await this.initWorker())) {
+      await this.loadSearchIndex();
+    }
+    this.setupEventListeners();
+  }
+
+  // Démarre le worker de recherche ; résout false si l'index fragmenté est absent
+  initWorker() {
+    if (!window.Worker) {
+      return Promise.resolve(false);
+    }
+
+    return new Promise((resolve) => {
+      try {
+        this.worker = new Worker(`${this.baseUrl}/static/js/search.worker.js`);
+      } catch (error) {
+        this.worker = null;
+        resolve(false);
+        return;
+      }
+
+      const fallback = () => {
+        if (this.worker) {
+          this.worker.terminate();
+          this.worker = null;
+        }
+        resolve(false);
+      };
+
+      this.worker.addEventListener('message', (event) => {
+        const data = event.data;
+        if (data.type === 'ready') {
+          console.log('Index de recherche fragmenté disponible');
+          resolve(true);
+        } else if (data.type === 'unavailable') {
+          fallback();
+        } else if (data.type === 'results' && data.id === this.lastRequestId) {
+          // Seule la réponse à la dernière requête est affichée
+          this.displaySearchResults(data.results, data.query);
+        }
+      });
+      this.worker.addEventListener('error', fallback);
+      this.worker.postMessage({ type: 'init', baseUrl: this.baseUrl });
+    });
+  }
+
+  // Fonction pour charger l'index de recherche
+  async loadSearchIndex() {
+    try {
+      const response = await fetch(`${this.baseUrl}/search/search_index.json`);
+      const data = await response.json();
+      this.searchIndex = data.docs;
+      this.searchConfig = data.config;
+      console.log('Index de recherche chargé:', this.searchIndex.length, 'documents');
+    } catch (error) {
+      console.error('Erreur lors du chargement de l\'index de recherche:', error);
+    }
+  }
+
+  // Fonction de recherche simple (recherche dans le titre et le contenu)
+  searchDocuments(query) {
+    if (!this.searchIndex || !query || query.length < this.searchConfig.min_search_length) {
+      return [];
+    }
+    
+    const results = [];
+    const queryLower = query.toLowerCase();
+    
+    for (const doc of this.searchIndex) {
+      let score = 0;
+      const title = doc.title || '';
+      const text = doc.text || '';
+      
+      // Recherche dans le titre (score plus élevé)
+      if (title.toLowerCase().includes(queryLower)) {
+        score += 10;
+      }
+      
+      // Recherche dans le contenu
+      if (text.toLowerCase().includes(queryLower)) {
+        score += 1;
+      }
+      
+      // Recherche exacte (score encore plus élevé)
+      if (title.toLowerCase() === queryLower) {
+        score += 20;
+      }
+      
+      if (score > 0) {
+        results.push({
+          ...doc,
+          score: score
+        });
+      }
+    }
+    
+    // Trier par score décroissant
+    results.sort((a, b) => b.score - a.score);
+    
+    return results.slice(0, 10); // Limiter à 10 résultats
+  }
+
+  // Fonction pour afficher les résultats
+  displaySearchResults(results, query) {
+    const resultsContainer = document.getElementById('mkdocs-search-results');
+    const contentContainer = document.getElementById('mkdocs-search-results-content');
+    const mainContent = document.querySelector('main .fr-col-12.fr-col-md-9 > div:not(#mkdocs-search-results)');
+    
+    if (results.length === 0) {
+      contentContainer.innerHTML = `
+        <div class="fr-alert fr-alert--warning">
+          <p>Aucun résultat trouvé pour "${query}"</p>
+        </div>
+      `;
+    } else {
+      let html = `<div class="fr-alert fr-alert--success"><p>${results.length} résultat(s) trouvé(s) pour "${query}"</p></div>`;
+      
+      html += '<div class="fr-list">';
+      results.forEach(result => {
+        const url = result.location !== undefined ? `${this.baseUrl}/${result.location}` : '#';
+        const title = result.title || 'Sans titre';
+        const excerpt = result.text ? result.text.substring(0, 200) + '...' : '';
+        
+        html += `
+          <div class="fr-list__item">
+            <div class="fr-list__title">
+              <a href="${url}" class="fr-link">${title}</a>
+            </div>
+            ${excerpt ? `<div class="fr-list__desc">${excerpt}</div>` : ''}
+          </div>
+        `;
+      });
+      html += '</div>';
+      
+      contentContainer.innerHTML = html;
+    }
+    
+    // Afficher les résultats et masquer le contenu principal
+    resultsContainer.style.display = 'block';
+    if (mainContent) {
+      mainContent.style.display = 'none';
+    }
+  }
+
+  // Fonction pour masquer les résultats et afficher le contenu principal
+  hideSearchResults() {
+    const resultsContainer = document.getElementById('mkdocs-search-results');
+    const mainContent = document.querySelector('main .fr-col-12.fr-col-md-9 > div:not(#mkdocs-search-results)');
+    
+    resultsContainer.style.display = 'none';
+    if (mainContent) {
+      mainContent.style.display = 'block';
+    }
+  }
+
+  // Fonction de recherche principale
+  performSearch(query) {
+    if (!query || query.trim() === '') {
+      this.hideSearchResults();
+      return;
+    }
+    
+    if (this.worker) {
+      this.lastRequestId += 1;
+      this.worker.postMessage({ type: 'search', id: this.lastRequestId, query: query.trim(), limit: 10 });
+      return;
+    }
+    
+    const results = this.searchDocuments(query.trim());
+    this.displaySearchResults(results, query.trim());
+  }
+
+  setupEventListeners() {
+    // Gestionnaire pour le bouton de recherche
+    const searchButton = document.getElementById('search-button');
+    const searchInput = document.getElementById('search-query');
+    
+    if (searchButton && searchInput) {
+      searchButton.addEventListener('click', () => {
+        this.performSearch(searchInput.value);
+      });
+      
+      // Gestionnaire pour la touche Entrée
+      searchInput.addEventListener('keypress', (e) => {
+        if (e.key === 'Enter') {
+          this.performSearch(e.target.value);
+        }
+      });
+      
+      // Gestionnaire pour effacer la recherche, et recherche à la frappe
+      // quand le worker est disponible (hors du thread principal)
+      searchInput.addEventListener('input', (e) => {
+        clearTimeout(this.inputTimer);
+        if (e.target.value === '') {
+          this.hideSearchResults();
+        } else if (this.worker) {
+          this.inputTimer = setTimeout(() => this.performSearch(e.target.value), 150);
+        }
+      });
+    }
+    
+    console.log('Module de recherche initialisé');
+  }
+}
+
+// Export pour utilisation
+window.SearchModule = SearchModule;
+
+;
+/**
+ * Module de gestion responsive
+ * Gère les adaptations pour différentes tailles d'écran selon les standards DSFR
+ */
+
+class ResponsiveModule {
+  constructor() {
+    this.breakpoints = {
+      mobile: 576,
+      tablet: 768,
+      desktop: 992,
+      large: 1200
+    };
+    this.init();
+  }
+
+  init() {
+    // DSFR FIRST : DSFR gère nativement le responsive
+    this.initBreadcrumbResponsive();
+    // initSidebarToggle et initSidebarResizer supprimés - DSFR gère cela nativement
+  }
+
+  // Méthodes utilitaires pour les breakpoints DSFR
+  isMobile() {
+    return window.innerWidth < this.breakpoints.tablet;
+  }
+
+  isTablet() {
+    return window.innerWidth >= this.breakpoints.tablet && window.innerWidth < this.breakpoints.desktop;
+  }
+
+  isDesktop() {
+    return window.innerWidth >= this.breakpoints.desktop;
+  }
+
+  isLargeScreen() {
+    return window.innerWidth >= this.breakpoints.large;
+  }
+
+  // Gestion responsive simple du fil d'Ariane
+  initBreadcrumbResponsive() {
+    const breadcrumbButton = document.querySelector('.fr-breadcrumb__button');
+    const breadcrumbCollapse = document.querySelector('#breadcrumb-collapse');
+    
+    if (breadcrumbButton && breadcrumbCollapse) {
+      const handleBreadcrumbResponsive = () => {
+        if (this.isDesktop()) {
+          // Sur desktop/tablet, toujours afficher le fil d'Ariane
+          breadcrumbCollapse.classList.remove('fr-collapse');
+          breadcrumbButton.style.display = 'none';
+        } else {
+          // Sur mobile, montrer le bouton et gérer le collapse
+          breadcrumbButton.style.display = 'block';
+          if (breadcrumbButton.getAttribute('aria-expanded') !== 'true') {
+            breadcrumbCollapse.classList.add('fr-collapse');
+          }
+        }
+      };
+      
+      window.addEventListener('resize', handleBreadcrumbResponsive);
+      handleBreadcrumbResponsive(); // Initialisation
+    }
+  }
+
+}
+
+// Export pour utilisation
+window.ResponsiveModule = ResponsiveModule;
+
+;
+/**
+ * Fichier principal du thème DSFR
+ * Initialise tous les modules
+ */
+
+class DSFRTheme {
+  constructor() {
+    this.modules = {};
+    this.init();
+  }
+
+  async init() {
+    // Initialiser les modules dans l'ordre approprié
+    await this.initializeModules();
+  }
+
+  async initializeModules() {
+    try {
+      // Module de recherche
+      if (window.SearchModule) {
+        this.modules.search = new SearchModule();
+      }
+
+      // Module de copie de code
+      if (window.CodeCopyModule) {
+        this.modules.codeCopy = new CodeCopyModule();
+      }
+
+      // Module responsive
+      if (window.ResponsiveModule) {
+        this.modules.responsive = new ResponsiveModule();
+      }
+
+    } catch (error) {
+      // Erreur silencieuse pour éviter la pollution de la console
+    }
+  }
+
+  // Méthode pour réinitialiser les modules si nécessaire
+  reinitialize() {
+    this.init();
+  }
+
+  // Méthode pour accéder aux modules depuis l'extérieur
+  getModule(name) {
+    return this.modules[name];
+  }
+}
+
+// Initialisation automatique quand le DOM est prêt
+document.addEventListener('DOMContentLoaded', () => {
+  window.dsfrTheme = new DSFRTheme();
+});
+
+// Export pour utilisation externe
+window.DSFRTheme = DSFRTheme;
@@ -0,0 +1,556 @@
+/**
+ * Module de recherche MkDocs
+ * Gère la recherche dans la documentation
+ *
+ * Si l'index fragmenté du thème (search/dsfr/) est disponible, les requêtes
+ * sont exécutées dans un Web Worker qui ne télécharge que les fragments
+ * utiles. Sinon, l'index complet de MkDocs est chargé comme auparavant.
+ */
+
+class SearchModule {
+  constructor() {
+    this.searchIndex = null;
+    this.searchConfig = null;
+    this.worker = null;
+    this.lastRequestId = 0;
+    this.inputTimer = null;
+    // URL absolue de la racine du site (base_url est défini par main.html)
+    this.baseUrl = new URL(window.base_url || '.', document.baseURI).href.replace(/\/$/, '');
+    this.init();
+  }
+
+  async init() {
+    console.log('Initialisation du module de recherche...');
+    if (!(await this.initWorker())) {
+      await this.loadSearchIndex();
+    }
+    this.setupEventListeners();
+  }
+
+  // Démarre le worker de recherche ; résout false si l'index fragmenté est absent
+  initWorker() {
+    if (!window.Worker) {
+      return Promise.resolve(false);
+    }
+
+    return new Promise((resolve) => {
+      try {
+        this.worker = new Worker(`${this.baseUrl}/static/js/search.worker.js`);
+      } catch (error) {
+        this.worker = null;
+        resolve(false);
+        return;
+      }
+
+      const fallback = () => {
+        if (this.worker) {
+          this.worker.terminate();
+          this.worker = null;
+        }
+        resolve(false);
+      };
+
+      this.worker.addEventListener('message', (event) => {
+        const data = event.data;
+        if (data.type === 'ready') {
+          console.log('Index de recherche fragmenté disponible');
+          resolve(true);
+        } else if (data.type === 'unavailable') {
+          fallback();
+        } else if (data.type === 'results' && data.id === this.lastRequestId) {
+          // Seule la réponse à la dernière requête est affichée
+          this.displaySearchResults(data.results, data.query);
+        }
+      });
+      this.worker.addEventListener('error', fallback);
+      this.worker.postMessage({ type: 'init', baseUrl: this.baseUrl });
+    });
+  }
+
+  // Fonction pour charger l'index de recherche
+  async loadSearchIndex() {
+    try {
+      const response = await fetch(`${this.baseUrl}/search/search_index.json`);
+      const data = await response.json();
+      this.searchIndex = data.docs;
+      this.searchConfig = data.config;
+      console.log('Index de recherche chargé:', this.searchIndex.length, 'documents');
+    } catch (error) {
+      console.error('Erreur lors du chargement de l\'index de recherche:', error);
+    }
+  }
+
+  // Fonction de recherche simple (recherche dans le titre et le contenu)
+  searchDocuments(query) {
+    if (!this.searchIndex || !query || query.length < this.searchConfig.min_search_length) {
+      return [];
+    }
+    
+    const results = [];
+    const queryLower = query.toLowerCase();
+    
+    for (const doc of this.searchIndex) {
+      let score = 0;
+      const title = doc.title || '';
+      const text = doc.text || '';
+      
+      // Recherche dans le titre (score plus élevé)
+      if (title.toLowerCase().includes(queryLower)) {
+        score += 10;
+      }
+      
+      // Recherche dans le contenu
+      if (text.toLowerCase().includes(queryLower)) {
+        score += 1;
+      }
+      
+      // Recherche exacte (score encore plus élevé)
+      if (title.toLowerCase() === queryLower) {
+        score += 20;
+      }
+      
+      if (score > 0) {
+        results.push({
+          ...doc,
+          score: score
+        });
+      }
+    }
+    
+    // Trier par score décroissant
+    results.sort((a, b) => b.score - a.score);
+    
+    return results.slice(0, 10); // Limiter à 10 résultats
+  }
+
+  // Fonction pour afficher les résultats
+  displaySearchResults(results, query) {
+    const resultsContainer = document.getElementById('mkdocs-search-results');
+    const contentContainer = document.getElementById('mkdocs-search-results-content');
+    const mainContent = document.querySelector('main .fr-col-12.fr-col-md-9 > div:not(#mkdocs-search-results)');
+    
+    if (results.length === 0) {
+      contentContainer.innerHTML = `
+        <div class="fr-alert fr-alert--warning">
+          <p>Aucun résultat trouvé pour "${query}"</p>
+        </div>
+      `;
+    } else {
+      let html = `<div class="fr-alert fr-alert--success"><p>${results.length} résultat(s) trouvé(s) pour "${query}"</p></div>`;
+      
+      html += '<div class="fr-list">';
+      results.forEach(result => {
+        const url = result.location !== undefined ? `${this.baseUrl}/${result.location}` : '#';
+        const title = result.title || 'Sans titre';
+        const excerpt = result.text ? result.text.substring(0, 200) + '...' : '';
+        
+        html += `
+          <div class="fr-list__item">
+            <div class="fr-list__title">
+              <a href="${url}" class="fr-link">${title}</a>
+            </div>
+            ${excerpt ? `<div class="fr-list__desc">${excerpt}</div>` : ''}
+          </div>
+        `;
+      });
+      html += '</div>';
+      
+      contentContainer.innerHTML = html;
+    }
+    
+    // Afficher les résultats et masquer le contenu principal
+    resultsContainer.style.display = 'block';
+    if (mainContent) {
+      mainContent.style.display = 'none';
+    }
+  }
+
+  // Fonction pour masquer les résultats et afficher le contenu principal
+  hideSearchResults() {
+    const resultsContainer = document.getElementById('mkdocs-search-results');
+    const mainContent = document.querySelector('main .fr-col-12.fr-col-md-9 > div:not(#mkdocs-search-results)');
+    
+    resultsContainer.style.display = 'none';
+    if (mainContent) {
+      mainContent.style.display = 'block';
+    }
+  }
+
+  // Fonction de recherche principale
+  performSearch(query) {
+    if (!query || query.trim() === '') {
+      this.hideSearchResults();
+      return;
+    }
+    
+    if (this.worker) {
+      this.lastRequestId += 1;
+      this.worker.postMessage({ type: 'search', id: this.lastRequestId, query: query.trim(), limit: 10 });
+      return;
+    }
+    
+    const results = this.searchDocuments(query.trim());
+    this.displaySearchResults(results, query.trim());
+  }
+
+  setupEventListeners() {
+    // Gestionnaire pour le bouton de recherche
+    const searchButton = document.getElementById('search-button');
+    const searchInput = document.getElementById('search-query');
+    
+    if (searchButton && searchInput) {
+      searchButton.addEventListener('click', () => {
+        this.performSearch(searchInput.value);
+      });
+      
+      // Gestionnaire pour la touche Entrée
+      searchInput.addEventListener('keypress', (e) => {
+        if (e.key === 'Enter') {
+          this.performSearch(e.target.value);
+        }
+      });
+      
+      // Gestionnaire pour effacer la recherche, et recherche à la frappe
+      // quand le worker est disponible (hors du thread principal)
+      searchInput.addEventListener('input', (e) => {
+        clearTimeout(this.inputTimer);
+        if (e.target.value === '') {
+          this.hideSearchResults();
+        } else if (this.worker) {
+          this.inputTimer = setTimeout(() => this.performSearch(e.target.value), 150);
+        }
+      });
+    }
+    
+    console.log('Module de recherche initialisé');
+  }
+}
+
+// Export pour utilisation
+window.SearchModule = SearchModule;
+
+;
+/**
+ * Module de copie de code
+ * Ajoute des boutons de copie aux blocs de code
+ */
+
+class CodeCopyModule {
+  constructor() {
+    this.init();
+  }
+
+  init() {
+    this.addCopyButtons();
+    this.setupMutationObserver();
+  }
+
+  // Fonction pour ajouter les boutons de copie aux blocs de code
+  addCopyButtons() {
+    // Trouver tous les blocs de code
+    const codeBlocks = document.querySelectorAll('pre code, .highlight pre, .codehilite pre');
+    
+    codeBlocks.forEach((codeBlock) => {
+      // Vérifier si un bouton de copie existe déjà
+      const existingButton = codeBlock.parentElement.querySelector('.copy-code-button');
+      if (existingButton) {
+        return; // Bouton déjà présent
+      }
+      
+      // Créer le bouton de copie
+      const copyButton = this.createCopyButton();
+      
+      // Ajouter le bouton au conteneur approprié
+      this.appendButtonToContainer(codeBlock, copyButton);
+    });
+  }
+
+  createCopyButton() {
+    const copyButton = document.createElement('button');
+    copyButton.className = 'copy-code-button';
+    copyButton.setAttribute('aria-label', 'Copier le code');
+    copyButton.title = 'Copier le code';
+    
+    // Ajouter l'icône et le texte
+    copyButton.innerHTML = `
+      <svg class="copy-icon" viewBox="0 0 24 24" aria-hidden="true">
+        <path d="M16 1H4c-1.1 0-2 .9-2 2v14h2V3h12V1zm3 4H8c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h11c1.1 0 2-.9 2-2V7c0-1.1-.9-2-2-2zm0 16H8V7h11v14z"/>
+      </svg>
+      Copier
+    `;
+    
+    // Gérer le clic sur le bouton
+    copyButton.addEventListener('click', (e) => {
+      e.preventDefault();
+      e.stopPropagation();
+      this.handleCopyClick(copyButton);
+    });
+
+    return copyButton;
+  }
+
+  appendButtonToContainer(codeBlock, copyButton) {
+    const container = codeBlock.parentElement;
+    if (container.tagName === 'PRE') {
+      // Le code est dans un <pre>, ajouter le bouton au parent du <pre>
+      const wrapper = container.parentElement;
+      if (wrapper && !wrapper.classList.contains('highlight')) {
+        // Créer un wrapper si nécessaire
+        const highlightWrapper = document.createElement('div');
+        highlightWrapper.className = 'highlight';
+        container.parentNode.insertBefore(highlightWrapper, container);
+        highlightWrapper.appendChild(container);
+        highlightWrapper.appendChild(copyButton);
+      } else {
+        wrapper.appendChild(copyButton);
+      }
+    } else {
+      // Le code est dans un autre conteneur
+      container.style.position = 'relative';
+      container.appendChild(copyButton);
+    }
+  }
+
+  handleCopyClick(copyButton) {
+    // Récupérer le texte du code
+    const codeBlock = copyButton.parentElement.querySelector('code, pre');
+    if (!codeBlock) return;
+
+    let codeText = codeBlock.textContent || codeBlock.innerText;
+    
+    // Nettoyer le texte (enlever les numéros de ligne, etc.)
+    codeText = codeText.replace(/^\d+\s+/gm, ''); // Enlever les numéros de ligne
+    codeText = codeText.trim();
+    
+    // Copier dans le presse-papiers
+    if (navigator.clipboard && window.isSecureContext) {
+      // API moderne
+      navigator.clipboard.writeText(codeText).then(() => {
+        this.showCopySuccess(copyButton);
+      }).catch(() => {
+        this.fallbackCopy(codeText, copyButton);
+      });
+    } else {
+      // Fallback pour les navigateurs plus anciens
+      this.fallbackCopy(codeText, copyButton);
+    }
+  }
+
+  // Fonction de fallback pour la copie
+  fallbackCopy(text, button) {
+    const textArea = document.createElement('textarea');
+    textArea.value = text;
+    textArea.style.position = 'fixed';
+    textArea.style.left = '-999999px';
+    textArea.style.top = '-999999px';
+    document.body.appendChild(textArea);
+    textArea.focus();
+    textArea.select();
+    
+    try {
+      const successful = document.execCommand('copy');
+      if (successful) {
+        this.showCopySuccess(button);
+      } else {
+        this.showCopyError(button);
+      }
+    } catch (err) {
+      this.showCopyError(button);
+    } finally {
+      document.body.removeChild(textArea);
+    }
+  }
+
+  // Fonction pour afficher le succès de la copie
+  showCopySuccess(button) {
+    const originalText = button.innerHTML;
+    button.classList.add('copied');
+    button.innerHTML = `
+      <svg class="copy-icon" viewBox="0 0 24 24" aria-hidden="true">
+        <path d="M9 16.17L4.83 12l-1.42 1.41L9 19 21 7l-1.41-1.41z"/>
+      </svg>
+      Copié !
+    `;
+    
+    setTimeout(() => {
+      button.classList.remove('copied');
+      button.innerHTML = originalText;
+    }, 2000);
+  }
+
+  // Fonction pour afficher l'erreur de copie
+  showCopyError(button) {
+    const originalText = button.innerHTML;
+    button.style.background = '#dc3545';
+    button.innerHTML = `
+      <svg class="copy-icon" viewBox="0 0 24 24" aria-hidden="true">
+        <path d="M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"/>
+      </svg>
+      Erreur
+    `;
+    
+    setTimeout(() => {
+      button.style.background = '';
+      button.innerHTML = originalText;
+    }, 2000);
+  }
+
+  setupMutationObserver() {
+    // Observer les changements dans le DOM pour ajouter les boutons aux nouveaux blocs de code
+    if (window.MutationObserver) {
+      const observer = new MutationObserver((mutations) => {
+        mutations.forEach((mutation) => {
+          if (mutation.type === 'childList' && mutation.addedNodes.length > 0) {
+            // Vérifier si de nouveaux blocs de code ont été ajoutés
+            const hasCodeBlocks = Array.from(mutation.addedNodes).some((node) => {
+              return node.nodeType === 1 && (
+                node.tagName === 'PRE' ||
+                node.querySelector && node.querySelector('pre')
+              );
+            });
+            
+            if (hasCodeBlocks) {
+              setTimeout(() => this.addCopyButtons(), 100); // Petit délai pour laisser le temps au rendu
+            }
+          }
+        });
+      });
+      
+      observer.observe(document.body, {
+        childList: true,
+        subtree: true
+      });
+    }
+  }
+}
+
+// Export pour utilisation
+window.CodeCopyModule = CodeCopyModule;
+
+;
+/**
+ * Module de gestion responsive
+ * Gère les adaptations pour différentes tailles d'écran selon les standards DSFR
+ */
+
+class ResponsiveModule {
+  constructor() {
+    this.breakpoints = {
+      mobile: 576,
+      tablet: 768,
+      desktop: 992,
+      large: 1200
+    };
+    this.init();
+  }
+
+  init() {
+    // DSFR FIRST : DSFR gère nativement le responsive
+    this.initBreadcrumbResponsive();
+    // initSidebarToggle et initSidebarResizer supprimés - DSFR gère cela nativement
+  }
+
+  // Méthodes utilitaires pour les breakpoints DSFR
+  isMobile() {
+    return window.innerWidth < this.breakpoints.tablet;
+  }
+
+  isTablet() {
+    return window.innerWidth >= this.breakpoints.tablet && window.innerWidth < this.breakpoints.desktop;
+  }
+
+  isDesktop() {
+    return window.innerWidth >= this.breakpoints.desktop;
+  }
+
+  isLargeScreen() {
+    return window.innerWidth >= this.breakpoints.large;
+  }
+
+  // Gestion responsive simple du fil d'Ariane
+  initBreadcrumbResponsive() {
+    const breadcrumbButton = document.querySelector('.fr-breadcrumb__button');
+    const breadcrumbCollapse = document.querySelector('#breadcrumb-collapse');
+    
+    if (breadcrumbButton && breadcrumbCollapse) {
+      const handleBreadcrumbResponsive = () => {
+        if (this.isDesktop()) {
+          // Sur desktop/tablet, toujours afficher le fil d'Ariane
+          breadcrumbCollapse.classList.remove('fr-collapse');
+          breadcrumbButton.style.display = 'none';
+        } else {
+          // Sur mobile, montrer le bouton et gérer le collapse
+          breadcrumbButton.style.display = 'block';
+          if (breadcrumbButton.getAttribute('aria-expanded') !== 'true') {
+            breadcrumbCollapse.classList.add('fr-collapse');
+          }
+        }
+      };
+      
+      window.addEventListener('resize', handleBreadcrumbResponsive);
+      handleBreadcrumbResponsive(); // Initialisation
+    }
+  }
+
+}
+
+// Export pour utilisation
+window.ResponsiveModule = ResponsiveModule;
+
+;
+/**
+ * Fichier principal du thème DSFR
+ * Initialise tous les modules
+ */
+
+class DSFRTheme {
+  constructor() {
+    this.modules = {};
+    this.init();
+  }
+
+  async init() {
+    // Initialiser les modules dans l'ordre approprié
+    await this.initializeModules();
+  }
+
+  async initializeModules() {
+    try {
+      // Module de recherche
+      if (window.SearchModule) {
+        this.modules.search = new SearchModule();
+      }
+
+      // Module de copie de code
+      if (window.CodeCopyModule) {
+        this.modules.codeCopy = new CodeCopyModule();
+      }
+
+      // Module responsive
+      if (window.ResponsiveModule) {
+        this.modules.responsive = new ResponsiveModule();
+      }
+
+    } catch (error) {
+      // Erreur silencieuse pour éviter la pollution de la console
+    }
+  }
+
+  // Méthode pour réinitialiser les modules si nécessaire
+  reinitialize() {
+    this.init();
+  }
+
+  // Méthode pour accéder aux modules depuis l'extérieur
+  getModule(name) {
+    return this.modules[name];
+  }
+}
+
+// Initialisation automatique quand le DOM est prêt
+document.addEventListener('DOMContentLoaded', () => {
+  window.dsfrTheme = new DSFRTheme();
+});
+
+// Export pour utilisation externe
+window.DSFRTheme = DSFRTheme;
@@ -0,0 +1,127 @@
+/**
+ * Worker de recherche
+ * Interroge l'index fragmenté (search/dsfr/) généré par le thème :
+ * seuls les fragments correspondant aux termes saisis sont téléchargés.
+ */
+
+let baseUrl = '.';
+let manifest = null;
+const shards = new Map();
+const docChunks = new Map();
+
+// Même normalisation que search_index.py : accents supprimés, minuscules
+function normalize(text) {
+  return text.normalize('NFD').replace(/\p{Mn}/gu, '').toLowerCase();
+}
+
+function tokenize(text) {
+  return normalize(text).match(/[\p{L}\p{N}]+/gu) || [];
+}
+
+async function fetchJson(path) {
+  const response = await fetch(`${baseUrl}/search/dsfr/${path}`);
+  if (!response.ok) {
+    throw new Error(`${response.status} ${path}`);
+  }
+  return response.json();
+}
+
+async function loadManifest() {
+  if (!manifest) {
+    manifest = await fetchJson('manifest.json');
+  }
+  return manifest;
+}
+
+function loadDocChunk(chunk) {
+  if (!docChunks.has(chunk)) {
+    docChunks.set(chunk, fetchJson(manifest.docs[chunk]));
+  }
+  return docChunks.get(chunk);
+}
+
+// Titre et extrait d'un document (bloc téléchargé à la demande)
+async function loadDocument(docId) {
+  const chunk = Math.floor(docId / manifest.docs_per_chunk);
+  const docs = await loadDocChunk(chunk);
+  return docs[docId % manifest.docs_per_chunk];
+}
+
+function loadShard(prefix) {
+  if (!shards.has(prefix)) {
+    const file = manifest.shards[prefix];
+    // Promesse mise en cache : un fragment n'est téléchargé qu'une fois
+    shards.set(prefix, file ? fetchJson(file).catch(() => ({})) : Promise.resolve({}));
+  }
+  return shards.get(prefix);
+}
+
+// Scores par document pour un terme (correspondance par préfixe)
+async function scoreTerm(term) {
+  const shard = await loadShard(term.slice(0, manifest.prefix_length));
+  const scores = new Map();
+  for (const [indexed, postings] of Object.entries(shard)) {
+    if (!indexed.startsWith(term)) {
+      continue;
+    }
+    // Correspondance exacte favorisée par rapport au préfixe
+    const boost = indexed === term ? 2 : 1;
+    for (const [docId, score] of postings) {
+      scores.set(docId, (scores.get(docId) || 0) + score * boost);
+    }
+  }
+  return scores;
+}
+
+async function search(query, limit) {
+  await loadManifest();
+  const terms = [...new Set(tokenize(query))].filter((term) => term.length >= manifest.prefix_length);
+  if (terms.length === 0 || normalize(query).trim().length < manifest.min_search_length) {
+    return [];
+  }
+
+  const termScores = await Promise.all(terms.map(scoreTerm));
+
+  // Tous les termes doivent être présents
+  let total = termScores[0];
+  for (const scores of termScores.slice(1)) {
+    const merged = new Map();
+    for (const [docId, score] of total) {
+      if (scores.has(docId)) {
+        merged.set(docId, score + scores.get(docId));
+      }
+    }
+    total = merged;
+  }
+
+  const best = [...total.entries()]
+    .sort((a, b) => b[1] - a[1])
+    .slice(0, limit);
+
+  return Promise.all(best.map(async ([docId, score]) => {
+    const [location, title, text] = await loadDocument(docId);
+    return { location, title, text, score };
+  }));
+}
+
+self.addEventListener('message', async (event) => {
+  const { type, id, query, limit } = event.data;
+  if (type === 'init') {
+    baseUrl = event.data.baseUrl;
+    try {
+      await loadManifest();
+      self.postMessage({ type: 'ready' });
+    } catch (error) {
+      self.postMessage({ type: 'unavailable', error: String(error) });
+    }
+    return;
+  }
+
+  if (type === 'search') {
+    try {
+      self.postMessage({ type: 'results', id, query, results: await search(query, limit) });
+    } catch (error) {
+      self.postMessage({ type: 'results', id, query, results: [], error: String(error) });
+    }
+  }
+});
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Sortie structurée des scripts tri_wordpress.py et update_nav.py.
+
+Utilisé pour suivre les longues exécutions en CI :
+- un flux d'événements JSON, un objet par ligne (stdout ou fichier), avec pour
+  chaque événement son type ('evenement'), le script et l'horodatage ;
+- un fichier texte au format Prometheus, à déposer dans le répertoire du
+  collecteur textfile de node_exporter. Il est réécrit de manière atomique
+  (fichier temporaire puis renommage) pour ne jamais être lu à moitié écrit.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+# Métrique Prometheus : (nom, aide, valeur) ou (nom, aide, {étiquettes: valeur})
+Metric = Tuple[str, str, Union[float, Dict[Tuple[Tuple[str, str], ...], float]]]
+
+
+def throughput(amount: float, seconds: float) -> float:
+    """Débit par seconde, arrondi (0 pour une durée nulle)."""
+    return round(amount / seconds, 3) if seconds > 0 else 0.0
+
+
+class EventLog:
+    """
+    Flux d'événements JSON lines et métriques Prometheus d'une exécution.
+
+    Sans chemin d'événements ni fichier Prometheus, toutes les méthodes sont
+    sans effet : les scripts peuvent les appeler sans condition.
+    """
+
+    def __init__(self, script: str, events_path: Optional[str] = None,
+                 prometheus_path: Optional[str] = None):
+        self.script = script
+        self.prometheus_path = prometheus_path
+        self._lock = threading.Lock()
+        self._owned = False
+        if events_path == '-':
+            # Référence prise avant une éventuelle redirection de stdout
+            self._stream = sys.stdout
+        elif events_path:
+            self._stream = open(events_path, 'a', encoding='utf-8')
+            self._owned = True
+        else:
+            self._stream = None
+
+    @property
+    def to_stdout(self) -> bool:
+        """True si les événements sont écrits sur la sortie standard."""
+        return self._stream is not None and not self._owned
+
+    def emit(self, event: str, **fields: Any):
+        """Écrit un événement (une ligne JSON) et vide le tampon."""
+        if self._stream is None:
+            return
+        record = {'evenement': event, 'script': self.script, 'horodatage': round(time.time(), 3)}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._stream.write(line + '\n')
+            self._stream.flush()
+
+    def write_prometheus(self, metrics: Iterable[Metric]):
+        """
+        Réécrit le fichier Prometheus avec les métriques fournies (jauges
+        préfixées par le nom du script) et l'horodatage de l'écriture.
+        """
+        if not self.prometheus_path:
+            return
+        lines = []
+        all_metrics = list(metrics) + [
+            ('derniere_execution_horodatage_secondes', "Horodatage de la dernière écriture", time.time()),
+        ]
+        for name, help_text, value in all_metrics:
+            full_name = f"{self.script}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} gauge")
+            if isinstance(value, dict):
+                for labels, labelled_value in value.items():
+                    label_text = ','.join(f'{key}="{label}"' for key, label in labels)
+                    lines.append(f"{full_name}{{{label_text}}} {labelled_value}")
+            else:
+                lines.append(f"{full_name} {value}")
+
+        temporary = f"{self.prometheus_path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(temporary, self.prometheus_path)
+
+    def close(self):
+        if self._owned:
+            self._stream.close()
+        self._stream = None
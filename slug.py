@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Conversion de titres en noms de fichiers (slugs).
+
+Résultat identique à la version d'origine de
+tri_wordpress.nettoyer_titre_pour_fichier (conservée ici sous le nom
+slugify_reference et comparée par test_slug.py), mais plus rapide :
+- les titres ASCII et Latin-1 (cas de presque tous les titres WordPress)
+  passent par une table str.translate précalculée qui applique en une fois
+  la décomposition NFD, la suppression des accents et des caractères
+  spéciaux, et le remplacement des espaces par des tirets ;
+- les autres titres sont normalisés en NFD puis filtrés par une table
+  complétée au fil des caractères rencontrés ;
+- slugify garde en cache les titres déjà convertis (simulation puis
+  exécution réelle, planification...) ; slugify_many convertit un lot de
+  titres en ne traitant qu'une fois chaque titre distinct.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Nom utilisé quand le titre est vide ou ne contient aucun caractère conservé
+SLUG_VIDE = "article_sans_titre"
+
+# Longueur maximale d'un slug (problèmes de système de fichiers au-delà)
+LONGUEUR_MAX = 100
+
+TAILLE_CACHE = 65536
+
+CARACTERE_SPECIAL = re.compile(r'[^\w\s-]')
+SEPARATEUR = re.compile(r'[-\s]')
+
+
+def slugify_reference(titre):
+    """
+    Implémentation d'origine de nettoyer_titre_pour_fichier, référence du
+    comportement attendu de slugify.
+    """
+    if not titre:
+        return SLUG_VIDE
+
+    titre_normalise = unicodedata.normalize('NFD', titre)
+    titre_ascii = ''.join(c for c in titre_normalise if unicodedata.category(c) != 'Mn')
+    titre_nettoye = re.sub(r'[^\w\s-]', '', titre_ascii)
+    titre_nettoye = re.sub(r'[-\s]+', '-', titre_nettoye)
+    titre_nettoye = titre_nettoye.strip('-')
+    if len(titre_nettoye) > LONGUEUR_MAX:
+        titre_nettoye = titre_nettoye[:LONGUEUR_MAX].rstrip('-')
+    titre_nettoye = titre_nettoye.lower()
+    if not titre_nettoye:
+        return SLUG_VIDE
+    return titre_nettoye
+
+
+class _TableCaracteres(dict):
+    """
+    Table str.translate pour un texte déjà décomposé (NFD) : accents et
+    caractères spéciaux supprimés, espaces remplacés par des tirets.
+    Chaque caractère est classé à sa première rencontre.
+    """
+
+    def __missing__(self, code):
+        caractere = chr(code)
+        if unicodedata.category(caractere) == 'Mn' or CARACTERE_SPECIAL.match(caractere):
+            valeur = None
+        elif SEPARATEUR.match(caractere):
+            valeur = '-'
+        else:
+            valeur = caractere
+        self[code] = valeur
+        return valeur
+
+
+_TABLE_NFD = _TableCaracteres()
+
+# Un caractère Latin-1 se décompose en une lettre suivie d'au plus un accent :
+# décomposer caractère par caractère équivaut à décomposer tout le titre
+_TABLE_LATIN1 = {
+    code: unicodedata.normalize('NFD', chr(code)).translate(_TABLE_NFD)
+    for code in range(256)
+}
+
+
+def _slugify(titre):
+    if not titre:
+        return SLUG_VIDE
+
+    if titre.isascii() or max(titre) <= '\xff':
+        filtre = titre.translate(_TABLE_LATIN1)
+    else:
+        filtre = unicodedata.normalize('NFD', titre).translate(_TABLE_NFD)
+
+    # Tirets consécutifs fusionnés, tirets de début et de fin supprimés
+    slug = '-'.join(partie for partie in filtre.split('-') if partie)
+    if len(slug) > LONGUEUR_MAX:
+        slug = slug[:LONGUEUR_MAX].rstrip('-')
+    slug = slug.lower()
+    return slug or SLUG_VIDE
+
+
+@lru_cache(maxsize=TAILLE_CACHE)
+def slugify(titre):
+    """
+    Convertit un titre en nom de fichier valide (résultat mis en cache).
+
+    Args:
+        titre (str): Titre de l'article
+
+    Returns:
+        str: Nom de fichier : minuscules sans accents, mots séparés par des
+        tirets, 100 caractères au plus ; SLUG_VIDE si rien n'est conservé
+    """
+    return _slugify(titre)
+
+
+def slugify_many(titres):
+    """
+    Convertit une liste de titres, sans passer par le cache de slugify
+    (un lot de dizaines de milliers de titres l'évincerait).
+
+    Returns:
+        list: Slugs dans l'ordre des titres
+    """
+    slugs = {}
+    resultat = []
+    for titre in titres:
+        slug = slugs.get(titre)
+        if slug is None:
+            slug = slugs[titre] = _slugify(titre)
+        resultat.append(slug)
+    return resultat
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Synchronisation incrémentale d'un article WordPress vers sa destination
+
+Au lieu de supprimer puis recopier tout le dossier de destination, seuls les
+fichiers nouveaux ou modifiés sont copiés. La comparaison se fait sur la
+taille et la date de modification, et optionnellement sur une empreinte
+SHA-256 du contenu. Un manifeste JSON est conservé à côté de la destination
+(.<nom>.manifest.json) pour mémoriser l'état de la dernière synchronisation.
+
+Une destination transformée après la copie (images optimisées, voir
+medias.py) n'a plus la taille de sa source : le manifeste mémorise alors le
+fichier produit ('derive' : clé des paramètres de la transformation, taille
+et date du fichier produit, voir enregistrer_derives). Tant que la source, la
+clé et le fichier produit sont inchangés, la destination est à jour.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from collections import Counter
+
+from liaison import lier_fichier
+
+VERSION_MANIFESTE = 1
+TAILLE_BLOC_HASH = 1024 * 1024
+
+
+def chemin_manifeste(destination_complete):
+    """
+    Retourne le chemin du manifeste associé à une destination
+
+    Args:
+        destination_complete (str): Chemin du dossier ou fichier de destination
+
+    Returns:
+        str: Chemin du fichier manifeste, placé à côté de la destination
+    """
+    parent, nom = os.path.split(os.path.normpath(destination_complete))
+    return os.path.join(parent, f".{nom}.manifest.json")
+
+
+def calculer_hash(chemin):
+    """
+    Calcule l'empreinte SHA-256 d'un fichier par blocs
+
+    Args:
+        chemin (str): Chemin du fichier
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    empreinte = hashlib.sha256()
+    with open(chemin, 'rb') as f:
+        for bloc in iter(lambda: f.read(TAILLE_BLOC_HASH), b''):
+            empreinte.update(bloc)
+    return empreinte.hexdigest()
+
+
+def lire_manifeste(chemin):
+    """
+    Lit un manifeste de synchronisation
+
+    Args:
+        chemin (str): Chemin du manifeste
+
+    Returns:
+        dict: Entrées du manifeste par chemin relatif (vide si absent ou illisible)
+    """
+    try:
+        with open(chemin, 'r', encoding='utf-8') as f:
+            donnees = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(donnees, dict) or donnees.get('version') != VERSION_MANIFESTE:
+        return {}
+    return donnees.get('fichiers', {})
+
+
+def ecrire_manifeste(chemin, source, fichiers):
+    """
+    Écrit le manifeste de manière atomique (fichier temporaire puis renommage)
+
+    Args:
+        chemin (str): Chemin du manifeste
+        source (str): Chemin source synchronisé
+        fichiers (dict): Entrées par chemin relatif
+    """
+    temporaire = f"{chemin}.tmp"
+    with open(temporaire, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': VERSION_MANIFESTE,
+            'source': os.path.abspath(source),
+            'fichiers': fichiers,
+        }, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temporaire, chemin)
+
+
+def lister_fichiers(racine):
+    """
+    Liste les fichiers d'un dossier (ou le fichier lui-même)
+
+    Args:
+        racine (str): Dossier ou fichier à parcourir
+
+    Returns:
+        dict: Chemin relatif (séparateur '/') -> chemin absolu
+    """
+    if os.path.isfile(racine):
+        return {'': racine}
+
+    fichiers = {}
+    for dossier, _, noms in os.walk(racine):
+        relatif = os.path.relpath(dossier, racine)
+        for nom in noms:
+            chemin_relatif = nom if relatif == '.' else os.path.join(relatif, nom)
+            fichiers[chemin_relatif.replace(os.sep, '/')] = os.path.join(dossier, nom)
+    return fichiers
+
+
+def _est_inchange(stat_source, entree, stat_dest, comparer_hash, chemin_source, chemin_dest, derive=None):
+    """
+    Détermine si un fichier de destination est à jour
+
+    Returns:
+        tuple: (bool, str|None) - (inchangé, empreinte calculée éventuellement)
+    """
+    if stat_dest is None:
+        return False, None
+
+    produit = entree.get('derive') if entree else None
+    if produit is not None:
+        # Destination transformée : à jour si elle est restée le fichier produit
+        # avec les mêmes paramètres, à partir de la même source
+        if produit.get('cle') != derive or produit.get('taille') != stat_dest.st_size \
+                or produit.get('mtime_ns') != stat_dest.st_mtime_ns:
+            return False, None
+        if entree.get('taille') == stat_source.st_size and entree.get('mtime_ns') == stat_source.st_mtime_ns:
+            return True, entree.get('sha256')
+        if not comparer_hash or not entree.get('sha256'):
+            return False, None
+        empreinte = calculer_hash(chemin_source)
+        return entree['sha256'] == empreinte, empreinte
+
+    if stat_dest.st_size != stat_source.st_size:
+        return False, None
+
+    # Même taille et même date que lors de la dernière synchronisation
+    if entree and entree.get('taille') == stat_source.st_size \
+            and entree.get('mtime_ns') == stat_source.st_mtime_ns:
+        return True, entree.get('sha256')
+
+    if not comparer_hash:
+        # Sans manifeste, copy2 conserve la date de modification : une
+        # destination de même taille et même date est considérée à jour
+        return stat_dest.st_mtime_ns == stat_source.st_mtime_ns, None
+
+    empreinte = calculer_hash(chemin_source)
+    if entree and entree.get('sha256'):
+        return entree['sha256'] == empreinte, empreinte
+    return calculer_hash(chemin_dest) == empreinte, empreinte
+
+
+def synchroniser_contenu(source, destination_complete, comparer_hash=False, supprimer_orphelins=False,
+                         mode_liaison='copy', derive=None):
+    """
+    Synchronise une source (dossier ou fichier) vers sa destination en ne
+    copiant que les fichiers nouveaux ou modifiés
+
+    Args:
+        source (str): Chemin source
+        destination_complete (str): Chemin de destination final
+        comparer_hash (bool): Si True, compare aussi le contenu (SHA-256)
+        supprimer_orphelins (bool): Si True, supprime les fichiers de la
+            destination absents de la source
+        mode_liaison (str): Mode de création des fichiers copiés (voir liaison.py)
+        derive (str, optional): Clé des paramètres de la transformation
+            appliquée après la copie (voir enregistrer_derives). Les versions
+            <fichier>.webp produites à côté des fichiers copiés ne sont alors
+            pas des orphelins
+
+    Returns:
+        dict: Statistiques (copies, inchanges, supprimes, octets_copies, et
+              modes : nombre de fichiers copiés par mode réellement utilisé)
+    """
+    stats = {'copies': 0, 'inchanges': 0, 'supprimes': 0, 'octets_copies': 0, 'modes': Counter()}
+    source_est_fichier = os.path.isfile(source)
+
+    manifeste = chemin_manifeste(destination_complete)
+    anciennes_entrees = lire_manifeste(manifeste)
+    nouvelles_entrees = {}
+
+    if not source_est_fichier and os.path.isfile(destination_complete):
+        os.remove(destination_complete)
+    elif source_est_fichier and os.path.isdir(destination_complete):
+        shutil.rmtree(destination_complete)
+
+    if not source_est_fichier:
+        os.makedirs(destination_complete, exist_ok=True)
+
+    fichiers_source = lister_fichiers(source)
+    for relatif, chemin_source in fichiers_source.items():
+        chemin_dest = os.path.join(destination_complete, *relatif.split('/')) if relatif else destination_complete
+        stat_source = os.stat(chemin_source)
+        try:
+            stat_dest = os.stat(chemin_dest)
+        except FileNotFoundError:
+            stat_dest = None
+
+        inchange, empreinte = _est_inchange(stat_source, anciennes_entrees.get(relatif), stat_dest,
+                                            comparer_hash, chemin_source, chemin_dest, derive)
+        produit = None
+        if inchange:
+            stats['inchanges'] += 1
+            produit = (anciennes_entrees.get(relatif) or {}).get('derive')
+        else:
+            os.makedirs(os.path.dirname(chemin_dest) or '.', exist_ok=True)
+            stats['modes'][lier_fichier(chemin_source, chemin_dest, mode_liaison)] += 1
+            stats['copies'] += 1
+            stats['octets_copies'] += stat_source.st_size
+            if comparer_hash and empreinte is None:
+                empreinte = calculer_hash(chemin_source)
+
+        entree = {'taille': stat_source.st_size, 'mtime_ns': stat_source.st_mtime_ns}
+        if empreinte:
+            entree['sha256'] = empreinte
+        if produit:
+            entree['derive'] = produit
+        nouvelles_entrees[relatif] = entree
+
+    if supprimer_orphelins and not source_est_fichier and os.path.isdir(destination_complete):
+        for relatif, chemin_dest in lister_fichiers(destination_complete).items():
+            if relatif in fichiers_source:
+                continue
+            if derive is not None and relatif.endswith('.webp') and relatif[:-len('.webp')] in fichiers_source:
+                continue
+            os.remove(chemin_dest)
+            stats['supprimes'] += 1
+        # Supprime les dossiers devenus vides (du plus profond au moins profond)
+        for dossier, _, _ in os.walk(destination_complete, topdown=False):
+            if dossier != destination_complete and not os.listdir(dossier):
+                os.rmdir(dossier)
+
+    ecrire_manifeste(manifeste, source, nouvelles_entrees)
+    return stats
+
+
+def enregistrer_derives(destination_complete, chemins, cle):
+    """
+    Mémorise dans le manifeste les fichiers de la destination transformés
+    après la synchronisation, pour qu'ils restent à jour aux exécutions
+    suivantes (voir _est_inchange)
+
+    Args:
+        destination_complete (str): Chemin du dossier ou fichier de destination
+        chemins (iterable): Fichiers transformés de la destination
+        cle (str): Clé des paramètres de la transformation
+
+    Returns:
+        int: Nombre d'entrées mises à jour (0 sans manifeste)
+    """
+    manifeste = chemin_manifeste(destination_complete)
+    try:
+        with open(manifeste, 'r', encoding='utf-8') as f:
+            donnees = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(donnees, dict) or donnees.get('version') != VERSION_MANIFESTE:
+        return 0
+
+    fichiers = donnees.get('fichiers', {})
+    mis_a_jour = 0
+    for chemin in chemins:
+        if os.path.normpath(chemin) == os.path.normpath(destination_complete):
+            relatif = ''
+        else:
+            relatif = os.path.relpath(chemin, destination_complete).replace(os.sep, '/')
+        if relatif not in fichiers:
+            continue
+        infos = os.stat(chemin)
+        fichiers[relatif]['derive'] = {'cle': cle, 'taille': infos.st_size, 'mtime_ns': infos.st_mtime_ns}
+        mis_a_jour += 1
+    if mis_a_jour:
+        ecrire_manifeste(manifeste, donnees.get('source', ''), fichiers)
+    return mis_a_jour
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Script de test : slug.slugify doit donner exactement le même résultat que
+l'implémentation d'origine (slug.slugify_reference) sur des titres
+aléatoires. Utilise hypothesis s'il est installé, sinon un générateur
+aléatoire à graine fixe.
+"""
+
+import random
+import sys
+import os
+
+# Ajoute le répertoire courant au path pour importer le module
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from slug import slugify, slugify_many, slugify_reference
+
+try:
+    from hypothesis import given, settings, strategies as st
+except ImportError:
+    given = None
+
+NB_TITRES = 20000
+
+# Caractères choisis pour couvrir les cas délicats : accents précomposés ou
+# combinants, espaces Unicode, ponctuation, İ (dont la minuscule fait deux
+# caractères), ligatures, écritures non latines, emojis
+ALPHABET = (
+    "abcXYZ019_- -- \t\n'?!.,;:&()/"
+    "àâäéèêëîïôöùûüçÿñÀÉÈÇÑÅØßæœŒ°²½×÷«»¡¿\xa0\xad\x85"
+    "̧́̈​ 　–’"
+    "İıſﬁπΣσςЖж中文한국어ếǅ①٣🚀"
+)
+
+
+def titre_aleatoire(generateur):
+    """Titre de 0 à 140 caractères tirés de ALPHABET ou de tout l'Unicode"""
+    longueur = generateur.choice((0, 1, 3, 10, 40, 99, 100, 101, 140))
+    caracteres = []
+    for _ in range(longueur):
+        if generateur.random() < 0.9:
+            caracteres.append(generateur.choice(ALPHABET))
+        else:
+            caracteres.append(chr(generateur.randrange(0x20, 0x30000)))
+    return ''.join(caracteres)
+
+
+def test_slugify_identique():
+    """Compare slugify et slugify_many à la référence sur des titres aléatoires"""
+    generateur = random.Random(20240514)
+    titres = [titre_aleatoire(generateur) for _ in range(NB_TITRES)]
+    titres += ["", None, "---", "   ", "?!", "Cloud &pi; : ajouter", "é" * 150, "a-" * 60]
+
+    differences = [titre for titre in titres if slugify(titre) != slugify_reference(titre)]
+    for titre in differences[:10]:
+        print(f"❌ {titre!r} : {slugify(titre)!r} != {slugify_reference(titre)!r}")
+    assert not differences
+
+    assert slugify_many(titres) == [slugify_reference(titre) for titre in titres]
+    print(f"✅ {len(titres)} titres identiques")
+
+
+if given is not None:
+    @settings(max_examples=2000)
+    @given(st.text())
+    def test_slugify_identique_hypothesis(titre):
+        """Propriété : slugify(titre) == slugify_reference(titre) pour tout texte"""
+        assert slugify(titre) == slugify_reference(titre)
+
+
+if __name__ == "__main__":
+    test_slugify_identique()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Script de test : write_nav ne doit réécrire que le bloc 'nav:' de
+mkdocs.yml, y compris quand des commentaires en colonne 0 se trouvent dans
+le bloc ou juste après la clé.
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+import yaml
+
+# Ajoute le répertoire courant au path pour importer le module
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from update_nav import find_nav_block, write_nav
+
+MKDOCS_YML = """site_name: Test
+nav:
+# Section A
+  - A: a.md
+# Section B
+  - B: b.md
+
+# Thème
+theme:
+  name: mkdocs
+"""
+
+
+def test_commentaires_dans_nav():
+    """Les commentaires en colonne 0 ne ferment pas le bloc nav"""
+    debut, fin = find_nav_block(MKDOCS_YML)
+    bloc = MKDOCS_YML[debut:fin]
+    assert bloc.endswith("  - B: b.md\n")
+    assert "# Thème" not in bloc
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = Path(dossier) / 'mkdocs.yml'
+        chemin.write_text(MKDOCS_YML, encoding='utf-8')
+
+        assert write_nav(chemin, [{'C': 'c.md'}])
+        contenu = chemin.read_text(encoding='utf-8')
+        config = yaml.safe_load(contenu)
+        assert config['nav'] == [{'C': 'c.md'}]
+        assert config['theme'] == {'name': 'mkdocs'}
+        assert 'b.md' not in contenu
+        assert "# Thème\ntheme:" in contenu
+
+        # Navigation identique : aucune écriture
+        assert not write_nav(chemin, [{'C': 'c.md'}])
+    print("✅ Bloc nav avec commentaires réécrit correctement")
+
+
+if __name__ == "__main__":
+    test_commentaires_dans_nav()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Cache persistant des titres extraits des fichiers Markdown.
+
+Utilisé par update_nav.py et extract_titles.py : pour chaque fichier, le cache
+conserve le titre et le front matter extraits, indexés par chemin, date de
+modification et taille. Un fichier inchangé n'est donc jamais rouvert, et
+seuls les fichiers modifiés depuis la dernière exécution sont relus.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_NAME = ".title_cache.json"
+
+# Fonction d'extraction : chemin -> (titre ou None, front matter ou None)
+Extractor = Callable[[Path], Tuple[Optional[str], Optional[Dict[str, Any]]]]
+
+
+class TitleCache:
+    """
+    Index JSON des titres extraits, stocké sur disque.
+
+    Les clés sont les chemins relatifs au dossier du fichier de cache ; chaque
+    entrée mémorise mtime (ns), taille, titre, front matter et l'identifiant
+    de l'extracteur qui l'a produite (une entrée produite par un autre
+    extracteur est ignorée).
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+        self.base_dir = self.cache_path.parent.resolve()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.seen = set()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get('version') == CACHE_VERSION:
+            self.entries = data.get('entries', {})
+
+    def _key(self, file_path: Path) -> str:
+        absolute = os.path.abspath(file_path)
+        try:
+            return os.path.relpath(absolute, self.base_dir).replace('\\', '/')
+        except ValueError:
+            # Chemin sur un autre lecteur (Windows)
+            return absolute.replace('\\', '/')
+
+    def lookup(self, file_path: Path, extractor: Extractor,
+               extractor_id: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Retourne (titre, front matter) depuis le cache, ou appelle l'extracteur
+        si le fichier a changé depuis la dernière exécution.
+
+        Les exceptions de l'extracteur (fichier illisible...) sont propagées
+        et rien n'est mis en cache.
+        """
+        key = self._key(file_path)
+        stat = os.stat(file_path)
+
+        with self._lock:
+            self.seen.add(key)
+            entry = self.entries.get(key)
+            if entry is not None \
+                    and entry.get('mtime_ns') == stat.st_mtime_ns \
+                    and entry.get('size') == stat.st_size \
+                    and entry.get('extractor') == extractor_id:
+                self.hits += 1
+                return entry.get('title'), entry.get('front_matter')
+
+        title, front_matter = extractor(file_path)
+
+        with self._lock:
+            self.misses += 1
+            self.entries[key] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'extractor': extractor_id,
+                'title': title,
+                'front_matter': front_matter,
+            }
+            self._dirty = True
+        return title, front_matter
+
+    def prune(self, keep: Iterable[str] = ()) -> int:
+        """
+        Supprime les entrées des fichiers qui n'existent plus.
+
+        Seules les entrées non consultées pendant cette exécution sont
+        vérifiées sur disque.
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        keep = set(keep) | self.seen
+        removed = 0
+        for key in list(self.entries):
+            if key in keep:
+                continue
+            if not os.path.exists(os.path.join(self.base_dir, key)):
+                del self.entries[key]
+                removed += 1
+        if removed:
+            self._dirty = True
+        return removed
+
+    def save(self):
+        """Écrit le cache sur disque (atomiquement) s'il a été modifié."""
+        if not self._dirty:
+            return
+
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # default=str : les dates YAML du front matter sont stockées en texte
+            json.dump({'version': CACHE_VERSION, 'entries': self.entries}, f,
+                      ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
@@ -9,54 +9,38 @@ Colonne C : répertoire de départ (à partir de wordpress-content-to-sort)
 Colonne D : répertoire de destination
 """
 
+import contextlib
 import csv
+import json
 import os
-import re
 import shutil
 import sys
-import unicodedata
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from liaison import MODES_LIAISON, decrire_modes, lier_arborescence, lier_fichier
+from doublons import ecrire_index, indexer_doublons, mutualiser_images
+from medias import DOSSIER_CACHE, LARGEUR_MAX, QUALITE, Image, cle_parametres, optimiser_medias
+from run_events import EventLog, throughput
+from slug import slugify, slugify_many
+from synchronisation import enregistrer_derives, synchroniser_contenu
+
 
 def nettoyer_titre_pour_fichier(titre):
     """
     Convertit un titre d'article en nom de fichier valide
     
+    Délègue à slug.slugify (résultat mis en cache, voir slug.py).
+    
     Args:
         titre (str): Titre de l'article
         
     Returns:
         str: Nom de fichier nettoyé et valide
     """
-    if not titre:
-        return "article_sans_titre"
-    
-    # Supprime ou remplace les caractères problématiques
-    # Normalise les caractères Unicode (supprime les accents)
-    titre_normalise = unicodedata.normalize('NFD', titre)
-    titre_ascii = ''.join(c for c in titre_normalise if unicodedata.category(c) != 'Mn')
-    
-    # Remplace les caractères spéciaux par des tirets
-    titre_nettoye = re.sub(r'[^\w\s-]', '', titre_ascii)
-    
-    # Remplace les espaces et multiples tirets par un seul tiret
-    titre_nettoye = re.sub(r'[-\s]+', '-', titre_nettoye)
-    
-    # Supprime les tirets en début et fin
-    titre_nettoye = titre_nettoye.strip('-')
-    
-    # Limite la longueur (max 100 caractères pour éviter les problèmes de système de fichiers)
-    if len(titre_nettoye) > 100:
-        titre_nettoye = titre_nettoye[:100].rstrip('-')
-    
-    # Convertit en minuscules
-    titre_nettoye = titre_nettoye.lower()
-    
-    # S'assure qu'on a au moins quelque chose
-    if not titre_nettoye:
-        return "article_sans_titre"
-    
-    return titre_nettoye
+    return slugify(titre)
 
 
 def lire_fichier_tri(fichier_csv):
@@ -97,22 +81,39 @@ def lire_fichier_tri(fichier_csv):
     return operations
 
 
-def creer_repertoires_destination(chemin_destination):
+def _signaler(message, messages=None):
+    """
+    Affiche un message, ou le conserve si une liste de messages est fournie
+    (utilisé par les workers pour que le rapport reste dans l'ordre du CSV)
+    
+    Args:
+        message (str): Message à afficher
+        messages (list, optional): Liste dans laquelle conserver le message
+    """
+    if messages is None:
+        print(message)
+    else:
+        messages.append(message)
+
+
+def creer_repertoires_destination(chemin_destination, messages=None):
     """
     Crée tous les répertoires nécessaires pour le chemin de destination
     
     Args:
         chemin_destination (str): Chemin vers le répertoire de destination
+        messages (list, optional): Liste collectant les messages au lieu de les afficher
     """
     try:
         Path(chemin_destination).mkdir(parents=True, exist_ok=True)
         return True
     except Exception as e:
-        print(f"❌ Erreur lors de la création du répertoire {chemin_destination} : {e}")
+        _signaler(f"❌ Erreur lors de la création du répertoire {chemin_destination} : {e}", messages)
         return False
 
 
-def copier_contenu(source, repertoire_destination, nouveau_nom=None):
+def copier_contenu(source, repertoire_destination, nouveau_nom=None, messages=None, synchro=None,
+                   type_source=None, liaison='copy', bilan=None):
     """
     Copie le contenu depuis la source vers la destination avec possibilité de renommage
     
@@ -120,13 +121,39 @@ def copier_contenu(source, repertoire_destination, nouveau_nom=None):
         source (str): Chemin source
         repertoire_destination (str): Répertoire de destination
         nouveau_nom (str, optional): Nouveau nom pour le fichier/dossier copié
+        messages (list, optional): Liste collectant les messages au lieu de les afficher
+        synchro (dict, optional): Active la synchronisation incrémentale au lieu
+            d'une copie complète. Clés : 'hash' (compare le contenu) et
+            'orphelins' (supprime les fichiers absents de la source) et 'derive'
+            (clé de l'optimisation des images appliquée après la copie, voir
+            synchronisation.enregistrer_derives)
+        type_source (str, optional): Type déjà connu par un plan validé
+            ('fichier', 'dossier' ou 'absente') : la source n'est pas réexaminée
+        liaison (str): Mode de création des fichiers ('copy', 'hardlink',
+            'reflink' ou 'symlink', voir liaison.py). Hors 'copy', le rapport
+            indique le mode réellement utilisé pour les fichiers
+        bilan (dict, optional): Complété avec le nombre de fichiers ('fichiers')
+            et d'octets ('octets') copiés, et les modes de liaison utilisés ('modes')
         
     Returns:
         tuple: (bool, str) - (succès, chemin_destination_final)
     """
+    if bilan is None:
+        bilan = {}
+    bilan.update(fichiers=0, octets=0, modes=Counter())
     try:
-        if not os.path.exists(source):
-            print(f"⚠️  Source inexistante : {source}")
+        if type_source is None:
+            if os.path.isfile(source):
+                type_source = 'fichier'
+            elif os.path.isdir(source):
+                type_source = 'dossier'
+            elif os.path.exists(source):
+                type_source = 'autre'
+            else:
+                type_source = 'absente'
+        
+        if type_source == 'absente':
+            _signaler(f"⚠️  Source inexistante : {source}", messages)
             return False, ""
         
         # Détermine le nom final du fichier/dossier
@@ -138,28 +165,137 @@ def copier_contenu(source, repertoire_destination, nouveau_nom=None):
         # Construit le chemin de destination complet
         destination_complete = os.path.join(repertoire_destination, nom_final)
         
-        if os.path.isfile(source):
-            # Si c'est un fichier, on le copie
-            shutil.copy2(source, destination_complete)
+        if synchro is not None and type_source in ('fichier', 'dossier'):
+            # Ne copie que les fichiers nouveaux ou modifiés
+            stats = synchroniser_contenu(source, destination_complete,
+                                         comparer_hash=synchro.get('hash', False),
+                                         supprimer_orphelins=synchro.get('orphelins', False),
+                                         mode_liaison=liaison,
+                                         derive=synchro.get('derive'))
+            _signaler(f"   🔄 Synchronisation : {stats['copies']} copié(s), {stats['inchanges']} inchangé(s), "
+                      f"{stats['supprimes']} supprimé(s)", messages)
+            bilan.update(fichiers=stats['copies'], octets=stats['octets_copies'], modes=stats['modes'])
+            if liaison != 'copy' and stats['copies']:
+                _signaler(f"   🔗 Liaison {liaison} : {decrire_modes(stats['modes'])}", messages)
             return True, destination_complete
+        
+        if type_source == 'fichier':
+            # Si c'est un fichier, on le copie
+            bilan['modes'][lier_fichier(source, destination_complete, liaison)] += 1
+            bilan['fichiers'] = 1
+            bilan['octets'] = os.path.getsize(source)
             
-        elif os.path.isdir(source):
+        elif type_source == 'dossier':
             # Si c'est un répertoire, on copie tout le contenu
             if os.path.exists(destination_complete):
                 shutil.rmtree(destination_complete)
-            shutil.copytree(source, destination_complete)
-            return True, destination_complete
+            lier_arborescence(source, destination_complete, liaison, bilan)
             
         else:
-            print(f"⚠️  Type de source non supporté : {source}")
+            _signaler(f"⚠️  Type de source non supporté : {source}", messages)
             return False, ""
+        
+        if liaison != 'copy':
+            _signaler(f"   🔗 Liaison {liaison} : {decrire_modes(bilan['modes'])}", messages)
+        return True, destination_complete
             
     except Exception as e:
-        print(f"❌ Erreur lors de la copie de {source} vers {repertoire_destination} : {e}")
+        _signaler(f"❌ Erreur lors de la copie de {source} vers {repertoire_destination} : {e}", messages)
         return False, ""
 
 
-def trier_contenu_wordpress(repertoire_base="wordpress-content-to-sort", fichier_csv="tri.csv", mode_simulation=False):
+def detecter_conflits_destination(operations):
+    """
+    Regroupe les opérations par chemin de destination final
+    (destination/nom_final) pour repérer les lignes qui écriraient au même endroit
+    
+    Args:
+        operations (list): Opérations lues par lire_fichier_tri
+        
+    Returns:
+        dict: Chemin de destination normalisé -> liste des index (base 0) des
+              opérations qui y écrivent, dans l'ordre du CSV
+    """
+    groupes = {}
+    for index, operation in enumerate(operations):
+        nom_final = nettoyer_titre_pour_fichier(operation['titre'])
+        cle = os.path.normcase(os.path.normpath(os.path.join(operation['destination'], nom_final)))
+        groupes.setdefault(cle, []).append(index)
+    return groupes
+
+
+def regrouper_destinations_imbriquees(groupes):
+    """
+    Fusionne les groupes dont la destination est contenue dans celle d'un autre
+    groupe (ex. dest/article et dest/article/annexe), afin qu'une suppression
+    de dossier ne puisse pas s'exécuter pendant une copie à l'intérieur
+    
+    Args:
+        groupes (dict): Résultat de detecter_conflits_destination
+        
+    Returns:
+        list: Listes d'index d'opérations, chacune triée dans l'ordre du CSV
+    """
+    racines = {}
+    for cle in sorted(groupes, key=len):
+        parent = os.path.dirname(cle)
+        racine = cle
+        while parent and parent != os.path.dirname(parent):
+            if parent in racines:
+                racine = racines[parent]
+                break
+            parent = os.path.dirname(parent)
+        racines[cle] = racine
+    
+    fusion = {}
+    for cle, index_groupe in groupes.items():
+        fusion.setdefault(racines[cle], []).extend(index_groupe)
+    return [sorted(index_groupe) for index_groupe in fusion.values()]
+
+
+def executer_groupe_copies(taches, synchro=None, liaison='copy'):
+    """
+    Exécute séquentiellement un groupe de copies visant la même destination.
+    
+    Fonction de niveau module pour pouvoir être envoyée à un pool de processus.
+    
+    Args:
+        taches (list): Liste de tuples (index, chemin_source, repertoire_dest, nom_final, type_source)
+        synchro (dict, optional): Options de synchronisation (voir copier_contenu)
+        liaison (str): Mode de création des fichiers (voir copier_contenu)
+        
+    Returns:
+        list: Liste de tuples (index, succès, chemin_destination_final, messages, bilan),
+              bilan comprenant la durée de l'opération ('duree', en secondes)
+    """
+    resultats = []
+    for index, chemin_source, repertoire_dest, nom_final, type_source in taches:
+        resultats.append((index,) + executer_copie(chemin_source, repertoire_dest, nom_final, synchro,
+                                                   type_source, liaison))
+    return resultats
+
+
+def executer_copie(chemin_source, repertoire_dest, nom_final, synchro=None, type_source=None, liaison='copy'):
+    """
+    Crée le répertoire de destination puis copie une source, en mesurant la durée
+    
+    Returns:
+        tuple: (succès, chemin_destination_final, messages, bilan), voir copier_contenu
+    """
+    debut = time.perf_counter()
+    messages = []
+    bilan = {'fichiers': 0, 'octets': 0, 'modes': Counter()}
+    succes, chemin_dest_final = False, ""
+    if creer_repertoires_destination(repertoire_dest, messages):
+        succes, chemin_dest_final = copier_contenu(chemin_source, repertoire_dest, nom_final, messages, synchro,
+                                                   type_source, liaison, bilan)
+    bilan['duree'] = time.perf_counter() - debut
+    return succes, chemin_dest_final, messages, bilan
+
+
+def trier_contenu_wordpress(repertoire_base="wordpress-content-to-sort", fichier_csv="tri.csv", mode_simulation=False,
+                            jobs=1, utiliser_processus=False, synchro=None, plan=None, liaison='copy',
+                            evenements=None, silencieux=False, medias=None, mutualisation=None):
     """
     Fonction principale pour trier le contenu WordPress
     
@@ -167,66 +303,106 @@ def trier_contenu_wordpress(repertoire_base="wordpress-content-to-sort", fichier
         repertoire_base (str): Répertoire de base contenant le contenu WordPress
         fichier_csv (str): Fichier CSV contenant les instructions de tri
         mode_simulation (bool): Si True, affiche seulement ce qui serait fait sans l'exécuter
+        jobs (int): Nombre de copies exécutées en parallèle (1 = traitement séquentiel)
+        utiliser_processus (bool): Si True, utilise un pool de processus au lieu de threads
+        synchro (dict, optional): Options de synchronisation incrémentale (voir copier_contenu)
+        plan (dict, optional): Plan validé (planification.construire_plan) : ses
+            opérations sont exécutées sans relire le CSV ni réexaminer les sources
+        liaison (str): Mode de création des fichiers (voir copier_contenu)
+        evenements (EventLog, optional): Flux d'événements JSON et métriques
+            Prometheus (voir run_events.py)
+        silencieux (bool): Si True, n'affiche pas le rapport des opérations
+            réussies (seuls les échecs et le résumé sont affichés)
+        medias (dict, optional): Options de l'optimisation des images après la
+            copie (largeur_max, qualite, webp, jobs, cache ; voir medias.py)
+        mutualisation (dict, optional): Mutualisation des images identiques
+            après la copie (dossier partagé, jobs ; voir doublons.py)
     """
+    if evenements is None:
+        evenements = EventLog('tri_wordpress')
+    debut = time.perf_counter()
+    
     print("🚀 Démarrage du script de tri du contenu WordPress")
     print("=" * 60)
     
-    # Vérification de l'existence du répertoire de base
-    if not os.path.exists(repertoire_base):
-        print(f"❌ Erreur : Le répertoire de base '{repertoire_base}' n'existe pas.")
-        print(f"   Veuillez créer ce répertoire ou modifier le chemin dans le script.")
-        sys.exit(1)
+    if plan is not None:
+        repertoire_base = plan['repertoire_base']
+        operations = plan['operations']
+        print(f"🗺️  Exécution du plan du {plan['date']} ({plan['fichier_csv']})")
+        print(f"✅ {len(operations)} opérations de tri planifiées\n")
+    else:
+        # Vérification de l'existence du répertoire de base
+        if not os.path.exists(repertoire_base):
+            print(f"❌ Erreur : Le répertoire de base '{repertoire_base}' n'existe pas.")
+            print(f"   Veuillez créer ce répertoire ou modifier le chemin dans le script.")
+            evenements.emit('erreur', message=f"répertoire de base inexistant : {repertoire_base}")
+            sys.exit(1)
+        
+        # Lecture du fichier de tri
+        print(f"📖 Lecture du fichier de tri : {fichier_csv}")
+        operations = lire_fichier_tri(fichier_csv)
+        print(f"✅ {len(operations)} opérations de tri trouvées\n")
+    
+    if liaison != 'copy':
+        print(f"🔗 Mode de liaison des fichiers : {liaison} (copie normale en cas d'impossibilité)\n")
     
-    # Lecture du fichier de tri
-    print(f"📖 Lecture du fichier de tri : {fichier_csv}")
-    operations = lire_fichier_tri(fichier_csv)
-    print(f"✅ {len(operations)} opérations de tri trouvées\n")
+    evenements.emit('debut', operations=len(operations), simulation=mode_simulation, jobs=jobs,
+                    liaison=liaison, synchro=synchro is not None, repertoire_base=repertoire_base,
+                    fichier_csv=plan['fichier_csv'] if plan is not None else fichier_csv)
     
     # Statistiques
-    nb_reussites = 0
-    nb_echecs = 0
-    
-    # Traitement de chaque opération
-    for i, operation in enumerate(operations, 1):
-        titre = operation['titre']
-        repertoire_source = operation['repertoire_export']
-        repertoire_dest = operation['destination']
-        
-        # Génère le nom de fichier basé sur le titre
-        nom_fichier_final = nettoyer_titre_pour_fichier(titre)
-        
-        print(f"📁 [{i}/{len(operations)}] Traitement : {titre}")
-        print(f"   Source : {repertoire_source}")
-        print(f"   Destination : {repertoire_dest}")
-        print(f"   Nom final : {nom_fichier_final}")
-        
-        # Construction des chemins complets
-        chemin_source = os.path.join(repertoire_base, repertoire_source)
-        
-        if mode_simulation:
-            chemin_dest_final = os.path.join(repertoire_dest, nom_fichier_final)
-            print(f"   🔍 SIMULATION - Copierait depuis {chemin_source} vers {chemin_dest_final}")
-            if os.path.exists(chemin_source):
-                nb_reussites += 1
-                print("   ✅ Source existe - opération serait réussie")
-            else:
-                nb_echecs += 1
-                print("   ❌ Source inexistante - opération échouerait")
-        else:
-            # Création du répertoire de destination
-            if creer_repertoires_destination(repertoire_dest):
-                # Copie du contenu avec le nouveau nom
-                succes, chemin_dest_final = copier_contenu(chemin_source, repertoire_dest, nom_fichier_final)
-                
+    compteurs = {'reussites': 0, 'echecs': 0, 'fichiers': 0, 'octets': 0, 'destinations': []}
+    
+    if not mode_simulation and jobs > 1:
+        _trier_en_parallele(repertoire_base, operations, jobs, utiliser_processus, synchro, liaison,
+                            compteurs, evenements, silencieux)
+    else:
+        # Traitement de chaque opération
+        for i, operation in enumerate(operations, 1):
+            titre = operation['titre']
+            repertoire_source = operation['repertoire_export']
+            repertoire_dest = operation['destination']
+            
+            # Génère le nom de fichier basé sur le titre
+            nom_fichier_final = nettoyer_titre_pour_fichier(titre)
+            
+            # Construction des chemins complets
+            chemin_source = os.path.join(repertoire_base, repertoire_source)
+            
+            if mode_simulation:
+                chemin_dest_final = os.path.join(repertoire_dest, nom_fichier_final)
+                type_planifie = _type_planifie(operation)
+                succes = type_planifie != 'absente' if type_planifie else os.path.exists(chemin_source)
+                compteurs['reussites' if succes else 'echecs'] += 1
+                evenements.emit('operation', ligne=i, titre=titre, source=chemin_source,
+                                destination=chemin_dest_final, statut='reussite' if succes else 'echec',
+                                simulation=True)
+                if silencieux and succes:
+                    continue
+                _afficher_entete_operation(i, len(operations), operation, nom_fichier_final)
+                print(f"   🔍 SIMULATION - Copierait depuis {chemin_source} vers {chemin_dest_final}")
                 if succes:
-                    nb_reussites += 1
-                    print(f"   ✅ Copie réussie vers {chemin_dest_final}")
+                    print("   ✅ Source existe - opération serait réussie")
                 else:
-                    nb_echecs += 1
+                    print("   ❌ Source inexistante - opération échouerait")
+                print()  # Ligne vide pour la lisibilité
             else:
-                nb_echecs += 1
-        
-        print()  # Ligne vide pour la lisibilité
+                # Création du répertoire de destination puis copie du contenu avec le nouveau nom
+                resultat = executer_copie(chemin_source, repertoire_dest, nom_fichier_final, synchro,
+                                          _type_planifie(operation), liaison)
+                _rapporter_copie(i, operations, nom_fichier_final, resultat, compteurs, evenements, silencieux)
+    
+    bilan_medias = None
+    if medias is not None and not mode_simulation:
+        bilan_medias = _optimiser_medias(compteurs['destinations'], medias, evenements, silencieux,
+                                         synchro is not None)
+    bilan_mutualisation = None
+    if mutualisation is not None and not mode_simulation:
+        bilan_mutualisation = _mutualiser_medias(compteurs['destinations'], mutualisation, evenements, silencieux)
+    
+    duree = time.perf_counter() - debut
+    nb_reussites = compteurs['reussites']
+    nb_echecs = compteurs['echecs']
     
     # Résumé final
     print("=" * 60)
@@ -234,6 +410,41 @@ def trier_contenu_wordpress(repertoire_base="wordpress-content-to-sort", fichier
     print(f"✅ Réussites : {nb_reussites}")
     print(f"❌ Échecs : {nb_echecs}")
     print(f"📈 Total traité : {len(operations)}")
+    if not mode_simulation:
+        print(f"⏱️  Durée : {duree:.1f} s, {compteurs['fichiers']} fichier(s), "
+              f"{compteurs['octets'] / 1e6:.1f} Mo ({throughput(compteurs['octets'] / 1e6, duree)} Mo/s)")
+    if bilan_medias is not None:
+        print(f"🖼️  Images : {bilan_medias['images']} ({bilan_medias['encodees']} encodée(s), "
+              f"{bilan_medias['cache']} depuis le cache), "
+              f"{_economie(bilan_medias['octets_avant'], bilan_medias['octets_apres'])}")
+    if bilan_mutualisation is not None:
+        print(f"♻️  Images mutualisées : {bilan_mutualisation['images']} en {bilan_mutualisation['groupes']} "
+              f"fichier(s) partagé(s), {bilan_mutualisation['octets_liberes'] / 1e6:.1f} Mo libérés")
+    
+    evenements.emit('fin', operations=len(operations), reussites=nb_reussites, echecs=nb_echecs,
+                    simulation=mode_simulation, duree_s=round(duree, 3),
+                    fichiers=compteurs['fichiers'], octets=compteurs['octets'],
+                    operations_par_s=throughput(len(operations), duree),
+                    fichiers_par_s=throughput(compteurs['fichiers'], duree),
+                    octets_par_s=throughput(compteurs['octets'], duree))
+    evenements.write_prometheus([
+        ('operations', "Opérations de la dernière exécution, par statut",
+         {(('statut', 'reussite'),): nb_reussites, (('statut', 'echec'),): nb_echecs}),
+        ('fichiers_copies', "Fichiers copiés lors de la dernière exécution", compteurs['fichiers']),
+        ('octets_copies', "Octets copiés lors de la dernière exécution", compteurs['octets']),
+        ('duree_secondes', "Durée de la dernière exécution", round(duree, 3)),
+        ('simulation', "1 si la dernière exécution était une simulation", int(mode_simulation)),
+    ] + ([
+        ('images', "Images optimisées lors de la dernière exécution, par origine du résultat",
+         {(('origine', 'encodage'),): bilan_medias['encodees'], (('origine', 'cache'),): bilan_medias['cache']}),
+        ('octets_images_economises', "Octets d'images économisés lors de la dernière exécution",
+         bilan_medias['octets_avant'] - bilan_medias['octets_apres']),
+    ] if bilan_medias is not None else []) + ([
+        ('images_mutualisees', "Images remplacées par un fichier partagé lors de la dernière exécution",
+         bilan_mutualisation['images']),
+        ('octets_mutualisation_liberes', "Octets libérés par la mutualisation des images",
+         bilan_mutualisation['octets_liberes']),
+    ] if bilan_mutualisation is not None else []))
     
     if mode_simulation:
         print("\n🔍 Mode simulation activé - aucune opération réelle effectuée")
@@ -245,6 +456,258 @@ def trier_contenu_wordpress(repertoire_base="wordpress-content-to-sort", fichier
             print(f"\n⚠️  {nb_echecs} opération(s) ont échoué. Vérifiez les messages d'erreur ci-dessus.")
 
 
+def _type_planifie(operation):
+    """Type de source connu par le plan ('absente' si manquante), None hors plan."""
+    if 'type_source' not in operation:
+        return None
+    return operation['type_source'] or 'absente'
+
+
+def _afficher_entete_operation(numero, total, operation, nom_fichier_final):
+    """Affiche les lignes d'en-tête du rapport d'une opération"""
+    print(f"📁 [{numero}/{total}] Traitement : {operation['titre']}")
+    print(f"   Source : {operation['repertoire_export']}")
+    print(f"   Destination : {operation['destination']}")
+    print(f"   Nom final : {nom_fichier_final}")
+
+
+def _rapporter_copie(numero, operations, nom_fichier_final, resultat, compteurs, evenements, silencieux):
+    """
+    Comptabilise une copie terminée, émet son événement et affiche son rapport
+    (seulement en cas d'échec en mode silencieux)
+    
+    Args:
+        numero (int): Numéro de l'opération (base 1, ordre du CSV)
+        operations (list): Toutes les opérations
+        nom_fichier_final (str): Nom final de la destination
+        resultat (tuple): (succès, chemin_destination_final, messages, bilan), voir executer_copie
+        compteurs (dict): Totaux mis à jour (reussites, echecs, fichiers, octets,
+            et destinations : chemins des copies réussies)
+        evenements (EventLog): Flux d'événements
+        silencieux (bool): N'affiche pas le rapport des opérations réussies
+    """
+    succes, chemin_dest_final, messages, bilan = resultat
+    operation = operations[numero - 1]
+    compteurs['reussites' if succes else 'echecs'] += 1
+    if succes:
+        compteurs.setdefault('destinations', []).append(chemin_dest_final)
+    compteurs['fichiers'] += bilan['fichiers']
+    compteurs['octets'] += bilan['octets']
+    
+    champs = {}
+    if bilan['modes']:
+        champs['modes'] = dict(bilan['modes'])
+    if not succes:
+        champs['messages'] = [message.strip() for message in messages]
+    evenements.emit('operation', ligne=numero, titre=operation['titre'], source=operation['repertoire_export'],
+                    destination=chemin_dest_final or os.path.join(operation['destination'], nom_fichier_final),
+                    statut='reussite' if succes else 'echec', duree_s=round(bilan['duree'], 4),
+                    fichiers=bilan['fichiers'], octets=bilan['octets'], **champs)
+    
+    if silencieux and succes:
+        return
+    _afficher_entete_operation(numero, len(operations), operation, nom_fichier_final)
+    for message in messages:
+        print(message)
+    if succes:
+        print(f"   ✅ Copie réussie vers {chemin_dest_final}")
+    print()  # Ligne vide pour la lisibilité
+
+
+def _trier_en_parallele(repertoire_base, operations, jobs, utiliser_processus, synchro=None, liaison='copy',
+                        compteurs=None, evenements=None, silencieux=False):
+    """
+    Exécute les copies sur un pool de workers.
+    
+    Les opérations visant la même destination finale sont regroupées et
+    exécutées dans l'ordre du CSV par un seul worker : elles ne peuvent donc
+    jamais s'exécuter en concurrence (la dernière ligne l'emporte, comme en
+    mode séquentiel). Le rapport est affiché dans l'ordre du CSV, au fur et à
+    mesure que les opérations précédentes sont terminées.
+    
+    Args:
+        repertoire_base (str): Répertoire de base contenant le contenu WordPress
+        operations (list): Opérations lues par lire_fichier_tri
+        jobs (int): Nombre de workers
+        utiliser_processus (bool): Si True, utilise un pool de processus au lieu de threads
+        synchro (dict, optional): Options de synchronisation incrémentale (voir copier_contenu)
+        liaison (str): Mode de création des fichiers (voir copier_contenu)
+        compteurs (dict, optional): Totaux mis à jour (voir _rapporter_copie)
+        evenements (EventLog, optional): Flux d'événements
+        silencieux (bool): N'affiche pas le rapport des opérations réussies
+        
+    Returns:
+        dict: Totaux (reussites, echecs, fichiers, octets)
+    """
+    if compteurs is None:
+        compteurs = {'reussites': 0, 'echecs': 0, 'fichiers': 0, 'octets': 0}
+    if evenements is None:
+        evenements = EventLog('tri_wordpress')
+    
+    noms_finaux = slugify_many([operation['titre'] for operation in operations])
+    groupes = detecter_conflits_destination(operations)
+    
+    conflits = [index_groupe for index_groupe in groupes.values() if len(index_groupe) > 1]
+    if conflits:
+        print(f"⚠️  {len(conflits)} destination(s) visée(s) par plusieurs lignes (exécutées dans l'ordre du CSV) :")
+        for index_groupe in conflits:
+            premier = index_groupe[0]
+            lignes = ", ".join(str(index + 1) for index in index_groupe)
+            chemin = os.path.join(operations[premier]['destination'], noms_finaux[premier])
+            print(f"   - {chemin} : opérations {lignes}")
+        print()
+    
+    type_pool = "processus" if utiliser_processus else "threads"
+    print(f"⚙️  Exécution parallèle : {jobs} {type_pool}\n")
+    
+    executeur = ProcessPoolExecutor if utiliser_processus else ThreadPoolExecutor
+    resultats = {}
+    prochain = 0
+    
+    with executeur(max_workers=jobs) as pool:
+        futures = []
+        for index_groupe in regrouper_destinations_imbriquees(groupes):
+            taches = [
+                (index,
+                 os.path.join(repertoire_base, operations[index]['repertoire_export']),
+                 operations[index]['destination'],
+                 noms_finaux[index],
+                 _type_planifie(operations[index]))
+                for index in index_groupe
+            ]
+            futures.append(pool.submit(executer_groupe_copies, taches, synchro, liaison))
+        
+        for future in as_completed(futures):
+            for index, *resultat in future.result():
+                resultats[index] = resultat
+            
+            # Affiche le rapport dans l'ordre du CSV dès que possible
+            while prochain in resultats:
+                _rapporter_copie(prochain + 1, operations, noms_finaux[prochain], resultats.pop(prochain),
+                                 compteurs, evenements, silencieux)
+                prochain += 1
+    
+    return compteurs
+
+
+def _economie(avant, apres):
+    """Décrit le gain d'une optimisation d'images (ex. '12.4 Mo → 1.9 Mo, -85 %')"""
+    gain = round((avant - apres) * 100 / avant) if avant else 0
+    # Aucun gain (ou gain arrondi à 0) : pas de pourcentage, jamais de « -0 % »
+    pourcentage = f", -{gain} %" if gain > 0 else ""
+    return f"{avant / 1e6:.1f} Mo → {apres / 1e6:.1f} Mo{pourcentage}"
+
+
+def _optimiser_medias(destinations, options, evenements, silencieux=False, synchro=False):
+    """
+    Optimise les images des articles copiés et rapporte le gain par article
+    
+    Args:
+        destinations (list): Chemins des copies réussies, dans l'ordre du CSV
+        options (dict): largeur_max, qualite, webp, jobs et cache (voir medias.py)
+        evenements (EventLog): Flux d'événements (un événement 'medias' par article)
+        silencieux (bool): N'affiche que les articles en erreur
+        synchro (bool): Si True, les images optimisées sont enregistrées dans
+            le manifeste de synchronisation : elles ne sont pas recopiées à
+            l'exécution suivante
+        
+    Returns:
+        dict: Totaux (images, encodees, cache, octets_avant, octets_apres, octets_webp)
+    """
+    totaux = {'images': 0, 'encodees': 0, 'cache': 0, 'octets_avant': 0, 'octets_apres': 0, 'octets_webp': 0}
+    # Une destination recopiée par plusieurs lignes n'est optimisée qu'une fois
+    destinations = list(dict.fromkeys(destinations))
+    print("=" * 60)
+    print(f"🖼️  Optimisation des images : largeur maximale {options['largeur_max']} px, "
+          f"qualité {options['qualite']}{', versions WebP' if options['webp'] else ''}")
+    bilans = optimiser_medias(destinations, options['largeur_max'], options['qualite'], options['webp'],
+                              options['jobs'], options['cache'])
+    
+    for destination, bilan in bilans.items():
+        if not bilan['images']:
+            continue
+        if synchro:
+            enregistrer_derives(destination, bilan['optimisees'],
+                                cle_parametres(options['largeur_max'], options['qualite']))
+        for cle in totaux:
+            totaux[cle] += bilan[cle]
+        champs = {}
+        if bilan['erreurs']:
+            champs['erreurs'] = [f"{chemin} : {message}" for chemin, message in bilan['erreurs']]
+        evenements.emit('medias', destination=destination, images=bilan['images'], encodees=bilan['encodees'],
+                        cache=bilan['cache'], octets_avant=bilan['octets_avant'],
+                        octets_apres=bilan['octets_apres'], octets_webp=bilan['octets_webp'],
+                        octets_economises=bilan['octets_avant'] - bilan['octets_apres'], **champs)
+        if silencieux and not bilan['erreurs']:
+            continue
+        print(f"   📁 {destination} : {bilan['images']} image(s), "
+              f"{_economie(bilan['octets_avant'], bilan['octets_apres'])}")
+        for chemin, message in bilan['erreurs']:
+            print(f"      ❌ {chemin} : {message}")
+    print()
+    return totaux
+
+
+def _mutualiser_medias(destinations, options, evenements, silencieux=False):
+    """
+    Stocke une seule fois les images identiques des articles copiés
+    
+    Args:
+        destinations (list): Chemins des copies réussies, dans l'ordre du CSV
+        options (dict): dossier partagé et jobs (voir doublons.mutualiser_images)
+        evenements (EventLog): Flux d'événements (un événement 'mutualisation')
+        silencieux (bool): N'affiche pas le détail par article
+        
+    Returns:
+        dict: Bilan de doublons.mutualiser_images
+    """
+    destinations = list(dict.fromkeys(destinations))
+    print("=" * 60)
+    print(f"♻️  Mutualisation des images identiques dans {options['dossier']}")
+    bilan = mutualiser_images(destinations, options['dossier'], options['jobs'])
+    
+    print(f"   {bilan['images']} image(s) identique(s) → {bilan['groupes']} fichier(s) partagé(s), "
+          f"{bilan['references']} référence(s) réécrite(s), {bilan['supprimes']} original(aux) supprimé(s)")
+    if not silencieux:
+        for destination, octets in bilan['par_destination'].items():
+            if octets:
+                print(f"   📁 {destination} : {octets / 1e6:.2f} Mo libérés")
+    print()
+    evenements.emit('mutualisation', dossier=options['dossier'], images=bilan['images'], groupes=bilan['groupes'],
+                    references=bilan['references'], supprimes=bilan['supprimes'],
+                    octets_liberes=bilan['octets_liberes'])
+    return bilan
+
+
+def _indexer_doublons(repertoire_base, chemin_index, jobs=None):
+    """
+    Écrit l'index des fichiers identiques de l'export et en affiche le résumé
+    
+    Args:
+        repertoire_base (str): Répertoire de base contenant le contenu WordPress
+        chemin_index (str): Fichier JSON à écrire
+        jobs (int, optional): Nombre de threads de calcul des empreintes
+    """
+    if not os.path.isdir(repertoire_base):
+        print(f"❌ Erreur : Le répertoire de base '{repertoire_base}' n'existe pas.")
+        sys.exit(1)
+    
+    debut = time.perf_counter()
+    print(f"♻️  Recherche des fichiers identiques dans {repertoire_base}")
+    index = indexer_doublons(repertoire_base, jobs)
+    ecrire_index(index, chemin_index)
+    
+    totaux = index['totaux']
+    print(f"✅ {totaux['fichiers']} fichier(s) analysé(s) en {time.perf_counter() - debut:.1f} s : "
+          f"{totaux['groupes']} groupe(s) de fichiers identiques, {totaux['doublons']} copie(s) superflue(s), "
+          f"{totaux['octets_dupliques'] / 1e6:.1f} Mo dupliqués")
+    for groupe in index['groupes'][:10]:
+        print(f"   - {len(groupe['fichiers'])} x {groupe['taille'] / 1e3:.0f} Ko : {groupe['fichiers'][0]}")
+    if len(index['groupes']) > 10:
+        print(f"   ... ({len(index['groupes']) - 10} autre(s) groupe(s))")
+    print(f"💾 Index écrit dans {chemin_index}")
+
+
 def main():
     """Fonction principale du script"""
     import argparse
@@ -259,14 +722,170 @@ def main():
     parser.add_argument("--simulation", "-s",
                        action="store_true",
                        help="Mode simulation : affiche ce qui serait fait sans l'exécuter")
+    parser.add_argument("--jobs", "-j",
+                       type=int,
+                       default=1,
+                       help="Nombre de copies exécutées en parallèle (défaut: 1, traitement séquentiel)")
+    parser.add_argument("--processus",
+                       action="store_true",
+                       help="Avec --jobs, utilise un pool de processus au lieu de threads")
+    parser.add_argument("--sync",
+                       action="store_true",
+                       help="Synchronisation incrémentale : ne copie que les fichiers nouveaux ou modifiés")
+    parser.add_argument("--hash",
+                       action="store_true",
+                       help="Avec --sync, compare aussi le contenu des fichiers (SHA-256)")
+    parser.add_argument("--supprimer-orphelins",
+                       action="store_true",
+                       help="Avec --sync, supprime les fichiers de destination absents de la source")
+    parser.add_argument("--mode-liaison", "--link-mode",
+                       choices=MODES_LIAISON,
+                       default="copy",
+                       help="Création des fichiers de destination : copie complète, lien physique, clone "
+                            "copy-on-write (reflink) ou lien symbolique, avec repli sur une copie (défaut: copy)")
+    parser.add_argument("--silencieux", "--quiet", "-q",
+                       action="store_true",
+                       help="N'affiche que les échecs et le résumé (pas le rapport de chaque opération réussie)")
+    parser.add_argument("--evenements", "--events",
+                       metavar="FICHIER",
+                       help="Écrit un événement JSON par ligne (début, chaque opération, fin) dans ce fichier "
+                            "('-' : sortie standard, le rapport lisible passe alors sur la sortie d'erreur)")
+    parser.add_argument("--prometheus",
+                       metavar="FICHIER",
+                       help="Écrit les métriques de l'exécution au format Prometheus (collecteur textfile de node_exporter)")
+    parser.add_argument("--optimiser-medias",
+                       action="store_true",
+                       help="Après la copie, réduit les images JPEG/PNG, supprime leurs métadonnées et produit "
+                            "des versions WebP (nécessite Pillow)")
+    parser.add_argument("--largeur-max",
+                       type=int,
+                       help=f"Avec --optimiser-medias, largeur maximale des images en pixels (défaut: {LARGEUR_MAX})")
+    parser.add_argument("--qualite",
+                       type=int,
+                       help=f"Avec --optimiser-medias, qualité JPEG et WebP de 1 à 95 (défaut: {QUALITE})")
+    parser.add_argument("--sans-webp",
+                       action="store_true",
+                       help="Avec --optimiser-medias, ne produit pas de versions WebP")
+    parser.add_argument("--cache-medias",
+                       help=f"Avec --optimiser-medias, dossier du cache des images optimisées (défaut: {DOSSIER_CACHE})")
+    parser.add_argument("--mutualiser-medias",
+                       metavar="DOSSIER",
+                       help="Après la copie, stocke une seule fois dans DOSSIER (dans le docs_dir) les images "
+                            "identiques de plusieurs articles et réécrit leurs références Markdown "
+                            "(incompatible avec --sync)")
+    parser.add_argument("--index-doublons",
+                       metavar="FICHIER",
+                       help="Écrit l'index JSON des fichiers identiques du répertoire de base, sans rien copier")
+    parser.add_argument("--plan",
+                       action="store_true",
+                       help="Valide tout le CSV (sources, collisions, imbrications, cycles, volume) sans rien copier")
+    parser.add_argument("--format",
+                       choices=["texte", "json"],
+                       default="texte",
+                       help="Avec --plan, format du résumé affiché (défaut: texte)")
+    parser.add_argument("--sortie-plan",
+                       help="Avec --plan, enregistre le plan JSON dans ce fichier")
+    parser.add_argument("--executer-plan",
+                       metavar="FICHIER",
+                       help="Exécute un plan validé (--plan --sortie-plan) sans réexaminer le CSV ni les sources")
     
     args = parser.parse_args()
     
-    trier_contenu_wordpress(
-        repertoire_base=args.repertoire_base,
-        fichier_csv=args.fichier_csv,
-        mode_simulation=args.simulation
-    )
+    if args.jobs < 1:
+        parser.error("--jobs doit être supérieur ou égal à 1")
+    if (args.hash or args.supprimer_orphelins) and not args.sync:
+        parser.error("--hash et --supprimer-orphelins nécessitent --sync")
+    if args.plan and args.executer_plan:
+        parser.error("--plan et --executer-plan sont incompatibles")
+    if (args.sortie_plan or args.format != "texte") and not args.plan:
+        parser.error("--format et --sortie-plan nécessitent --plan")
+    options_medias = (args.largeur_max, args.qualite, args.cache_medias)
+    if (any(option is not None for option in options_medias) or args.sans_webp) and not args.optimiser_medias:
+        parser.error("--largeur-max, --qualite, --sans-webp et --cache-medias nécessitent --optimiser-medias")
+    if args.largeur_max is not None and args.largeur_max < 1:
+        parser.error("--largeur-max doit être supérieur ou égal à 1")
+    if args.qualite is not None and not 1 <= args.qualite <= 95:
+        parser.error("--qualite doit être comprise entre 1 et 95")
+    if args.optimiser_medias and Image is None:
+        parser.error("--optimiser-medias nécessite Pillow (pip install Pillow)")
+    if args.mutualiser_medias and args.sync:
+        # La mutualisation supprime des originaux et réécrit les articles : chaque
+        # synchronisation suivante recopierait tout et réécrirait à nouveau
+        parser.error("--mutualiser-medias est incompatible avec --sync")
+    if args.index_doublons and (args.plan or args.executer_plan):
+        parser.error("--index-doublons est incompatible avec --plan et --executer-plan")
+    
+    if args.index_doublons:
+        _indexer_doublons(args.repertoire_base, args.index_doublons, args.jobs if args.jobs > 1 else None)
+        sys.exit(0)
+    
+    if args.plan:
+        from planification import afficher_plan, construire_plan, ecrire_plan
+        try:
+            plan = construire_plan(args.repertoire_base, args.fichier_csv)
+        except FileNotFoundError:
+            print(f"❌ Erreur : Le fichier {args.fichier_csv} n'a pas été trouvé.")
+            sys.exit(1)
+        if args.format == "json":
+            print(json.dumps(plan, ensure_ascii=False, indent=2))
+        else:
+            afficher_plan(plan)
+        if args.sortie_plan:
+            ecrire_plan(plan, args.sortie_plan)
+        sys.exit(0 if plan['valide'] else 1)
+    
+    plan = None
+    if args.executer_plan:
+        from planification import charger_plan
+        try:
+            plan = charger_plan(args.executer_plan)
+        except (OSError, ValueError) as e:
+            print(f"❌ Erreur : plan {args.executer_plan} inutilisable : {e}")
+            sys.exit(1)
+    
+    medias = None
+    if args.optimiser_medias:
+        medias = {
+            'largeur_max': args.largeur_max or LARGEUR_MAX,
+            'qualite': args.qualite or QUALITE,
+            'webp': not args.sans_webp,
+            # L'encodage est limité par le CPU : un processus par cœur sauf --jobs explicite
+            'jobs': args.jobs if args.jobs > 1 else None,
+            'cache': args.cache_medias or DOSSIER_CACHE,
+        }
+    
+    synchro = None
+    if args.sync:
+        synchro = {'hash': args.hash, 'orphelins': args.supprimer_orphelins}
+        if medias is not None:
+            # Les images optimisées par une exécution précédente sont à jour
+            synchro['derive'] = cle_parametres(medias['largeur_max'], medias['qualite'])
+    
+    mutualisation = None
+    if args.mutualiser_medias:
+        mutualisation = {'dossier': args.mutualiser_medias, 'jobs': args.jobs if args.jobs > 1 else None}
+    
+    evenements = EventLog('tri_wordpress', args.evenements, args.prometheus)
+    # Événements sur la sortie standard : le rapport lisible passe sur la sortie d'erreur
+    sortie = contextlib.redirect_stdout(sys.stderr) if evenements.to_stdout else contextlib.nullcontext()
+    try:
+        with sortie:
+            trier_contenu_wordpress(
+                repertoire_base=args.repertoire_base,
+                fichier_csv=args.fichier_csv,
+                mode_simulation=args.simulation,
+                jobs=args.jobs,
+                utiliser_processus=args.processus,
+                synchro=synchro,
+                plan=plan,
+                liaison=args.mode_liaison,
+                evenements=evenements,
+                silencieux=args.silencieux,
+                medias=medias,
+                mutualisation=mutualisation
+            )
+    finally:
+        evenements.close()
 
 
 if __name__ == "__main__":
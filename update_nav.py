@@ -4,39 +4,60 @@ Script pour mettre à jour automatiquement la section 'nav' du fichier mkdocs.ym
 en parcourant l'arborescence du dossier 'docs'.
 """
 
+import argparse
+import contextlib
+import hashlib
+import json
 import os
 import re
+import shutil
+import sys
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 
-def extract_title_from_markdown(file_path: Path) -> Optional[str]:
+from markdown_header import EXTRACTOR_ID, read_markdown_header
+from run_events import EventLog, throughput
+from title_cache import DEFAULT_CACHE_NAME, TitleCache
+
+# Nombre de threads par défaut pour le parcours et l'extraction des titres
+DEFAULT_WORKERS = 8
+
+# Clé 'nav' de premier niveau dans le texte de mkdocs.yml
+NAV_KEY = re.compile(r'^nav\s*:', re.M)
+
+# Mapper certains noms de dossiers vers des titres plus appropriés
+SECTION_TITLE_MAPPING = {
+    'How-To': 'Guides',
+    'how-to': 'Guides',
+    'Reference': 'Référence',
+    'Explanation': 'Explications',
+    'Tutorials': 'Tutoriels',
+    'Faq': 'FAQ',
+    'Cloudpi': 'Cloud Pi Gen 2',
+    'Kubepi': 'Kube Pi',
+    'Cpin': 'Cloud Pi Native'
+}
+
+
+def extract_title_from_markdown(file_path: Path, cache: Optional[TitleCache] = None) -> Optional[str]:
     """
     Extrait le titre d'un fichier Markdown depuis la première ligne commençant par #
     ou depuis les métadonnées YAML front matter.
+    
+    Si un cache est fourni, le fichier n'est relu que s'il a changé.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Vérifier s'il y a du front matter YAML
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                try:
-                    front_matter = yaml.safe_load(parts[1])
-                    if isinstance(front_matter, dict) and 'title' in front_matter:
-                        return front_matter['title']
-                except yaml.YAMLError:
-                    pass
+        if cache is not None:
+            title, _ = cache.lookup(file_path, read_markdown_header, EXTRACTOR_ID)
+        else:
+            title, _ = read_markdown_header(file_path)
         
-        # Chercher le premier titre Markdown
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('# '):
-                return line[2:].strip()
+        if title is not None:
+            return title
         
         # Si aucun titre trouvé, utiliser le nom du fichier
         return file_path.stem.replace('-', ' ').replace('_', ' ').title()
@@ -46,96 +67,304 @@ def extract_title_from_markdown(file_path: Path) -> Optional[str]:
         return file_path.stem.replace('-', ' ').replace('_', ' ').title()
 
 
-def create_nav_item(file_path: Path, docs_root: Path) -> Dict[str, str]:
+def create_nav_item(file_path: Path, docs_root: Path, cache: Optional[TitleCache] = None,
+                    title: Optional[str] = None) -> Dict[str, str]:
     """
     Crée un élément de navigation pour un fichier Markdown.
+    Le titre est extrait du fichier s'il n'est pas fourni.
     """
-    title = extract_title_from_markdown(file_path)
+    if title is None:
+        title = extract_title_from_markdown(file_path, cache)
     relative_path = file_path.relative_to(docs_root)
     
     return {title: str(relative_path).replace('\\', '/')}
 
 
-def scan_directory(directory: Path, docs_root: Path) -> List[Any]:
+def section_title_for(directory_name: str) -> str:
     """
-    Parcourt récursivement un répertoire et génère la structure de navigation.
+    Retourne le titre de section correspondant à un nom de dossier.
     """
-    nav_items = []
+    # Utiliser le nom du répertoire comme titre de section
+    section_title = directory_name.replace('-', ' ').replace('_', ' ').title()
     
-    # Traiter d'abord les fichiers dans le répertoire courant
-    md_files = []
-    subdirs = []
+    # Mapper certains noms de dossiers vers des titres plus appropriés
+    return SECTION_TITLE_MAPPING.get(section_title, section_title)
+
+
+class DirectoryNode:
+    """
+    Contenu d'un répertoire de docs : fichiers Markdown et sous-répertoires,
+    triés par nom comme le faisait sorted(directory.iterdir()).
+    """
     
-    for item in sorted(directory.iterdir()):
-        if item.is_file() and item.suffix == '.md':
-            md_files.append(item)
-        elif item.is_dir() and not item.name.startswith('.'):
-            subdirs.append(item)
+    def __init__(self, path: Path):
+        self.path = path
+        self.md_files: List[Path] = []
+        self.subdirs: List['DirectoryNode'] = []
+    
+    def iter_md_files(self):
+        """Parcourt tous les fichiers Markdown du sous-arbre."""
+        yield from self.md_files
+        for subdir in self.subdirs:
+            yield from subdir.iter_md_files()
+
+
+def _scan_entries(node: DirectoryNode) -> DirectoryNode:
+    """
+    Lit un répertoire avec os.scandir : le type des entrées (d_type) est
+    fourni par le système, sans appel stat supplémentaire par entrée.
+    """
+    with os.scandir(node.path) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_file() and os.path.splitext(entry.name)[1] == '.md':
+                node.md_files.append(node.path / entry.name)
+            elif entry.is_dir() and not entry.name.startswith('.'):
+                node.subdirs.append(DirectoryNode(node.path / entry.name))
+    return node
+
+
+def walk_directory(directory: Path, executor: Optional[Executor] = None) -> DirectoryNode:
+    """
+    Construit l'arbre des répertoires de docs.
+    
+    Avec un executor, tous les répertoires d'un même niveau sont lus en
+    parallèle, ce qui recouvre les allers-retours réseau (NFS).
+    """
+    root = DirectoryNode(directory)
+    level = [root]
+    while level:
+        if executor is not None and len(level) > 1:
+            scanned = list(executor.map(_scan_entries, level))
+        else:
+            scanned = [_scan_entries(node) for node in level]
+        level = [subdir for node in scanned for subdir in node.subdirs]
+    return root
+
+
+def extract_titles(files: List[Path], cache: Optional[TitleCache] = None,
+                   executor: Optional[Executor] = None) -> Dict[Path, str]:
+    """
+    Extrait les titres d'une liste de fichiers, en parallèle si un executor est fourni.
+    """
+    if executor is not None:
+        titles = executor.map(lambda file_path: extract_title_from_markdown(file_path, cache), files)
+    else:
+        titles = (extract_title_from_markdown(file_path, cache) for file_path in files)
+    return dict(zip(files, titles))
+
+
+def build_nav(node: DirectoryNode, docs_root: Path, titles: Dict[Path, str]) -> List[Any]:
+    """
+    Génère la structure de navigation d'un arbre de répertoires dont les
+    titres ont déjà été extraits.
+    """
+    nav_items = []
     
     # Ajouter les fichiers Markdown du répertoire courant
-    for md_file in md_files:
-        nav_items.append(create_nav_item(md_file, docs_root))
+    for md_file in node.md_files:
+        nav_items.append(create_nav_item(md_file, docs_root, title=titles[md_file]))
     
     # Traiter les sous-répertoires
-    for subdir in subdirs:
-        subdir_nav = scan_directory(subdir, docs_root)
+    for subdir in node.subdirs:
+        subdir_nav = build_nav(subdir, docs_root, titles)
         if subdir_nav:
-            # Utiliser le nom du répertoire comme titre de section
-            section_title = subdir.name.replace('-', ' ').replace('_', ' ').title()
-            
-            # Mapper certains noms de dossiers vers des titres plus appropriés
-            title_mapping = {
-                'How-To': 'Guides',
-                'how-to': 'Guides',
-                'Reference': 'Référence',
-                'Explanation': 'Explications',
-                'Tutorials': 'Tutoriels',
-                'Faq': 'FAQ',
-                'Cloudpi': 'Cloud Pi Gen 2',
-                'Kubepi': 'Kube Pi',
-                'Cpin': 'Cloud Pi Native'
-            }
-            
-            section_title = title_mapping.get(section_title, section_title)
-            nav_items.append({section_title: subdir_nav})
+            nav_items.append({section_title_for(subdir.path.name): subdir_nav})
     
     return nav_items
 
 
-def update_mkdocs_nav(mkdocs_path: Path, docs_dir: Path):
+def scan_directory(directory: Path, docs_root: Path, cache: Optional[TitleCache] = None,
+                   workers: int = 1, stats: Optional[Dict[str, Any]] = None) -> List[Any]:
     """
-    Met à jour la section 'nav' du fichier mkdocs.yml.
+    Parcourt récursivement un répertoire et génère la structure de navigation.
+    
+    Avec workers > 1, la lecture des répertoires et l'extraction des titres
+    sont réparties sur un pool de threads. Si stats est fourni, il reçoit le
+    nombre de fichiers Markdown et la durée de chaque étape (en secondes).
     """
-    # Lire le fichier mkdocs.yml existant
-    with open(mkdocs_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    with executor or contextlib.nullcontext():
+        tree = walk_directory(directory, executor)
+        walked = time.perf_counter()
+        files = list(tree.iter_md_files())
+        titles = extract_titles(files, cache, executor)
     
-    # Parser le YAML
-    mkdocs_config = yaml.safe_load(content)
+    if stats is not None:
+        stats['fichiers'] = len(files)
+        stats['parcours_s'] = round(walked - start, 4)
+        stats['titres_s'] = round(time.perf_counter() - walked, 4)
+    return build_nav(tree, docs_root, titles)
+
+
+def update_mkdocs_nav(mkdocs_path: Path, docs_dir: Path, cache: Optional[TitleCache] = None,
+                      workers: int = 1, quiet: bool = False,
+                      backup_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Met à jour la section 'nav' du fichier mkdocs.yml.
     
+    Retourne les statistiques de la mise à jour (voir scan_directory), avec la
+    durée d'écriture de mkdocs.yml et 'modifie' (False si la navigation n'a
+    pas changé : le fichier et sa sauvegarde ne sont alors pas réécrits).
+    """
+    stats: Dict[str, Any] = {}
     # Générer la nouvelle navigation
-    new_nav = scan_directory(docs_dir, docs_dir)
+    new_nav = scan_directory(docs_dir, docs_dir, cache, workers, stats)
     
-    # Mettre à jour la configuration
-    mkdocs_config['nav'] = new_nav
+    start = time.perf_counter()
+    stats['modifie'] = write_nav(mkdocs_path, new_nav, backup_path)
+    stats['ecriture_s'] = round(time.perf_counter() - start, 4)
     
-    # Sauvegarder avec une mise en forme correcte
-    with open(mkdocs_path, 'w', encoding='utf-8') as f:
-        # Écrire le YAML avec des paramètres de formatage appropriés
-        yaml.dump(mkdocs_config, f, 
-                 default_flow_style=False, 
-                 allow_unicode=True, 
-                 sort_keys=False,
-                 width=120,
-                 indent=2)
+    if not quiet:
+        if stats['modifie']:
+            print(f"✅ Navigation mise à jour dans {mkdocs_path}")
+        else:
+            print(f"✅ Navigation inchangée, {mkdocs_path} n'est pas réécrit")
+    return stats
+
+
+def render_nav(nav: List[Any]) -> str:
+    """
+    Bloc 'nav:' de mkdocs.yml, dans la mise en forme historique de write_nav.
+    """
+    return yaml.dump({'nav': nav},
+                     default_flow_style=False,
+                     allow_unicode=True,
+                     sort_keys=False,
+                     width=120,
+                     indent=2)
+
+
+def nav_digest(nav: Any) -> str:
+    """
+    Empreinte d'une navigation, indépendante de la mise en forme du YAML.
+    """
+    serialized = json.dumps(nav, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def find_nav_block(content: str) -> Optional[Tuple[int, int]]:
+    """
+    Position (début, fin) du bloc 'nav:' de premier niveau dans le texte de
+    mkdocs.yml, None s'il est absent.
     
-    print(f"✅ Navigation mise à jour dans {mkdocs_path}")
+    Le bloc s'étend jusqu'à la dernière ligne indentée ou élément de liste
+    ('- ') avant la clé de premier niveau suivante. Un commentaire en
+    colonne 0 ne ferme pas le bloc : il en fait partie s'il est suivi d'un
+    élément de la navigation, sinon (comme les lignes vides qui suivent le
+    bloc) il appartient à la clé suivante.
+    """
+    match = NAV_KEY.search(content)
+    if match is None:
+        return None
+    end = content.find('\n', match.end())
+    if end < 0:
+        return match.start(), len(content)
+    end += 1
+    position = end
+    while position < len(content):
+        line_end = content.find('\n', position)
+        line_end = len(content) if line_end < 0 else line_end + 1
+        line = content[position:line_end]
+        if line.strip() and not line.startswith('#'):
+            if not (line[0] in ' \t' or line.startswith('- ') or line.rstrip() == '-'):
+                break
+            end = line_end
+        position = line_end
+    return match.start(), end
+
+
+def write_nav(mkdocs_path: Path, nav: List[Any], backup_path: Optional[Path] = None) -> bool:
+    """
+    Remplace la section 'nav' du fichier mkdocs.yml par la navigation fournie.
+    
+    Seul le bloc 'nav:' est réécrit : le reste du fichier (commentaires,
+    mise en forme, balises YAML propres à MkDocs) est conservé à l'identique.
+    Si la navigation actuelle a la même empreinte que la nouvelle, rien n'est
+    écrit (ni mkdocs.yml, ni la sauvegarde) : sa date de modification ne
+    déclenche pas de nouvelle génération. Sinon, la sauvegarde éventuelle est
+    écrite puis mkdocs.yml est remplacé atomiquement (fichier temporaire
+    renommé).
+    
+    Retourne True si mkdocs.yml a été modifié.
+    """
+    # newline='' : les fins de ligne du fichier (\r\n) sont conservées
+    with open(mkdocs_path, 'r', encoding='utf-8', newline='') as f:
+        content = f.read()
+    
+    block = find_nav_block(content)
+    if block is not None:
+        try:
+            current = yaml.safe_load(content[block[0]:block[1]]) or {}
+        except yaml.YAMLError:
+            current = {}
+        if isinstance(current, dict) and 'nav' in current \
+                and nav_digest(current['nav']) == nav_digest(nav):
+            return False
+    
+    rendered = render_nav(nav)
+    if '\r\n' in content:
+        rendered = rendered.replace('\n', '\r\n')
+    if block is not None:
+        new_content = content[:block[0]] + rendered + content[block[1]:]
+    else:
+        separator = '' if not content or content.endswith('\n') else '\n'
+        new_content = content + separator + rendered
+    
+    if backup_path is not None:
+        with open(backup_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+    
+    tmp_path = mkdocs_path.with_name(mkdocs_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(new_content)
+    shutil.copymode(mkdocs_path, tmp_path)
+    os.replace(tmp_path, mkdocs_path)
+    return True
 
 
 def main():
     """
     Fonction principale du script.
     """
+    parser = argparse.ArgumentParser(description="Met à jour la section 'nav' du fichier mkdocs.yml")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Relit tous les fichiers sans utiliser le cache des titres")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Threads pour le parcours et l'extraction des titres (défaut: {DEFAULT_WORKERS}, 1 = séquentiel)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Surveille le dossier docs et met à jour la navigation à chaque modification")
+    parser.add_argument("--debounce", type=float, default=1.0,
+                        help="Mode --watch : délai sans modification avant d'écrire mkdocs.yml, en secondes (défaut: 1.0)")
+    parser.add_argument("--poll-interval", type=float, default=2.0,
+                        help="Mode --watch : intervalle de scrutation sans inotify, en secondes (défaut: 2.0)")
+    parser.add_argument("--polling", action="store_true",
+                        help="Mode --watch : force la scrutation périodique au lieu d'inotify")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="N'affiche que les erreurs")
+    parser.add_argument("--events", metavar="FICHIER",
+                        help="Écrit un événement JSON par ligne dans ce fichier "
+                             "('-' : sortie standard, les messages passent alors sur la sortie d'erreur)")
+    parser.add_argument("--prometheus", metavar="FICHIER",
+                        help="Écrit les métriques au format Prometheus (collecteur textfile de node_exporter)")
+    args = parser.parse_args()
+    
+    events = EventLog('update_nav', args.events, args.prometheus)
+    # Événements sur la sortie standard : les messages passent sur la sortie d'erreur
+    output = contextlib.redirect_stdout(sys.stderr) if events.to_stdout else contextlib.nullcontext()
+    try:
+        with output:
+            run(args, events)
+    finally:
+        events.close()
+
+
+def run(args: argparse.Namespace, events: EventLog):
+    """
+    Détecte mkdocs.yml et met à jour la navigation (une fois ou en continu).
+    """
+    info = (lambda *_: None) if args.quiet else print
+    
     # Détecter automatiquement les chemins
     script_dir = Path(__file__).parent
     
@@ -157,6 +386,7 @@ def main():
         print("Emplacements vérifiés:")
         for path in possible_configs:
             print(f"  - {path}")
+        events.emit('erreur', message="mkdocs.yml non trouvé")
         return
     
     # Déterminer le répertoire docs
@@ -164,29 +394,59 @@ def main():
     
     if not docs_dir.exists():
         print(f"❌ Répertoire docs non trouvé: {docs_dir}")
+        events.emit('erreur', message=f"répertoire docs non trouvé : {docs_dir}")
         return
     
-    print(f"📁 Répertoire docs: {docs_dir}")
-    print(f"📄 Fichier mkdocs.yml: {mkdocs_path}")
+    info(f"📁 Répertoire docs: {docs_dir}")
+    info(f"📄 Fichier mkdocs.yml: {mkdocs_path}")
     
-    # Créer une sauvegarde
+    # Sauvegarde écrite seulement si la navigation change
     backup_path = mkdocs_path.with_suffix('.yml.backup')
-    with open(mkdocs_path, 'r', encoding='utf-8') as src, \
-         open(backup_path, 'w', encoding='utf-8') as dst:
-        dst.write(src.read())
-    print(f"💾 Sauvegarde créée: {backup_path}")
+    
+    # Cache des titres, placé à côté de mkdocs.yml
+    cache = None if args.no_cache else TitleCache(mkdocs_path.parent / DEFAULT_CACHE_NAME)
+    
+    if args.watch:
+        from nav_watch import watch_nav
+        watch_nav(mkdocs_path, docs_dir, cache, args.workers,
+                  debounce=args.debounce, poll_interval=args.poll_interval, force_polling=args.polling,
+                  event_log=events, quiet=args.quiet, backup_path=backup_path)
+        return
     
     # Mettre à jour la navigation
+    events.emit('debut', docs_dir=str(docs_dir), mkdocs=str(mkdocs_path), workers=args.workers,
+                cache=cache is not None)
+    start = time.perf_counter()
     try:
-        update_mkdocs_nav(mkdocs_path, docs_dir)
-        print("✅ Navigation mise à jour avec succès!")
+        stats = update_mkdocs_nav(mkdocs_path, docs_dir, cache, args.workers, quiet=args.quiet,
+                                  backup_path=backup_path)
+        if stats['modifie']:
+            info(f"💾 Sauvegarde créée: {backup_path}")
+        if cache is not None:
+            cache.prune()
+            cache.save()
+            stats['cache_hits'] = cache.hits
+            stats['cache_misses'] = cache.misses
+            info(f"🗃️  Cache des titres: {cache.hits} fichier(s) inchangé(s), {cache.misses} relu(s)")
+        info("✅ Navigation mise à jour avec succès!" if stats['modifie'] else "✅ Navigation déjà à jour")
+        duration = time.perf_counter() - start
+        events.emit('fin', statut='reussite', duree_s=round(duration, 3),
+                    fichiers_par_s=throughput(stats['fichiers'], duration), **stats)
+        events.write_prometheus([
+            ('succes', "1 si la dernière mise à jour a réussi", 1),
+            ('fichiers', "Fichiers Markdown parcourus", stats['fichiers']),
+            ('modifie', "1 si mkdocs.yml a été réécrit", int(stats['modifie'])),
+            ('duree_secondes', "Durée de la dernière mise à jour", round(duration, 3)),
+            ('cache_titres', "Titres lus depuis le cache ou relus",
+             {(('resultat', 'hit'),): stats.get('cache_hits', 0),
+              (('resultat', 'miss'),): stats.get('cache_misses', 0)}),
+        ])
     except Exception as e:
         print(f"❌ Erreur lors de la mise à jour: {e}")
-        # Restaurer la sauvegarde en cas d'erreur
-        with open(backup_path, 'r', encoding='utf-8') as src, \
-             open(mkdocs_path, 'w', encoding='utf-8') as dst:
-            dst.write(src.read())
-        print("🔄 Sauvegarde restaurée")
+        events.emit('fin', statut='echec', duree_s=round(time.perf_counter() - start, 3), message=str(e))
+        events.write_prometheus([('succes', "1 si la dernière mise à jour a réussi", 0)])
+        # mkdocs.yml est remplacé atomiquement : jamais laissé à moitié écrit
+        print(f"ℹ️  {mkdocs_path} est intact (écriture atomique)")
 
 
 if __name__ == "__main__":